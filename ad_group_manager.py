@@ -9,13 +9,36 @@ Provides complete ad group lifecycle management including:
 """
 
 from google.ads.googleads.client import GoogleAdsClient
-from typing import Optional, List, Dict, Any
+from google.protobuf import field_mask_pb2
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from logger import get_logger
+import asyncio
+import proto
 
 logger = get_logger(__name__)
 
+# Bulk status updates send at most this many operations per mutate request
+MUTATE_CHUNK_SIZE = 1000
+MUTATE_MAX_CONCURRENCY = 8
+
+
+def _enum_name(message: Any, field_name: str) -> str:
+    """
+    Resolve an enum field of a raw protobuf message to its value name.
+
+    Args:
+        message: Raw protobuf message
+        field_name: Enum field name
+
+    Returns:
+        Enum value name ("UNKNOWN" for values newer than this client)
+    """
+    field = message.DESCRIPTOR.fields_by_name[field_name]
+    value = field.enum_type.values_by_number.get(getattr(message, field_name))
+    return value.name if value is not None else "UNKNOWN"
+
 
 # ============================================================================
 # Enums and Data Classes
@@ -61,14 +84,79 @@ class AdGroupConfig:
 class AdGroupManager:
     """Manages Google Ads ad groups."""
 
+    _STATUS_FIELD_MASK = field_mask_pb2.FieldMask(paths=["status"])
+
     def __init__(self, client: GoogleAdsClient):
         """
         Initialize the ad group manager.
 
+        Read methods decode result rows as raw protobuf messages whether or
+        not the client uses proto-plus, so large listings skip proto-plus
+        field wrapping.
+
         Args:
             client: Authenticated Google Ads client
         """
         self.client = client
+        self._services: Dict[str, Any] = {}
+        # Async service clients with the event loop their channel is bound to
+        self._async_services: Dict[str, Tuple[asyncio.AbstractEventLoop, Any]] = {}
+
+    def _service(self, name: str) -> Any:
+        """
+        Return the named service client, creating it on first use.
+
+        Args:
+            name: Service name, e.g. "AdGroupService"
+
+        Returns:
+            Service client
+        """
+        service = self._services.get(name)
+        if service is None:
+            service = self._services[name] = self.client.get_service(name)
+        return service
+
+    def _async_service(self, name: str) -> Any:
+        """
+        Return the named async service client for the running event loop.
+
+        An async gRPC channel only works on the loop that created it, so the
+        client is reused across calls on one loop and recreated for a new one.
+
+        Args:
+            name: Service name, e.g. "GoogleAdsService"
+
+        Returns:
+            Async service client
+        """
+        loop = asyncio.get_running_loop()
+        cached = self._async_services.get(name)
+        if cached is not None and cached[0] is loop:
+            return cached[1]
+
+        service = self.client.get_service(name, is_async=True)
+        self._async_services[name] = (loop, service)
+        return service
+
+    def _search_rows(self, customer_id: str, query: str) -> Iterator[Any]:
+        """
+        Run a GAQL query and yield its rows as raw protobuf messages.
+
+        Args:
+            customer_id: Customer ID
+            query: GAQL query
+
+        Yields:
+            GoogleAdsRow protobuf messages
+        """
+        ga_service = self._service("GoogleAdsService")
+        response = ga_service.search(customer_id=customer_id, query=query)
+
+        for page in response.pages:
+            if isinstance(page, proto.Message):
+                page = type(page).pb(page)
+            yield from page.results
 
     # ========================================================================
     # Ad Group Creation
@@ -89,8 +177,8 @@ class AdGroupManager:
         Returns:
             Created ad group details
         """
-        ad_group_service = self.client.get_service("AdGroupService")
-        campaign_service = self.client.get_service("CampaignService")
+        ad_group_service = self._service("AdGroupService")
+        campaign_service = self._service("CampaignService")
 
         # Create operation
         ad_group_operation = self.client.get_type("AdGroupOperation")
@@ -159,7 +247,7 @@ class AdGroupManager:
         Returns:
             Operation result
         """
-        ad_group_service = self.client.get_service("AdGroupService")
+        ad_group_service = self._service("AdGroupService")
 
         ad_group_operation = self.client.get_type("AdGroupOperation")
         ad_group = ad_group_operation.update
@@ -305,15 +393,14 @@ class AdGroupManager:
             WHERE ad_group.id = {ad_group_id}
         """
 
-        ga_service = self.client.get_service("GoogleAdsService")
-        response = ga_service.search(customer_id=customer_id, query=query)
+        response = self._search_rows(customer_id, query)
 
         for row in response:
             return {
                 "id": str(row.ad_group.id),
                 "name": row.ad_group.name,
-                "status": row.ad_group.status.name,
-                "type": row.ad_group.type_.name if row.ad_group.type_ else "UNSPECIFIED",
+                "status": _enum_name(row.ad_group, "status"),
+                "type": _enum_name(row.ad_group, "type_"),
                 "campaign": {
                     "id": str(row.campaign.id),
                     "name": row.campaign.name
@@ -378,16 +465,15 @@ class AdGroupManager:
 
         query += " ORDER BY ad_group.name"
 
-        ga_service = self.client.get_service("GoogleAdsService")
-        response = ga_service.search(customer_id=customer_id, query=query)
+        response = self._search_rows(customer_id, query)
 
         ad_groups = []
         for row in response:
             ad_groups.append({
                 "id": str(row.ad_group.id),
                 "name": row.ad_group.name,
-                "status": row.ad_group.status.name,
-                "type": row.ad_group.type_.name if row.ad_group.type_ else "UNSPECIFIED",
+                "status": _enum_name(row.ad_group, "status"),
+                "type": _enum_name(row.ad_group, "type_"),
                 "campaign_id": str(row.campaign.id),
                 "campaign_name": row.campaign.name,
                 "cpc_bid": row.ad_group.cpc_bid_micros / 1_000_000 if row.ad_group.cpc_bid_micros else None,
@@ -444,8 +530,7 @@ class AdGroupManager:
             AND segments.date DURING {date_range}
         """
 
-        ga_service = self.client.get_service("GoogleAdsService")
-        response = ga_service.search(customer_id=customer_id, query=query)
+        response = self._search_rows(customer_id, query)
 
         # Aggregate metrics
         total_metrics = {
@@ -508,55 +593,192 @@ class AdGroupManager:
     # Bulk Operations
     # ========================================================================
 
-    def bulk_update_ad_group_status(
+    def _status_update_request(
         self,
         customer_id: str,
         ad_group_ids: List[str],
         status: AdGroupStatus
-    ) -> Dict[str, Any]:
+    ) -> Any:
         """
-        Update status for multiple ad groups at once.
+        Build a partial-failure MutateGoogleAdsRequest setting one status.
 
         Args:
             customer_id: Customer ID
-            ad_group_ids: List of ad group IDs
+            ad_group_ids: Ad group IDs to update
             status: New status for all ad groups
 
         Returns:
-            Bulk operation result
+            MutateGoogleAdsRequest with one ad group update per ID
         """
-        ad_group_service = self.client.get_service("AdGroupService")
+        new_status = getattr(self.client.enums.AdGroupStatusEnum, status.value)
 
-        operations = []
+        request = self.client.get_type("MutateGoogleAdsRequest")
+        request.customer_id = customer_id
+        request.partial_failure = True
 
         for ad_group_id in ad_group_ids:
-            ad_group_operation = self.client.get_type("AdGroupOperation")
+            mutate_operation = self.client.get_type("MutateOperation")
+            ad_group_operation = mutate_operation.ad_group_operation
             ad_group = ad_group_operation.update
 
-            ad_group.resource_name = ad_group_service.ad_group_path(customer_id, ad_group_id)
-            ad_group.status = self.client.enums.AdGroupStatusEnum[status.value]
+            ad_group.resource_name = f"customers/{customer_id}/adGroups/{ad_group_id}"
+            ad_group.status = new_status
+            self.client.copy_from(ad_group_operation.update_mask, self._STATUS_FIELD_MASK)
 
-            self.client.copy_from(
-                ad_group_operation.update_mask,
-                self.client.get_type("FieldMask", version="v17")(paths=["status"])
-            )
+            request.mutate_operations.append(mutate_operation)
 
-            operations.append(ad_group_operation)
+        return request
 
-        # Execute bulk update
-        response = ad_group_service.mutate_ad_groups(
-            customer_id=customer_id,
-            operations=operations
-        )
+    def _failed_ad_groups(
+        self,
+        response: Any,
+        ad_group_ids: List[str]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Decode the partial failure error of a status update response.
+
+        Args:
+            response: MutateGoogleAdsResponse from _status_update_request
+            ad_group_ids: Ad group IDs of the request, in operation order
 
-        logger.info(f"Bulk updated {len(ad_group_ids)} ad groups to {status.value}")
+        Returns:
+            Tuple of (failed ad group IDs, error messages)
+        """
+        failed_ad_group_ids = []
+        failure_messages = []
+        partial_failure_error = response.partial_failure_error
+
+        if partial_failure_error and partial_failure_error.code:
+            failure_type = type(self.client.get_type("GoogleAdsFailure"))
+            for detail in partial_failure_error.details:
+                failure = failure_type.deserialize(detail.value)
+                for error in failure.errors:
+                    path = error.location.field_path_elements
+                    if path and path[0].index < len(ad_group_ids):
+                        failed_ad_group_ids.append(ad_group_ids[path[0].index])
+                    failure_messages.append(error.message)
+
+        return failed_ad_group_ids, failure_messages
+
+    @staticmethod
+    def _bulk_status_result(
+        ad_group_ids: List[str],
+        status: AdGroupStatus,
+        failed_ad_group_ids: List[str],
+        failure_messages: List[str]
+    ) -> Dict[str, Any]:
+        """Summarize a bulk status update."""
+        updated = len(ad_group_ids) - len(set(failed_ad_group_ids))
+
+        logger.info(
+            f"Bulk updated {updated} of {len(ad_group_ids)} ad groups to {status.value}"
+        )
 
         return {
-            "ad_groups_updated": len(ad_group_ids),
+            "ad_groups_updated": updated,
             "new_status": status.value,
-            "message": f"Successfully updated {len(ad_group_ids)} ad groups"
+            "failed_ad_group_ids": failed_ad_group_ids,
+            "failure_messages": failure_messages,
+            "message": f"Successfully updated {updated} ad groups"
         }
 
+    def bulk_update_ad_group_status(
+        self,
+        customer_id: str,
+        ad_group_ids: List[str],
+        status: AdGroupStatus
+    ) -> Dict[str, Any]:
+        """
+        Update status for multiple ad groups at once.
+
+        All updates go out in a single GoogleAdsService.mutate request with
+        partial failure enabled, so one invalid ad group does not roll back
+        the others.
+
+        Args:
+            customer_id: Customer ID
+            ad_group_ids: List of ad group IDs
+            status: New status for all ad groups
+
+        Returns:
+            Bulk operation result, with 'failed_ad_group_ids' and
+            'failure_messages' listing any ad groups that were not updated
+        """
+        ga_service = self._service("GoogleAdsService")
+        request = self._status_update_request(customer_id, ad_group_ids, status)
+
+        # Execute bulk update
+        response = ga_service.mutate(request=request)
+
+        failed_ad_group_ids, failure_messages = self._failed_ad_groups(response, ad_group_ids)
+        return self._bulk_status_result(ad_group_ids, status, failed_ad_group_ids, failure_messages)
+
+    async def bulk_update_ad_group_status_async(
+        self,
+        customer_id: str,
+        ad_group_ids: List[str],
+        status: AdGroupStatus,
+        chunk_size: int = MUTATE_CHUNK_SIZE,
+        max_concurrency: int = MUTATE_MAX_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """
+        Update status for multiple ad groups over the async gRPC client.
+
+        IDs are split into shards of at most chunk_size, and the shards are
+        mutated concurrently on the event loop. A shard that fails as a whole
+        marks all of its ad groups as failed; the others still apply.
+
+        Args:
+            customer_id: Customer ID
+            ad_group_ids: List of ad group IDs
+            status: New status for all ad groups
+            chunk_size: Maximum operations per mutate request
+            max_concurrency: Maximum mutate requests in flight at once
+
+        Returns:
+            Bulk operation result, as for bulk_update_ad_group_status
+
+        Raises:
+            Exception: The first shard error, when every shard failed
+        """
+        shards = [
+            ad_group_ids[start:start + chunk_size]
+            for start in range(0, len(ad_group_ids), chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        ga_service = self._async_service("GoogleAdsService")
+
+        async def mutate(shard: List[str]) -> Any:
+            request = self._status_update_request(customer_id, shard, status)
+            async with semaphore:
+                return await ga_service.mutate(request=request)
+
+        responses = await asyncio.gather(
+            *(mutate(shard) for shard in shards),
+            return_exceptions=True
+        )
+
+        errors = [response for response in responses if isinstance(response, Exception)]
+        if errors and len(errors) == len(shards):
+            raise errors[0]
+
+        failed_ad_group_ids = []
+        failure_messages = []
+
+        for shard, response in zip(shards, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Ad group status shard of {len(shard)} failed: {response}")
+                failed_ad_group_ids.extend(shard)
+                failure_messages.append(str(response))
+                continue
+
+            shard_failed, shard_messages = self._failed_ad_groups(response, shard)
+            failed_ad_group_ids.extend(shard_failed)
+            failure_messages.extend(shard_messages)
+
+        return self._bulk_status_result(ad_group_ids, status, failed_ad_group_ids, failure_messages)
+
 
 def create_ad_group_manager(client: GoogleAdsClient) -> AdGroupManager:
     """
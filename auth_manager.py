@@ -11,7 +11,8 @@ Enhanced authentication handling with:
 
 import json
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Iterator, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from google.ads.googleads.client import GoogleAdsClient
@@ -54,6 +55,9 @@ class TokenManager:
         self._credentials: Optional[Credentials] = None
         self._last_refresh: Optional[datetime] = None
 
+        # Tool calls run on worker threads; only one of them refreshes
+        self._lock = threading.Lock()
+
     def get_credentials(self, force_refresh: bool = False) -> Credentials:
         """
         Get valid credentials, refreshing if necessary.
@@ -67,37 +71,38 @@ class TokenManager:
         Raises:
             AuthenticationError: If token refresh fails
         """
-        # Initialize credentials if not done
-        if self._credentials is None:
-            self._credentials = Credentials(
-                token=None,
-                refresh_token=self.refresh_token,
-                token_uri=self.token_uri,
-                client_id=self.client_id,
-                client_secret=self.client_secret
+        with self._lock:
+            # Initialize credentials if not done
+            if self._credentials is None:
+                self._credentials = Credentials(
+                    token=None,
+                    refresh_token=self.refresh_token,
+                    token_uri=self.token_uri,
+                    client_id=self.client_id,
+                    client_secret=self.client_secret
+                )
+
+            # Check if refresh is needed
+            needs_refresh = (
+                force_refresh or
+                not self._credentials.valid or
+                self._credentials.expired or
+                self._last_refresh is None
             )
 
-        # Check if refresh is needed
-        needs_refresh = (
-            force_refresh or
-            not self._credentials.valid or
-            self._credentials.expired or
-            self._last_refresh is None
-        )
-
-        if needs_refresh:
-            try:
-                self._credentials.refresh(Request())
-                self._last_refresh = datetime.now()
-                logger.info("OAuth token refreshed successfully")
-            except RefreshError as e:
-                logger.error(f"Token refresh failed: {e}")
-                raise AuthenticationError(
-                    f"Failed to refresh OAuth token: {e}. "
-                    "Your refresh token may have expired. Please regenerate it."
-                )
+            if needs_refresh:
+                try:
+                    self._credentials.refresh(Request())
+                    self._last_refresh = datetime.now()
+                    logger.info("OAuth token refreshed successfully")
+                except RefreshError as e:
+                    logger.error(f"Token refresh failed: {e}")
+                    raise AuthenticationError(
+                        f"Failed to refresh OAuth token: {e}. "
+                        "Your refresh token may have expired. Please regenerate it."
+                    )
 
-        return self._credentials
+            return self._credentials
 
     def validate_token(self) -> bool:
         """
@@ -291,23 +296,31 @@ class GoogleAdsAuthManager:
         self._current_client_key = client_key
         logger.info(f"Switched to client: {client_key}")
 
-    def list_clients(self) -> Dict[str, Dict[str, Any]]:
+    def iter_clients(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
-        List all initialized clients.
+        Iterate over initialized clients without building a dictionary.
 
-        Returns:
-            Dictionary of client keys and their metadata
+        Yields:
+            Tuples of (client key, client metadata)
         """
-        clients_info = {}
+        current_key = self._current_client_key
+        token_managers = self._token_managers
 
         for key in self._clients:
-            clients_info[key] = {
+            yield key, {
                 "key": key,
-                "is_current": key == self._current_client_key,
-                "has_token_manager": key in self._token_managers
+                "is_current": key == current_key,
+                "has_token_manager": key in token_managers
             }
 
-        return clients_info
+    def list_clients(self) -> Dict[str, Dict[str, Any]]:
+        """
+        List all initialized clients.
+
+        Returns:
+            Dictionary of client keys and their metadata
+        """
+        return dict(self.iter_clients())
 
     def refresh_token(self, client_key: Optional[str] = None) -> None:
         """
@@ -342,7 +355,7 @@ class GoogleAdsAuthManager:
         try:
             client = self.get_client(client_key)
             # Try to access customer service (lightweight validation)
-            customer_service = client.get_service("CustomerService")
+            client.get_service("CustomerService")
             return True
         except Exception as e:
             logger.error(f"Credential validation failed: {e}")
@@ -10,9 +10,12 @@ Intelligent caching system with:
 - Cache statistics
 """
 
+import copy
 import hashlib
 import json
 import logging
+import threading
+import time
 from typing import Optional, Any, Callable, Dict
 from functools import wraps
 from datetime import timedelta
@@ -53,6 +56,9 @@ class ResourceType(str, Enum):
     RECOMMENDATION = "recommendation"
     AUDIENCE = "audience"
     CONVERSION = "conversion"
+    QUERY = "query"
+    INSIGHTS = "insights"
+    LABEL = "label"
 
 
 # Default TTL (in seconds) for each resource type
@@ -67,8 +73,15 @@ DEFAULT_TTL = {
     ResourceType.RECOMMENDATION: 3600,  # 1 hour (changes slowly)
     ResourceType.AUDIENCE: 1800,  # 30 minutes
     ResourceType.CONVERSION: 600,  # 10 minutes
+    ResourceType.QUERY: 300,  # 5 minutes (raw GAQL results, may include metrics)
+    ResourceType.INSIGHTS: 900,  # 15 minutes (rough refresh interval of reporting data)
+    ResourceType.LABEL: 600,  # 10 minutes (label names rarely change)
 }
 
+# Resource types cached from reports over other resources. Invalidating any
+# other resource type for a customer drops these entries too.
+DERIVED_RESOURCE_TYPES = (ResourceType.INSIGHTS, ResourceType.PERFORMANCE, ResourceType.QUERY)
+
 
 class CacheStats:
     """Track cache statistics."""
@@ -103,7 +116,13 @@ class CacheStats:
 
 
 class MemoryCache:
-    """In-memory cache using cachetools."""
+    """
+    In-memory cache using cachetools.
+
+    Entries expire after their own TTL, capped at default_ttl. Values are
+    deep-copied in and out, as the Redis backend's JSON round trip does, so
+    callers cannot change cached entries.
+    """
 
     def __init__(self, max_size: int = 1000, default_ttl: int = 3600):
         """
@@ -119,16 +138,23 @@ class MemoryCache:
         self.default_ttl = default_ttl
         self.cache = TTLCache(maxsize=max_size, ttl=default_ttl)
         self.stats = CacheStats()
+
+        # TTLCache is not thread-safe, and tools run on worker threads
+        self._lock = threading.Lock()
         logger.info(f"Memory cache initialized (max_size={max_size}, default_ttl={default_ttl}s)")
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
         try:
-            value = self.cache.get(key)
-            if value is not None:
+            with self._lock:
+                entry = self.cache.get(key)
+                if entry is not None and entry[0] <= time.monotonic():
+                    del self.cache[key]
+                    entry = None
+            if entry is not None:
                 self.stats.hits += 1
                 logger.debug(f"Cache hit: {key}")
-                return value
+                return copy.deepcopy(entry[1])
             else:
                 self.stats.misses += 1
                 logger.debug(f"Cache miss: {key}")
@@ -141,9 +167,10 @@ class MemoryCache:
     def set(self, key: str, value: Any, ttl: Optional[int] = None):
         """Set value in cache."""
         try:
-            # Note: cachetools TTLCache uses global TTL, so ttl parameter is ignored
-            # For per-key TTL, we'd need a more complex implementation
-            self.cache[key] = value
+            ttl_seconds = min(ttl or self.default_ttl, self.default_ttl)
+            entry = (time.monotonic() + ttl_seconds, copy.deepcopy(value))
+            with self._lock:
+                self.cache[key] = entry
             self.stats.sets += 1
             logger.debug(f"Cache set: {key}")
         except Exception as e:
@@ -153,17 +180,29 @@ class MemoryCache:
     def delete(self, key: str):
         """Delete value from cache."""
         try:
-            if key in self.cache:
-                del self.cache[key]
-                self.stats.deletes += 1
-                logger.debug(f"Cache delete: {key}")
+            with self._lock:
+                if self.cache.pop(key, None) is None:
+                    return
+            self.stats.deletes += 1
+            logger.debug(f"Cache delete: {key}")
         except Exception as e:
             self.stats.errors += 1
             logger.error(f"Cache delete error for key {key}: {e}")
 
+    def delete_matching(self, prefix: str) -> int:
+        """Delete the key equal to prefix and every key under it ("prefix:...")."""
+        nested = prefix + ":"
+        with self._lock:
+            keys = [key for key in self.cache if key == prefix or key.startswith(nested)]
+            for key in keys:
+                self.cache.pop(key, None)
+        self.stats.deletes += len(keys)
+        return len(keys)
+
     def clear(self):
         """Clear all cache entries."""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
         logger.info("Memory cache cleared")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -242,6 +281,18 @@ class RedisCache:
             self.stats.errors += 1
             logger.error(f"Redis delete error for key {key}: {e}")
 
+    def delete_matching(self, prefix: str) -> int:
+        """Delete the key equal to prefix and every key under it ("prefix:...")."""
+        try:
+            keys = [prefix, *self.client.scan_iter(match=f"{prefix}:*")]
+            deleted = self.client.delete(*keys)
+            self.stats.deletes += deleted
+            return deleted
+        except Exception as e:
+            self.stats.errors += 1
+            logger.error(f"Redis delete error for prefix {prefix}: {e}")
+            return 0
+
     def clear(self):
         """Clear all cache entries (use with caution!)."""
         try:
@@ -286,6 +337,10 @@ class NoCache:
         """Do nothing."""
         pass
 
+    def delete_matching(self, prefix: str) -> int:
+        """Do nothing."""
+        return 0
+
     def clear(self):
         """Do nothing."""
         pass
@@ -426,15 +481,36 @@ class CacheManager:
 
         Args:
             customer_id: Google Ads customer ID
-            resource_type: Optional resource type to invalidate
-            operation: Optional operation to invalidate
+            resource_type: Optional resource type to invalidate (all if None)
+            operation: Optional operation to invalidate (all if None)
 
-        Note: This is a simple implementation. For Redis, you'd use pattern matching.
+        Invalidating a whole resource type also drops the customer's
+        DERIVED_RESOURCE_TYPES entries, which may have been computed from it.
         """
-        # For now, this is a placeholder
-        # In production, you'd want to track keys or use Redis SCAN/DELETE patterns
-        logger.warning(f"Cache invalidation requested for customer {customer_id}")
-        # TODO: Implement pattern-based invalidation
+        prefix = f"customer:{customer_id}"
+
+        if resource_type is not None:
+            type_prefix = f"{prefix}:resource:{resource_type.value}"
+            if operation:
+                type_prefix += f":operation:{operation}"
+            deleted = self.backend.delete_matching(type_prefix)
+
+            # Reports derived from the changed resources are stale as well
+            if not operation and resource_type not in DERIVED_RESOURCE_TYPES:
+                deleted += sum(
+                    self.backend.delete_matching(f"{prefix}:resource:{derived.value}")
+                    for derived in DERIVED_RESOURCE_TYPES
+                )
+        elif operation:
+            # The resource type sits between customer and operation in the key
+            deleted = sum(
+                self.backend.delete_matching(f"{prefix}:resource:{rt.value}:operation:{operation}")
+                for rt in ResourceType
+            )
+        else:
+            deleted = self.backend.delete_matching(prefix)
+
+        logger.debug(f"Invalidated {deleted} cache entries for customer {customer_id}")
 
     def clear(self):
         """Clear all cache entries."""
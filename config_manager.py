@@ -120,6 +120,7 @@ class LoggingConfig(BaseModel):
     format: LogFormat = Field(default=LogFormat.TEXT, description="Log format")
     file: Optional[str] = Field(default=None, description="Log file path")
     console: bool = Field(default=True, description="Log to console")
+    performance_tracking: bool = Field(default=True, description="Time and log tracked operations")
 
 
 class FeaturesConfig(BaseModel):
@@ -3,15 +3,17 @@ Google Ads MCP Error Handler
 
 Comprehensive error handling with:
 - Error categorization
-- Retry logic with exponential backoff
+- Retry logic with jittered exponential backoff
 - Rate limit detection
 - User-friendly error messages
 - Error logging and tracking
 """
 
+import asyncio
 import logging
+import random
 import time
-from typing import Callable, Any, Optional, TypeVar, List
+from typing import Callable, Any, Optional, TypeVar, List, Tuple, Type
 from functools import wraps
 from google.ads.googleads.errors import GoogleAdsException
 from google.api_core.exceptions import ResourceExhausted, DeadlineExceeded, ServiceUnavailable
@@ -277,62 +279,142 @@ class ErrorHandler:
         return structured_error.to_user_message()
 
 
+class JitterStrategy:
+    """Backoff jitter strategy constants."""
+    NONE = "none"
+    FULL = "full"
+    DECORRELATED = "decorrelated"
+
+
+def _compute_backoff(
+    attempt: int,
+    previous: float,
+    backoff_base: float,
+    base_delay: float,
+    max_backoff: float,
+    jitter: str
+) -> float:
+    """
+    Compute the delay before the next retry attempt.
+
+    Args:
+        attempt: Number of attempts made so far
+        previous: Delay used before the previous attempt
+        backoff_base: Base for exponential backoff calculation
+        base_delay: Minimum delay in seconds
+        max_backoff: Maximum backoff time in seconds
+        jitter: Jitter strategy (see JitterStrategy)
+
+    Returns:
+        Delay in seconds
+    """
+    if jitter == JitterStrategy.DECORRELATED:
+        # AWS "decorrelated jitter": grow from the previous delay, never past the cap
+        upper = max(base_delay, min(max_backoff, previous * backoff_base))
+        return random.uniform(base_delay, upper)
+
+    exponential = min(backoff_base ** attempt, max_backoff)
+
+    if jitter == JitterStrategy.FULL:
+        return random.uniform(base_delay, max(base_delay, exponential))
+
+    return exponential
+
+
 def with_retry(
     max_attempts: int = 3,
     backoff_base: float = 2.0,
     max_backoff: float = 60.0,
-    retryable_errors: Optional[List[str]] = None
+    retryable_errors: Optional[List[str]] = None,
+    jitter: str = JitterStrategy.NONE,
+    base_delay: float = 0.1,
+    rate_limit_backoff: Optional[float] = None
 ):
     """
-    Decorator to add retry logic with exponential backoff.
+    Decorator to add retry logic with jittered, capped exponential backoff.
+
+    Supports both regular and async functions; async functions wait with
+    asyncio.sleep so the event loop is not blocked between attempts.
 
     Args:
         max_attempts: Maximum number of retry attempts
         backoff_base: Base for exponential backoff calculation
         max_backoff: Maximum backoff time in seconds
         retryable_errors: List of error categories to retry (None = all retryable)
+        jitter: Jitter strategy (none, full or decorrelated); the default
+            keeps plain capped exponential backoff
+        base_delay: Minimum delay in seconds between jittered attempts
+        rate_limit_backoff: Optional minimum delay in seconds after a rate
+            limit error (the API quota window), applied on top of the
+            computed backoff
 
     Returns:
         Decorated function with retry logic
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        def get_backoff(error: Exception, attempt: int, previous: float) -> Optional[float]:
+            """Return the delay before the next attempt, or None if the error should be raised."""
+            structured_error = ErrorHandler.categorize_error(error)
+
+            # Check if error is retryable
+            if not structured_error.retryable:
+                return None
+
+            # Check if error category is in retryable list
+            if retryable_errors and structured_error.category not in retryable_errors:
+                return None
+
+            if attempt >= max_attempts:
+                logger.error(f"Max retry attempts ({max_attempts}) reached for {func.__name__}")
+                return None
+
+            backoff = _compute_backoff(attempt, previous, backoff_base, base_delay, max_backoff, jitter)
+
+            # Quota errors need the quota window to pass before a retry can succeed
+            if rate_limit_backoff and structured_error.category == ErrorCategory.RATE_LIMIT:
+                backoff = max(backoff, rate_limit_backoff)
+
+            logger.warning(
+                f"Retrying {func.__name__} (attempt {attempt}/{max_attempts}) "
+                f"after {backoff:.1f}s due to: {structured_error.message}"
+            )
+
+            return backoff
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> T:
+                attempt = 0
+                backoff = base_delay
+
+                while True:
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        attempt += 1
+                        backoff = get_backoff(e, attempt, backoff)
+                        if backoff is None:
+                            raise
+
+                    await asyncio.sleep(backoff)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
             attempt = 0
-            last_error = None
+            backoff = base_delay
 
-            while attempt < max_attempts:
+            while True:
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    last_error = e
-                    structured_error = ErrorHandler.categorize_error(e)
-
-                    # Check if error is retryable
-                    if not structured_error.retryable:
-                        raise
-
-                    # Check if error category is in retryable list
-                    if retryable_errors and structured_error.category not in retryable_errors:
-                        raise
-
-                    # Calculate backoff time
                     attempt += 1
-                    if attempt >= max_attempts:
-                        logger.error(f"Max retry attempts ({max_attempts}) reached for {func.__name__}")
+                    backoff = get_backoff(e, attempt, backoff)
+                    if backoff is None:
                         raise
 
-                    backoff = min(backoff_base ** attempt, max_backoff)
-                    logger.warning(
-                        f"Retrying {func.__name__} (attempt {attempt}/{max_attempts}) "
-                        f"after {backoff:.1f}s due to: {structured_error.message}"
-                    )
-
-                    time.sleep(backoff)
-
-            # This shouldn't be reached, but just in case
-            if last_error:
-                raise last_error
+                time.sleep(backoff)
 
         return wrapper
     return decorator
@@ -360,6 +442,64 @@ def with_rate_limit_handling(
     )
 
 
+def tool_errors(
+    context: str,
+    error_prefix: str = "Error",
+    expected_errors: Tuple[Type[Exception], ...] = (),
+    expected_prefix: Optional[str] = None
+):
+    """
+    Decorator converting exceptions raised by an MCP tool into an error message.
+
+    Apply it beneath @mcp.tool() so the registered tool returns the message
+    instead of raising. Works with both regular and async tools.
+
+    Args:
+        context: Operation name passed to ErrorHandler for logging
+        error_prefix: Prefix for unexpected errors (e.g. "Error listing accounts")
+        expected_errors: Exception types reported with their own message
+            instead of being categorized (e.g. AuthenticationError)
+        expected_prefix: Prefix for expected errors (defaults to error_prefix)
+
+    Returns:
+        Decorated tool function
+
+    Example:
+        @mcp.tool()
+        @tool_errors(context="switch_session", expected_errors=(AuthenticationError,))
+        def google_ads_switch_session(client_key: str) -> str:
+            ...
+    """
+    expected_label = expected_prefix or error_prefix
+
+    def to_message(error: Exception) -> str:
+        if isinstance(error, expected_errors):
+            logger.error(f"Error in {context}: {error}")
+            return f"❌ {expected_label}: {error}"
+        return f"❌ {error_prefix}: {ErrorHandler.handle_error(error, context=context)}"
+
+    def decorator(func: Callable[..., str]) -> Callable[..., str]:
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs) -> str:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    return to_message(e)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> str:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                return to_message(e)
+
+        return wrapper
+    return decorator
+
+
 def safe_execute(func: Callable[..., T], *args, **kwargs) -> tuple[Optional[T], Optional[str]]:
     """
     Safely execute a function and return result or error message.
@@ -19,18 +19,21 @@ Requirements:
 - PyYAML>=6.0.0
 - cachetools>=5.3.0
 - redis>=5.0.0 (optional)
+- orjson>=3.9.0 (optional)
 """
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any, Literal
 from enum import Enum
-import json
+from collections import defaultdict
 import asyncio
 
 # Import our new modules
 from auth_manager import get_auth_manager, AuthenticationError
-from error_handler import with_retry, with_rate_limit_handling, ErrorHandler, safe_execute
+from error_handler import (
+    with_retry, with_rate_limit_handling, ErrorHandler, JitterStrategy, safe_execute, tool_errors
+)
 from config_manager import get_config_manager, get_config
 from cache_manager import get_cache_manager, cached, ResourceType, initialize_cache
 from logger import main_logger, performance_logger, audit_logger, get_logger
@@ -51,6 +54,9 @@ except Exception as e:
     logger.warning(f"Failed to load configuration, using defaults: {e}")
     config = get_config_manager()  # Will use defaults
 
+# Skip operation timing entirely when performance tracking is disabled
+performance_logger.enabled = config.config.logging.performance_tracking
+
 # Initialize auth manager
 auth_manager = get_auth_manager()
 
@@ -71,23 +77,48 @@ else:
 
 logger.info(f"Cache initialized with backend: {cache_backend.value}")
 
+# Raw GAQL result rows are protobuf messages, which only the in-process
+# memory backend can hold (Redis values must be JSON-serializable)
+QUERY_CACHE_ENABLED = (
+    config.config.performance.cache.enabled and cache_backend.value == "memory"
+)
+
 # Constants
 CHARACTER_LIMIT = config.config.character_limit
 DEFAULT_PAGE_SIZE = config.config.default_page_size
 MAX_PAGE_SIZE = config.config.max_page_size
 
+# GAQL template for per-account details in google_ads_list_accounts
+CUSTOMER_DETAIL_QUERY = (
+    "SELECT customer.id, customer.descriptive_name, customer.currency_code, "
+    "customer.time_zone, customer.manager, customer.status "
+    "FROM customer WHERE customer.id = {}"
+)
+
+# Optional size section of the cache statistics report (missing keys render as N/A)
+_CACHE_SIZE_SECTION = "**Current Size**: {size} items\n**Max Size**: {max_size}\n\n"
+
 
 # ============================================================================
 # Enums
 # ============================================================================
 
-class ResponseFormat(str, Enum):
+class ValidatedEnum(str, Enum):
+    """String enum with O(1) value validation via a precomputed value set."""
+
+    @classmethod
+    def is_valid(cls, value: str) -> bool:
+        """Check whether a value is one of the enum values, without raising."""
+        return value in cls._values
+
+
+class ResponseFormat(ValidatedEnum):
     """Output format for tool responses."""
     MARKDOWN = "markdown"
     JSON = "json"
 
 
-class DateRange(str, Enum):
+class DateRange(ValidatedEnum):
     """Predefined date ranges for queries."""
     TODAY = "TODAY"
     YESTERDAY = "YESTERDAY"
@@ -99,13 +130,18 @@ class DateRange(str, Enum):
     LAST_90_DAYS = "LAST_90_DAYS"
 
 
-class CampaignStatus(str, Enum):
+class CampaignStatus(ValidatedEnum):
     """Campaign status options."""
     ENABLED = "ENABLED"
     PAUSED = "PAUSED"
     REMOVED = "REMOVED"
 
 
+# Precompute value sets so is_valid is a hash lookup instead of Enum.__call__
+for _enum in (ResponseFormat, DateRange, CampaignStatus):
+    _enum._values = frozenset(member.value for member in _enum)
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -120,23 +156,42 @@ def format_percentage(value: float) -> str:
     return f"{value * 100:.2f}%"
 
 
-@with_retry(max_attempts=3, backoff_base=2.0)
+@with_retry(
+    max_attempts=5,
+    backoff_base=2.0,
+    max_backoff=60.0,
+    jitter=JitterStrategy.DECORRELATED,
+    base_delay=0.1,
+    rate_limit_backoff=60.0
+)
 async def execute_query(
     customer_id: str,
     query: str,
-    use_cache: bool = True
+    use_cache: bool = False
 ) -> List[Any]:
     """
-    Execute a GAQL query with caching and retry logic.
+    Execute a GAQL query with optional caching and retry logic.
 
     Args:
         customer_id: Customer ID (without hyphens)
         query: GAQL query string
-        use_cache: Whether to use caching
+        use_cache: Cache the rows under ResourceType.QUERY. Only opt in for
+            queries whose results may be served stale, since arbitrary GAQL
+            cannot be matched to the writes that change it
 
     Returns:
         List of row results
     """
+    use_cache = use_cache and QUERY_CACHE_ENABLED
+
+    # Serve cache hits before any validation, client setup or timing
+    if use_cache:
+        cached_results = cache_manager.get(
+            customer_id, ResourceType.QUERY, "execute_query", query=query
+        )
+        if cached_results is not None:
+            return cached_results
+
     with performance_logger.track_operation('execute_query', customer_id=customer_id):
         # Get client
         client = auth_manager.get_client()
@@ -161,6 +216,11 @@ async def execute_query(
 
             logger.info(f"Query returned {len(results)} results for customer {customer_id}")
 
+            if use_cache:
+                cache_manager.set(
+                    customer_id, ResourceType.QUERY, "execute_query", results, query=query
+                )
+
             return results
 
         except Exception as e:
@@ -174,6 +234,12 @@ async def execute_query(
 # ============================================================================
 
 @mcp.tool()
+@tool_errors(
+    context="google_ads_initialize",
+    error_prefix="Initialization Error",
+    expected_errors=(AuthenticationError,),
+    expected_prefix="Authentication Error"
+)
 def google_ads_initialize(
     developer_token: str,
     client_id: str,
@@ -196,44 +262,41 @@ def google_ads_initialize(
     Returns:
         Success message with session information
     """
-    try:
-        # Initialize OAuth with auth manager
-        session_key = auth_manager.initialize_oauth(
-            developer_token=developer_token,
-            client_id=client_id,
-            client_secret=client_secret,
-            refresh_token=refresh_token,
-            login_customer_id=login_customer_id,
-            client_key=client_key
-        )
-
-        # Validate credentials
-        is_valid = auth_manager.validate_credentials(client_key)
+    # Initialize OAuth with auth manager
+    session_key = auth_manager.initialize_oauth(
+        developer_token=developer_token,
+        client_id=client_id,
+        client_secret=client_secret,
+        refresh_token=refresh_token,
+        login_customer_id=login_customer_id,
+        client_key=client_key
+    )
 
-        if not is_valid:
-            return "❌ Initialization failed: Could not validate credentials"
+    # Validate credentials
+    is_valid = auth_manager.validate_credentials(client_key)
 
-        logger.info(f"Google Ads client initialized successfully: {client_key}")
+    if not is_valid:
+        return "❌ Initialization failed: Could not validate credentials"
 
-        return (
-            f"✅ Google Ads API initialized successfully!\n\n"
-            f"Session Key: {session_key}\n"
-            f"MCC Account: {login_customer_id or 'Not specified'}\n"
-            f"Token Refresh: Automatic (enabled)\n"
-            f"Multi-Account Support: Yes\n\n"
-            f"You can now use other Google Ads tools to query and manage campaigns."
-        )
+    logger.info(f"Google Ads client initialized successfully: {client_key}")
 
-    except AuthenticationError as e:
-        error_msg = str(e)
-        logger.error(f"Authentication failed: {error_msg}")
-        return f"❌ Authentication Error: {error_msg}"
-    except Exception as e:
-        error_msg = ErrorHandler.handle_error(e, context="google_ads_initialize")
-        return f"❌ Initialization Error: {error_msg}"
+    return (
+        f"✅ Google Ads API initialized successfully!\n\n"
+        f"Session Key: {session_key}\n"
+        f"MCC Account: {login_customer_id or 'Not specified'}\n"
+        f"Token Refresh: Automatic (enabled)\n"
+        f"Multi-Account Support: Yes\n\n"
+        f"You can now use other Google Ads tools to query and manage campaigns."
+    )
 
 
 @mcp.tool()
+@tool_errors(
+    context="service_account_init",
+    error_prefix="Initialization Error",
+    expected_errors=(AuthenticationError,),
+    expected_prefix="Service Account Error"
+)
 def google_ads_service_account_init(
     developer_token: str,
     json_key_file_path: str,
@@ -252,32 +315,26 @@ def google_ads_service_account_init(
     Returns:
         Success message with session information
     """
-    try:
-        session_key = auth_manager.initialize_service_account(
-            developer_token=developer_token,
-            json_key_file_path=json_key_file_path,
-            login_customer_id=login_customer_id,
-            client_key=client_key
-        )
-
-        logger.info(f"Service account initialized: {client_key}")
+    session_key = auth_manager.initialize_service_account(
+        developer_token=developer_token,
+        json_key_file_path=json_key_file_path,
+        login_customer_id=login_customer_id,
+        client_key=client_key
+    )
 
-        return (
-            f"✅ Service Account initialized successfully!\n\n"
-            f"Session Key: {session_key}\n"
-            f"Key File: {json_key_file_path}\n"
-            f"MCC Account: {login_customer_id or 'Not specified'}\n\n"
-            f"Service account authentication is ideal for automated scripts and scheduled tasks."
-        )
+    logger.info(f"Service account initialized: {client_key}")
 
-    except AuthenticationError as e:
-        return f"❌ Service Account Error: {str(e)}"
-    except Exception as e:
-        error_msg = ErrorHandler.handle_error(e, context="service_account_init")
-        return f"❌ Initialization Error: {error_msg}"
+    return (
+        f"✅ Service Account initialized successfully!\n\n"
+        f"Session Key: {session_key}\n"
+        f"Key File: {json_key_file_path}\n"
+        f"MCC Account: {login_customer_id or 'Not specified'}\n\n"
+        f"Service account authentication is ideal for automated scripts and scheduled tasks."
+    )
 
 
 @mcp.tool()
+@tool_errors(context="list_auth_sessions")
 def google_ads_list_auth_sessions() -> str:
     """
     List all authenticated Google Ads sessions.
@@ -285,33 +342,31 @@ def google_ads_list_auth_sessions() -> str:
     Returns:
         List of active sessions with metadata
     """
-    try:
-        clients = auth_manager.list_clients()
-
-        if not clients:
-            return "No authenticated sessions found. Use google_ads_initialize first."
+    parts = ["# Authenticated Google Ads Sessions\n\n"]
+    total = 0
 
-        output = "# Authenticated Google Ads Sessions\n\n"
+    for key, info in auth_manager.iter_clients():
+        current_marker = " (CURRENT)" if info['is_current'] else ""
+        auth_type = "OAuth2" if info['has_token_manager'] else "Service Account"
 
-        for key, info in clients.items():
-            current_marker = " (CURRENT)" if info['is_current'] else ""
-            auth_type = "OAuth2" if info['has_token_manager'] else "Service Account"
-
-            output += f"## {key}{current_marker}\n"
-            output += f"- **Auth Type**: {auth_type}\n"
-            output += f"- **Status**: Active\n\n"
+        parts.append(
+            f"## {key}{current_marker}\n"
+            f"- **Auth Type**: {auth_type}\n"
+            f"- **Status**: Active\n\n"
+        )
+        total += 1
 
-        output += f"\n**Total Sessions**: {len(clients)}\n"
-        output += "\nUse `google_ads_switch_session` to switch between sessions."
+    if not total:
+        return "No authenticated sessions found. Use google_ads_initialize first."
 
-        return output
+    parts.append(f"\n**Total Sessions**: {total}\n")
+    parts.append("\nUse `google_ads_switch_session` to switch between sessions.")
 
-    except Exception as e:
-        error_msg = ErrorHandler.handle_error(e, context="list_auth_sessions")
-        return f"❌ Error: {error_msg}"
+    return "".join(parts)
 
 
 @mcp.tool()
+@tool_errors(context="switch_session", expected_errors=(AuthenticationError,))
 def google_ads_switch_session(client_key: str) -> str:
     """
     Switch to a different authenticated session.
@@ -322,20 +377,14 @@ def google_ads_switch_session(client_key: str) -> str:
     Returns:
         Success message
     """
-    try:
-        auth_manager.switch_client(client_key)
-        logger.info(f"Switched to session: {client_key}")
-
-        return f"✅ Switched to session: {client_key}\n\nAll subsequent operations will use this session."
+    auth_manager.switch_client(client_key)
+    logger.info(f"Switched to session: {client_key}")
 
-    except AuthenticationError as e:
-        return f"❌ Error: {str(e)}"
-    except Exception as e:
-        error_msg = ErrorHandler.handle_error(e, context="switch_session")
-        return f"❌ Error: {error_msg}"
+    return f"✅ Switched to session: {client_key}\n\nAll subsequent operations will use this session."
 
 
 @mcp.tool()
+@tool_errors(context="get_cache_stats")
 def google_ads_get_cache_stats() -> str:
     """
     Get cache statistics and performance metrics.
@@ -343,34 +392,35 @@ def google_ads_get_cache_stats() -> str:
     Returns:
         Cache statistics in markdown format
     """
-    try:
-        stats = cache_manager.get_stats()
-
-        output = "# Cache Statistics\n\n"
-        output += f"**Backend**: {stats.get('backend', 'unknown').upper()}\n"
-        output += f"**Hit Rate**: {stats.get('hit_rate', '0%')}\n"
-        output += f"**Total Requests**: {stats.get('total_requests', 0)}\n"
-        output += f"**Cache Hits**: {stats.get('hits', 0)}\n"
-        output += f"**Cache Misses**: {stats.get('misses', 0)}\n"
-        output += f"**Cache Sets**: {stats.get('sets', 0)}\n"
-        output += f"**Errors**: {stats.get('errors', 0)}\n\n"
-
-        if 'size' in stats:
-            output += f"**Current Size**: {stats['size']} items\n"
-            output += f"**Max Size**: {stats.get('max_size', 'N/A')}\n\n"
-
-        if stats.get('backend') == 'redis':
-            output += f"**Connected Clients**: {stats.get('connected_clients', 0)}\n"
-            output += f"**Memory Used**: {stats.get('used_memory_human', 'unknown')}\n"
-            output += f"**Total Keys**: {stats.get('total_keys', 0)}\n\n"
-
-        output += "Cache is automatically used for read operations to improve performance."
-
-        return output
+    stats = cache_manager.get_stats()
+    get = stats.get
+    backend = get('backend', 'unknown')
+
+    size_section = ""
+    if 'size' in stats:
+        size_section = _CACHE_SIZE_SECTION.format_map(defaultdict(lambda: 'N/A', stats))
+
+    redis_section = ""
+    if backend == 'redis':
+        redis_section = (
+            f"**Connected Clients**: {get('connected_clients', 0)}\n"
+            f"**Memory Used**: {get('used_memory_human', 'unknown')}\n"
+            f"**Total Keys**: {get('total_keys', 0)}\n\n"
+        )
 
-    except Exception as e:
-        error_msg = ErrorHandler.handle_error(e, context="get_cache_stats")
-        return f"❌ Error: {error_msg}"
+    return (
+        f"# Cache Statistics\n\n"
+        f"**Backend**: {backend.upper()}\n"
+        f"**Hit Rate**: {get('hit_rate', '0%')}\n"
+        f"**Total Requests**: {get('total_requests', 0)}\n"
+        f"**Cache Hits**: {get('hits', 0)}\n"
+        f"**Cache Misses**: {get('misses', 0)}\n"
+        f"**Cache Sets**: {get('sets', 0)}\n"
+        f"**Errors**: {get('errors', 0)}\n\n"
+        f"{size_section}"
+        f"{redis_section}"
+        f"Cache is automatically used for read operations to improve performance."
+    )
 
 
 # ============================================================================
@@ -378,6 +428,7 @@ def google_ads_get_cache_stats() -> str:
 # ============================================================================
 
 @mcp.tool()
+@tool_errors(context="list_accounts", error_prefix="Error listing accounts")
 async def google_ads_list_accounts(
     response_format: ResponseFormat = ResponseFormat.MARKDOWN
 ) -> str:
@@ -391,64 +442,51 @@ async def google_ads_list_accounts(
         List of accounts with details
     """
     with performance_logger.track_operation('list_accounts'):
-        try:
-            client = auth_manager.get_client()
-            customer_service = client.get_service("CustomerService")
-
-            # Get accessible customers
-            accessible_customers = customer_service.list_accessible_customers()
-            resource_names = accessible_customers.resource_names
-
-            accounts = []
-
-            for resource_name in resource_names:
-                customer_id = resource_name.split("/")[1]
-
-                # Get customer details
-                query = f"""
-                    SELECT
-                        customer.id,
-                        customer.descriptive_name,
-                        customer.currency_code,
-                        customer.time_zone,
-                        customer.manager,
-                        customer.status
-                    FROM customer
-                    WHERE customer.id = {customer_id}
-                """
-
-                results = await execute_query(customer_id, query, use_cache=True)
-
-                if results:
-                    row = results[0]
-                    accounts.append({
-                        'id': str(row.customer.id),
-                        'name': row.customer.descriptive_name or 'Unnamed Account',
-                        'currency_code': row.customer.currency_code,
-                        'time_zone': row.customer.time_zone,
-                        'manager': row.customer.manager,
-                        'status': row.customer.status.name
-                    })
-
-            # Audit log
-            audit_logger.log_api_call(
-                customer_id="all",
-                operation="list_accounts",
-                resource_type="customer",
-                action="read",
-                result="success",
-                details={'account_count': len(accounts)}
-            )
-
-            # Format response
-            if response_format == ResponseFormat.JSON:
-                return json.dumps(accounts, indent=2)
-            else:
-                return format_account_list_markdown(accounts)
+        client = auth_manager.get_client()
+        customer_service = client.get_service("CustomerService")
+
+        # Get accessible customers
+        accessible_customers = customer_service.list_accessible_customers()
+        # Resource names are always "customers/{id}"
+        customer_ids = [
+            resource_name.rpartition("/")[2]
+            for resource_name in accessible_customers.resource_names
+        ]
+
+        accounts = []
+
+        for customer_id in customer_ids:
+            # Get customer details
+            query = CUSTOMER_DETAIL_QUERY.format(customer_id)
+
+            results = await execute_query(customer_id, query, use_cache=True)
+
+            if results:
+                customer = results[0].customer
+                accounts.append({
+                    'id': str(customer.id),
+                    'name': customer.descriptive_name or 'Unnamed Account',
+                    'currency_code': customer.currency_code,
+                    'time_zone': customer.time_zone,
+                    'manager': customer.manager,
+                    'status': customer.status.name
+                })
+
+        # Audit log
+        audit_logger.log_api_call(
+            customer_id="all",
+            operation="list_accounts",
+            resource_type="customer",
+            action="read",
+            result="success",
+            details={'account_count': len(accounts)}
+        )
 
-        except Exception as e:
-            error_msg = ErrorHandler.handle_error(e, context="list_accounts")
-            return f"❌ Error listing accounts: {error_msg}"
+        # Format response
+        if response_format == ResponseFormat.JSON:
+            return ResponseFormatter.to_json(accounts)
+        else:
+            return format_account_list_markdown(accounts)
 
 
 def format_account_list_markdown(accounts: List[Dict]) -> str:
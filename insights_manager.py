@@ -12,10 +12,429 @@ Capabilities:
 - Industry benchmarking
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from google.ads.googleads.client import GoogleAdsClient
-from datetime import datetime, timedelta
-import statistics
+from array import array
+from datetime import date
+from functools import lru_cache, partial, wraps
+from operator import attrgetter
+import asyncio
+import calendar
+import inspect
+import threading
+import weakref
+import numpy as np
+import proto
+
+from cache_manager import get_cache_manager, ResourceType
+
+# Maximum number of insight queries gather_insights runs at once, to stay
+# clear of the API's concurrent request limits; the queries share one gRPC
+# channel per client (see _shared_ga_service), so keep this well below the
+# channel's concurrent stream limit
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Analyses available to gather_insights
+DEFAULT_ANALYSES = ("performance_insights", "trends", "budget_recommendations", "wasted_spend")
+CAMPAIGN_ANALYSES = ("auction_insights", "budget_pacing")
+
+# Google Ads reports money in micros (millionths of the account currency)
+MICROS_TO_UNITS = 1e-6
+
+# Industry benchmarks (2% CTR, 5% conversion rate) and the thresholds
+# get_performance_insights flags against
+CTR_BENCHMARK = 0.02
+CVR_BENCHMARK = 0.05
+CTR_LOW = CTR_BENCHMARK * 0.5
+CTR_HIGH = CTR_BENCHMARK * 1.5
+CVR_LOW = CVR_BENCHMARK * 0.5
+
+# analyze_trends anomaly thresholds: MAD_TO_SIGMA scales a median absolute
+# deviation to a standard deviation for normal data, and 9.35 is the 97.5%
+# chi-square quantile for the three metrics scored jointly
+MAD_TO_SIGMA = 1.4826
+ROBUST_Z_THRESHOLD = 2.5
+MULTI_METRIC_THRESHOLD = 9.35
+
+# Number of keyword rows analyze_wasted_spend pulls, highest cost first
+WASTED_SPEND_ROW_LIMIT = 50
+
+# Number of highest-cost wasted keywords analyze_wasted_spend reports
+TOP_WASTERS_COUNT = 10
+
+
+# GoogleAdsService clients shared by every InsightsManager built on the same
+# GoogleAdsClient. Each get_service call opens a new gRPC channel; reusing one
+# service lets concurrent search_stream calls multiplex over a single HTTP/2
+# connection. Entries go away with their GoogleAdsClient.
+_ga_services: "weakref.WeakKeyDictionary[GoogleAdsClient, Any]" = weakref.WeakKeyDictionary()
+_ga_services_lock = threading.Lock()
+
+
+def _shared_ga_service(client: GoogleAdsClient) -> Any:
+    """Return the GoogleAdsService for a client, creating it on first use.
+
+    Args:
+        client: Authenticated GoogleAdsClient instance
+
+    Returns:
+        GoogleAdsService client bound to one shared gRPC channel
+    """
+    with _ga_services_lock:
+        service = _ga_services.get(client)
+        if service is None:
+            service = client.get_service("GoogleAdsService")
+            _ga_services[client] = service
+        return service
+
+
+# GAQL templates, formatted per call. GAQL WHERE has no OR, so the
+# performance insight rules stay in Python; zero-impression rows are kept on
+# purpose, since the no-traffic checks rely on them.
+PERFORMANCE_INSIGHTS_QUERY = """
+    SELECT
+        {entity}.id,
+        {entity}.name,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.ctr,
+        metrics.cost_micros,
+        metrics.conversions,
+        metrics.conversions_value,
+        metrics.cost_per_conversion,
+        metrics.search_impression_share,
+        metrics.quality_score
+    FROM {entity}
+    WHERE segments.date DURING {date_range}{entity_filter}
+    ORDER BY metrics.cost_micros DESC
+    LIMIT 100
+"""
+
+TRENDS_QUERY = """
+    SELECT
+        segments.date,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.ctr,
+        metrics.cost_micros,
+        metrics.conversions
+    FROM campaign
+    WHERE segments.date DURING LAST_{lookback_days}_DAYS{campaign_filter}
+    ORDER BY segments.date
+"""
+
+BUDGET_PACING_QUERY = """
+    SELECT
+        campaign.id,
+        campaign.name,
+        campaign_budget.amount_micros,
+        campaign_budget.period,
+        metrics.cost_micros
+    FROM campaign
+    WHERE {campaign_filter}
+      AND segments.date DURING THIS_MONTH
+"""
+
+BUDGET_RECOMMENDATIONS_QUERY = """
+    SELECT
+        campaign.id,
+        campaign.name,
+        campaign_budget.amount_micros,
+        metrics.cost_micros,
+        metrics.conversions,
+        metrics.cost_per_conversion,
+        metrics.search_budget_lost_impression_share,
+        metrics.conversions_value
+    FROM campaign
+    WHERE segments.date DURING {date_range}
+      AND campaign.status = 'ENABLED'
+    ORDER BY metrics.cost_micros DESC
+"""
+
+WASTED_SPEND_QUERY = """
+    SELECT
+        ad_group.id,
+        ad_group.name,
+        campaign.name,
+        ad_group_criterion.keyword.text,
+        ad_group_criterion.keyword.match_type,
+        metrics.cost_micros,
+        metrics.clicks,
+        metrics.conversions
+    FROM keyword_view
+    WHERE segments.date DURING {date_range}
+      AND metrics.cost_micros > {min_cost_micros}
+    ORDER BY metrics.cost_micros DESC
+    LIMIT {limit}
+"""
+
+AUCTION_INSIGHTS_QUERY = """
+    SELECT
+        campaign.id,
+        campaign.name,
+        metrics.search_impression_share,
+        metrics.search_rank_lost_impression_share,
+        metrics.search_budget_lost_impression_share,
+        metrics.search_top_impression_share,
+        metrics.search_absolute_top_impression_share,
+        metrics.search_exact_match_impression_share
+    FROM campaign
+    WHERE {campaign_filter}
+      AND segments.date DURING {date_range}
+"""
+
+
+def cached_insight(method):
+    """Cache an InsightsManager method's result in the shared cache manager.
+
+    Results are stored under ResourceType.INSIGHTS per customer, method and
+    arguments. Arguments are normalized through the method signature, so
+    positional and keyword calls share entries. Error results are not
+    cached. Invalidating any of the customer's resources drops the entries.
+    """
+    signature = inspect.signature(method)
+    operation = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments['self']
+        customer_id = arguments.pop('customer_id')
+
+        cache_manager = get_cache_manager()
+        result = cache_manager.get(customer_id, ResourceType.INSIGHTS, operation, **arguments)
+        if result is not None:
+            return result
+
+        result = method(self, *args, **kwargs)
+
+        if not (isinstance(result, dict) and 'error' in result):
+            cache_manager.set(customer_id, ResourceType.INSIGHTS, operation, result, **arguments)
+
+        return result
+
+    return wrapper
+
+
+def _half_means(values: np.ndarray, mid_point: int) -> Tuple[float, float]:
+    """Mean of the values before and from mid_point, from one cumulative sum.
+
+    Args:
+        values: Non-empty array of daily values
+        mid_point: Index splitting the first and second half
+
+    Returns:
+        Tuple of (first half mean, second half mean); 0 for an empty half
+    """
+    cumulative = np.cumsum(values)
+    first_total = float(cumulative[mid_point - 1]) if mid_point > 0 else 0.0
+    second_total = float(cumulative[-1]) - first_total
+
+    first_mean = first_total / mid_point if mid_point > 0 else 0
+    second_mean = second_total / (len(values) - mid_point) if mid_point < len(values) else 0
+
+    return first_mean, second_mean
+
+
+def _robust_z_scores(values: np.ndarray) -> np.ndarray:
+    """Absolute distance of each value from the median, in MAD-based sigmas.
+
+    Args:
+        values: Array of observations
+
+    Returns:
+        Array of robust z-scores; all zero when the MAD is zero
+    """
+    deviations = np.abs(values - np.median(values))
+    sigma = MAD_TO_SIGMA * np.median(deviations)
+
+    if sigma == 0:
+        return np.zeros_like(values)
+
+    return deviations / sigma
+
+
+def _squared_mahalanobis(samples: np.ndarray) -> Optional[np.ndarray]:
+    """Squared Mahalanobis distance (v - mu)^T S^-1 (v - mu) of each sample.
+
+    Args:
+        samples: (n, k) array with one row per observation, n > k
+
+    Returns:
+        Array of n squared distances, or None if the covariance is singular
+    """
+    centered = samples - samples.mean(axis=0)
+    covariance = np.cov(samples, rowvar=False)
+
+    try:
+        solved = np.linalg.solve(covariance, centered.T)
+    except np.linalg.LinAlgError:
+        return None
+
+    return np.einsum('ij,ji->i', centered, solved)
+
+
+# Static parts of the performance insights; 'message' is filled in per row
+_LOW_CTR_INSIGHT = {
+    'type': 'LOW_CTR',
+    'severity': 'HIGH',
+    'message': None,
+    'recommendation': 'Review ad copy and targeting. Consider testing new ad variations.'
+}
+_HIGH_CTR_INSIGHT = {
+    'type': 'HIGH_CTR',
+    'severity': 'POSITIVE',
+    'message': None,
+    'recommendation': 'Consider increasing budget to capture more traffic.'
+}
+_LOW_CONVERSION_RATE_INSIGHT = {
+    'type': 'LOW_CONVERSION_RATE',
+    'severity': 'HIGH',
+    'message': None,
+    'recommendation': 'Review landing page experience and conversion funnel.'
+}
+_LOW_IMPRESSION_SHARE_INSIGHT = {
+    'type': 'LOW_IMPRESSION_SHARE',
+    'severity': 'MEDIUM',
+    'message': None,
+    'recommendation': 'Increase budget or improve ad rank to capture more impressions.'
+}
+_LOW_QUALITY_SCORE_INSIGHT = {
+    'type': 'LOW_QUALITY_SCORE',
+    'severity': 'HIGH',
+    'message': None,
+    'recommendation': 'Improve ad relevance, expected CTR, and landing page experience.'
+}
+
+
+@lru_cache(maxsize=8)
+def _make_row_scorer(entity: str) -> Callable[[Any], Optional[Dict[str, Any]]]:
+    """Build the get_performance_insights row scorer for one entity field.
+
+    The scorer is built once per entity with its accessor and thresholds
+    bound, and only builds the entity summary for rows that produce insights.
+
+    Args:
+        entity: GoogleAdsRow field holding the entity (e.g. 'campaign')
+
+    Returns:
+        Function mapping a row to its entity insights, or None if none apply
+    """
+    get_entity = attrgetter(entity)
+    ctr_low, ctr_high, cvr_low = CTR_LOW, CTR_HIGH, CVR_LOW
+    low_ctr_message = 'CTR ({:.2%}) is significantly below benchmark (' + f'{CTR_BENCHMARK:.2%})'
+
+    def score_row(row: Any) -> Optional[Dict[str, Any]]:
+        metrics = row.metrics
+        ctr = metrics.ctr
+        clicks = metrics.clicks
+        cvr = metrics.conversions / clicks if clicks > 0 else 0
+
+        insights = []
+
+        # CTR insights
+        if ctr < ctr_low:
+            insights.append(dict(_LOW_CTR_INSIGHT, message=low_ctr_message.format(ctr)))
+        elif ctr > ctr_high:
+            insights.append(dict(
+                _HIGH_CTR_INSIGHT,
+                message=f'CTR ({ctr:.2%}) is performing well above benchmark'
+            ))
+
+        # Conversion rate insights
+        if cvr < cvr_low and clicks > 50:
+            insights.append(dict(
+                _LOW_CONVERSION_RATE_INSIGHT,
+                message=f'Conversion rate ({cvr:.2%}) is below expected level'
+            ))
+
+        # Impression share insights (only when the API reported a value)
+        if metrics.HasField('search_impression_share'):
+            is_value = metrics.search_impression_share
+            if is_value < 0.5:
+                insights.append(dict(
+                    _LOW_IMPRESSION_SHARE_INSIGHT,
+                    message=f'Only capturing {is_value:.0%} of available impressions'
+                ))
+
+        # Quality score insights
+        if hasattr(metrics, 'quality_score') and metrics.quality_score < 5:
+            insights.append(dict(
+                _LOW_QUALITY_SCORE_INSIGHT,
+                message=f'Quality Score ({metrics.quality_score}/10) needs improvement'
+            ))
+
+        if not insights:
+            return None
+
+        entity_obj = get_entity(row)
+        return {
+            'entity_id': str(entity_obj.id),
+            'entity_name': entity_obj.name if hasattr(entity_obj, 'name') else 'N/A',
+            'metrics': {
+                'impressions': metrics.impressions,
+                'clicks': clicks,
+                'ctr': ctr,
+                'cost': metrics.cost_micros * MICROS_TO_UNITS,
+                'conversions': metrics.conversions,
+                'cost_per_conversion': metrics.cost_per_conversion
+            },
+            'insights': insights
+        }
+
+    return score_row
+
+
+# Auction recommendations, one per threshold bit checked by
+# _get_auction_recommendations (bit 0 first)
+_AUCTION_REC_BITS = (
+    "Increase daily budget to capture more impressions",
+    "Improve Quality Score or increase bids to improve ad rank",
+    "Increase bids to show in top positions more often",
+    "Review targeting settings - may be too restrictive",
+)
+
+# Recommendations for every combination of threshold bits, indexed by mask
+_AUCTION_RECS: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(rec for bit, rec in enumerate(_AUCTION_REC_BITS) if mask >> bit & 1)
+    for mask in range(1 << len(_AUCTION_REC_BITS))
+)
+
+
+def _enum_name(message: Any, field_name: str) -> str:
+    """Name of an enum field's value on a raw protobuf message.
+
+    Args:
+        message: Raw protobuf message
+        field_name: Name of the enum field
+
+    Returns:
+        Enum value name, or UNKNOWN for values this client version lacks
+    """
+    field = message.DESCRIPTOR.fields_by_name[field_name]
+    value = field.enum_type.values_by_number.get(getattr(message, field_name))
+    return value.name if value is not None else 'UNKNOWN'
+
+
+def _campaign_id_filter(campaign_ids: List[str]) -> str:
+    """Build a GAQL campaign.id IN (...) filter, validating the IDs.
+
+    Args:
+        campaign_ids: Campaign IDs
+
+    Returns:
+        GAQL filter condition
+
+    Raises:
+        ValueError: If any campaign ID is not numeric
+    """
+    for campaign_id in campaign_ids:
+        if not str(campaign_id).isdecimal():
+            raise ValueError(f"campaign_id must be numeric, got {campaign_id!r}")
+
+    return f"campaign.id IN ({', '.join(map(str, campaign_ids))})"
 
 
 class InsightsManager:
@@ -28,7 +447,91 @@ class InsightsManager:
             client: Authenticated GoogleAdsClient instance
         """
         self.client = client
+        self._ga_service = _shared_ga_service(client)
+
+    def _search_rows(self, customer_id: str, query: str) -> Iterator[Any]:
+        """Stream the rows of a GAQL query.
 
+        Uses search_stream so rows arrive in server-sized batches over a single
+        call instead of paging through page tokens. Batches are unwrapped to
+        raw protobuf messages, which avoids proto-plus marshalling on every
+        field read; enum fields are therefore ints, see _enum_name.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            query: GAQL query
+
+        Yields:
+            Result rows as raw protobuf GoogleAdsRow messages
+        """
+        stream = self._ga_service.search_stream(customer_id=customer_id, query=query)
+
+        for batch in stream:
+            if isinstance(batch, proto.Message):
+                batch = type(batch).pb(batch)
+            yield from batch.results
+
+    async def gather_insights(
+        self,
+        customer_id: str,
+        analyses: Iterable[str] = DEFAULT_ANALYSES,
+        date_range: str = "LAST_30_DAYS",
+        campaign_id: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """Run several independent analyses concurrently.
+
+        Each analysis runs in a worker thread, so total wall time is roughly
+        that of the slowest query rather than the sum of all of them.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            analyses: Analyses to run - performance_insights, trends,
+                budget_recommendations, wasted_spend, and (with campaign_id)
+                auction_insights and budget_pacing
+            date_range: Date range for analyses that take one
+            campaign_id: Campaign ID for campaign-level analyses and trend filtering
+            max_concurrency: Maximum number of queries in flight at once
+
+        Returns:
+            Results keyed by analysis name
+        """
+        calls = {
+            'performance_insights': partial(
+                self.get_performance_insights, customer_id, date_range=date_range
+            ),
+            'trends': partial(self.analyze_trends, customer_id, campaign_id=campaign_id),
+            'budget_recommendations': partial(
+                self.get_budget_recommendations, customer_id, date_range=date_range
+            ),
+            'wasted_spend': partial(self.analyze_wasted_spend, customer_id, date_range=date_range),
+        }
+
+        if campaign_id:
+            calls['auction_insights'] = partial(
+                self.get_auction_insights, customer_id, campaign_id, date_range=date_range
+            )
+            calls['budget_pacing'] = partial(self.get_budget_pacing, customer_id, campaign_id)
+
+        names = list(analyses)
+        unknown = [name for name in names if name not in calls]
+        if unknown:
+            raise ValueError(
+                f"Unknown or unavailable analyses: {', '.join(unknown)}. "
+                f"Campaign analyses ({', '.join(CAMPAIGN_ANALYSES)}) require campaign_id."
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(name: str) -> Any:
+            async with semaphore:
+                return await asyncio.to_thread(calls[name])
+
+        results = await asyncio.gather(*(run(name) for name in names))
+
+        return dict(zip(names, results))
+
+    @cached_insight
     def get_performance_insights(
         self,
         customer_id: str,
@@ -47,8 +550,6 @@ class InsightsManager:
         Returns:
             Performance insights with recommendations
         """
-        ga_service = self.client.get_service("GoogleAdsService")
-
         # Build query based on entity type
         entity_map = {
             "CAMPAIGN": "campaign",
@@ -59,117 +560,36 @@ class InsightsManager:
 
         entity = entity_map.get(entity_type.upper(), "campaign")
 
-        query = f"""
-            SELECT
-                {entity}.id,
-                {entity}.name,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.ctr,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.conversions_value,
-                metrics.cost_per_conversion,
-                metrics.search_impression_share,
-                metrics.quality_score
-            FROM {entity}
-            WHERE segments.date DURING {date_range}
-        """
-
-        if entity_id:
-            query += f" AND {entity}.id = {entity_id}"
-
-        query += " ORDER BY metrics.cost_micros DESC LIMIT 100"
+        query = PERFORMANCE_INSIGHTS_QUERY.format(
+            entity=entity,
+            date_range=date_range,
+            entity_filter=f" AND {entity}.id = {entity_id}" if entity_id else ""
+        )
 
-        response = ga_service.search(customer_id=customer_id, query=query)
+        score_row = _make_row_scorer(entity)
 
         insights = []
-        for row in response:
-            entity_obj = getattr(row, entity)
-            metrics = row.metrics
-
-            # Calculate performance scores
-            ctr_benchmark = 0.02  # 2% industry average
-            cvr_benchmark = 0.05  # 5% industry average
-
-            ctr = metrics.ctr
-            cvr = metrics.conversions / metrics.clicks if metrics.clicks > 0 else 0
-
-            # Generate insights
-            entity_insights = {
-                'entity_id': str(entity_obj.id),
-                'entity_name': entity_obj.name if hasattr(entity_obj, 'name') else 'N/A',
-                'metrics': {
-                    'impressions': metrics.impressions,
-                    'clicks': metrics.clicks,
-                    'ctr': ctr,
-                    'cost': metrics.cost_micros / 1_000_000,
-                    'conversions': metrics.conversions,
-                    'cost_per_conversion': metrics.cost_per_conversion
-                },
-                'insights': []
-            }
-
-            # CTR insights
-            if ctr < ctr_benchmark * 0.5:
-                entity_insights['insights'].append({
-                    'type': 'LOW_CTR',
-                    'severity': 'HIGH',
-                    'message': f'CTR ({ctr:.2%}) is significantly below benchmark ({ctr_benchmark:.2%})',
-                    'recommendation': 'Review ad copy and targeting. Consider testing new ad variations.'
-                })
-            elif ctr > ctr_benchmark * 1.5:
-                entity_insights['insights'].append({
-                    'type': 'HIGH_CTR',
-                    'severity': 'POSITIVE',
-                    'message': f'CTR ({ctr:.2%}) is performing well above benchmark',
-                    'recommendation': 'Consider increasing budget to capture more traffic.'
-                })
-
-            # Conversion rate insights
-            if cvr < cvr_benchmark * 0.5 and metrics.clicks > 50:
-                entity_insights['insights'].append({
-                    'type': 'LOW_CONVERSION_RATE',
-                    'severity': 'HIGH',
-                    'message': f'Conversion rate ({cvr:.2%}) is below expected level',
-                    'recommendation': 'Review landing page experience and conversion funnel.'
-                })
-
-            # Impression share insights
-            if hasattr(metrics, 'search_impression_share'):
-                is_value = metrics.search_impression_share
-                if is_value < 0.5:
-                    entity_insights['insights'].append({
-                        'type': 'LOW_IMPRESSION_SHARE',
-                        'severity': 'MEDIUM',
-                        'message': f'Only capturing {is_value:.0%} of available impressions',
-                        'recommendation': 'Increase budget or improve ad rank to capture more impressions.'
-                    })
-
-            # Quality score insights
-            if hasattr(metrics, 'quality_score') and metrics.quality_score < 5:
-                entity_insights['insights'].append({
-                    'type': 'LOW_QUALITY_SCORE',
-                    'severity': 'HIGH',
-                    'message': f'Quality Score ({metrics.quality_score}/10) needs improvement',
-                    'recommendation': 'Improve ad relevance, expected CTR, and landing page experience.'
-                })
-
-            if entity_insights['insights']:
+        total_analyzed = 0
+        for row in self._search_rows(customer_id, query):
+            total_analyzed += 1
+            entity_insights = score_row(row)
+            if entity_insights is not None:
                 insights.append(entity_insights)
 
         return {
             'entity_type': entity_type,
-            'total_analyzed': len(list(response)),
+            'total_analyzed': total_analyzed,
             'insights_count': len(insights),
             'insights': insights
         }
 
+    @cached_insight
     def analyze_trends(
         self,
         customer_id: str,
         campaign_id: Optional[str] = None,
-        lookback_days: int = 30
+        lookback_days: int = 30,
+        include_daily: bool = True
     ) -> Dict[str, Any]:
         """Analyze performance trends and detect anomalies.
 
@@ -177,75 +597,90 @@ class InsightsManager:
             customer_id: Customer ID (without hyphens)
             campaign_id: Optional campaign ID filter
             lookback_days: Number of days to analyze
+            include_daily: Include the per-day metrics under 'daily_data'
 
         Returns:
             Trend analysis with anomaly detection
         """
-        ga_service = self.client.get_service("GoogleAdsService")
-
         # Get daily performance data
-        query = f"""
-            SELECT
-                segments.date,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.ctr,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM campaign
-            WHERE segments.date DURING LAST_{lookback_days}_DAYS
-        """
-
-        if campaign_id:
-            query += f" AND campaign.id = {campaign_id}"
-
-        query += " ORDER BY segments.date"
+        query = TRENDS_QUERY.format(
+            lookback_days=lookback_days,
+            campaign_filter=f" AND campaign.id = {campaign_id}" if campaign_id else ""
+        )
+
+        # Single pass: the per-day values needed for the half-period split and
+        # anomaly scoring are kept as flat double arrays, and per-day dicts are
+        # only built on request
+        dates: List[str] = []
+        costs = array('d')
+        clicks = array('d')
+        conversions = array('d')
+        daily_data = [] if include_daily else None
+
+        for row in self._search_rows(customer_id, query):
+            metrics = row.metrics
+            day = str(row.segments.date)
+            cost = metrics.cost_micros * MICROS_TO_UNITS
 
-        response = ga_service.search(customer_id=customer_id, query=query)
+            dates.append(day)
+            costs.append(cost)
+            clicks.append(metrics.clicks)
+            conversions.append(metrics.conversions)
 
-        # Collect daily data
-        daily_data = []
-        for row in response:
-            daily_data.append({
-                'date': str(row.segments.date),
-                'impressions': row.metrics.impressions,
-                'clicks': row.metrics.clicks,
-                'ctr': row.metrics.ctr,
-                'cost': row.metrics.cost_micros / 1_000_000,
-                'conversions': row.metrics.conversions
-            })
+            if daily_data is not None:
+                daily_data.append({
+                    'date': day,
+                    'impressions': metrics.impressions,
+                    'clicks': metrics.clicks,
+                    'ctr': metrics.ctr,
+                    'cost': cost,
+                    'conversions': metrics.conversions
+                })
 
-        if not daily_data:
+        data_points = len(dates)
+        if not data_points:
             return {'error': 'No data available for trend analysis'}
 
-        # Calculate trends
-        costs = [d['cost'] for d in daily_data]
-        conversions = [d['conversions'] for d in daily_data]
-        ctrs = [d['ctr'] for d in daily_data]
+        cost_values = np.frombuffer(costs, dtype=np.float64)
+        conversion_values = np.frombuffer(conversions, dtype=np.float64)
 
         # Simple trend detection (comparing first half vs second half)
-        mid_point = len(daily_data) // 2
-
-        cost_first_half = sum(costs[:mid_point]) / mid_point if mid_point > 0 else 0
-        cost_second_half = sum(costs[mid_point:]) / (len(costs) - mid_point) if mid_point < len(costs) else 0
+        mid_point = data_points // 2
 
-        conv_first_half = sum(conversions[:mid_point]) / mid_point if mid_point > 0 else 0
-        conv_second_half = sum(conversions[mid_point:]) / (len(conversions) - mid_point) if mid_point < len(conversions) else 0
+        cost_first_half, cost_second_half = _half_means(cost_values, mid_point)
+        conv_first_half, conv_second_half = _half_means(conversion_values, mid_point)
 
-        # Detect anomalies (values beyond 2 standard deviations)
+        # Detect anomalies: cost spikes/drops against the median and MAD, which
+        # the outliers themselves cannot inflate, then days whose cost, clicks
+        # and conversions are jointly unusual
         anomalies = []
-        if len(costs) > 3:
-            cost_mean = statistics.mean(costs)
-            cost_stdev = statistics.stdev(costs)
-
-            for i, day in enumerate(daily_data):
-                if abs(day['cost'] - cost_mean) > 2 * cost_stdev:
-                    anomalies.append({
-                        'date': day['date'],
-                        'metric': 'cost',
-                        'value': day['cost'],
-                        'deviation': abs(day['cost'] - cost_mean) / cost_stdev
-                    })
+        if data_points > 3:
+            cost_scores = _robust_z_scores(cost_values)
+            flagged = set()
+
+            for i in np.flatnonzero(cost_scores > ROBUST_Z_THRESHOLD):
+                flagged.add(i)
+                anomalies.append({
+                    'date': dates[i],
+                    'metric': 'cost',
+                    'value': costs[i],
+                    'deviation': float(cost_scores[i])
+                })
+
+            samples = np.column_stack(
+                (cost_values, np.frombuffer(clicks, dtype=np.float64), conversion_values)
+            )
+            combined_scores = _squared_mahalanobis(samples)
+
+            if combined_scores is not None:
+                for i in np.flatnonzero(combined_scores > MULTI_METRIC_THRESHOLD):
+                    if i not in flagged:
+                        anomalies.append({
+                            'date': dates[i],
+                            'metric': 'combined',
+                            'value': costs[i],
+                            'deviation': float(np.sqrt(combined_scores[i]))
+                        })
 
         # Calculate trend direction
         cost_trend = "INCREASING" if cost_second_half > cost_first_half * 1.1 else \
@@ -254,19 +689,24 @@ class InsightsManager:
         conv_trend = "INCREASING" if conv_second_half > conv_first_half * 1.1 else \
                      "DECREASING" if conv_second_half < conv_first_half * 0.9 else "STABLE"
 
-        return {
+        result = {
             'lookback_days': lookback_days,
-            'data_points': len(daily_data),
+            'data_points': data_points,
             'trends': {
                 'cost_trend': cost_trend,
                 'cost_change_pct': ((cost_second_half - cost_first_half) / cost_first_half * 100) if cost_first_half > 0 else 0,
                 'conversion_trend': conv_trend,
                 'conversion_change_pct': ((conv_second_half - conv_first_half) / conv_first_half * 100) if conv_first_half > 0 else 0
             },
-            'anomalies': anomalies,
-            'daily_data': daily_data
+            'anomalies': anomalies
         }
 
+        if include_daily:
+            result['daily_data'] = daily_data
+
+        return result
+
+    @cached_insight
     def get_budget_pacing(
         self,
         customer_id: str,
@@ -281,44 +721,67 @@ class InsightsManager:
         Returns:
             Budget pacing analysis
         """
-        ga_service = self.client.get_service("GoogleAdsService")
-
         # Get campaign budget and current month spend
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign_budget.amount_micros,
-                campaign_budget.period,
-                metrics.cost_micros
-            FROM campaign
-            WHERE campaign.id = {campaign_id}
-              AND segments.date DURING THIS_MONTH
-        """
+        query = BUDGET_PACING_QUERY.format(campaign_filter=f"campaign.id = {campaign_id}")
 
-        response = ga_service.search(customer_id=customer_id, query=query)
-        results = list(response)
+        row = next(self._search_rows(customer_id, query), None)
 
-        if not results:
+        if row is None:
             return {'error': 'Campaign not found or no data available'}
 
-        row = results[0]
+        return self._budget_pacing_from_row(campaign_id, row, date.today())
+
+    def get_budget_pacing_bulk(
+        self,
+        customer_id: str,
+        campaign_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Analyze budget pacing for several campaigns with a single query.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            campaign_ids: Campaign IDs
 
+        Returns:
+            Budget pacing analysis keyed by campaign ID
+
+        Raises:
+            ValueError: If any campaign ID is not numeric
+        """
+        if not campaign_ids:
+            return {}
+
+        query = BUDGET_PACING_QUERY.format(
+            campaign_filter=_campaign_id_filter(campaign_ids)
+        )
+
+        today = date.today()
+        results = {
+            str(row.campaign.id): self._budget_pacing_from_row(str(row.campaign.id), row, today)
+            for row in self._search_rows(customer_id, query)
+        }
+
+        for campaign_id in campaign_ids:
+            results.setdefault(campaign_id, {'error': 'Campaign not found or no data available'})
+
+        return results
+
+    def _budget_pacing_from_row(self, campaign_id: str, row: Any, today: date) -> Dict[str, Any]:
+        """Build the budget pacing analysis for one campaign row as of today."""
         # Calculate pacing
-        now = datetime.now()
-        days_in_month = (datetime(now.year, now.month + 1, 1) - timedelta(days=1)).day if now.month < 12 else 31
-        days_elapsed = now.day
+        days_in_month = calendar.monthrange(today.year, today.month)[1]
+        days_elapsed = today.day
         days_remaining = days_in_month - days_elapsed
 
-        budget_period = row.campaign_budget.period.name
+        budget_period = _enum_name(row.campaign_budget, 'period')
 
         if budget_period == "DAILY":
-            daily_budget = row.campaign_budget.amount_micros / 1_000_000
+            daily_budget = row.campaign_budget.amount_micros * MICROS_TO_UNITS
             monthly_budget = daily_budget * days_in_month
         else:
-            monthly_budget = row.campaign_budget.amount_micros / 1_000_000
+            monthly_budget = row.campaign_budget.amount_micros * MICROS_TO_UNITS
 
-        current_spend = row.metrics.cost_micros / 1_000_000
+        current_spend = row.metrics.cost_micros * MICROS_TO_UNITS
         expected_spend = (monthly_budget / days_in_month) * days_elapsed
 
         pace_percentage = (current_spend / expected_spend * 100) if expected_spend > 0 else 0
@@ -351,6 +814,7 @@ class InsightsManager:
             'message': message
         }
 
+    @cached_insight
     def get_budget_recommendations(
         self,
         customer_id: str,
@@ -365,35 +829,18 @@ class InsightsManager:
         Returns:
             List of budget recommendations
         """
-        ga_service = self.client.get_service("GoogleAdsService")
-
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign_budget.amount_micros,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.cost_per_conversion,
-                metrics.search_budget_lost_impression_share,
-                metrics.conversions_value
-            FROM campaign
-            WHERE segments.date DURING {date_range}
-              AND campaign.status = 'ENABLED'
-            ORDER BY metrics.cost_micros DESC
-        """
-
-        response = ga_service.search(customer_id=customer_id, query=query)
+        query = BUDGET_RECOMMENDATIONS_QUERY.format(date_range=date_range)
 
         recommendations = []
 
-        for row in response:
+        for row in self._search_rows(customer_id, query):
             campaign = row.campaign
             metrics = row.metrics
             budget = row.campaign_budget
 
-            daily_budget = budget.amount_micros / 1_000_000
-            avg_daily_spend = (metrics.cost_micros / 1_000_000) / 30  # Approximate
+            cost = metrics.cost_micros * MICROS_TO_UNITS
+            daily_budget = budget.amount_micros * MICROS_TO_UNITS
+            avg_daily_spend = cost / 30  # Approximate
 
             # Identify budget-constrained campaigns
             if metrics.search_budget_lost_impression_share > 0.2:
@@ -428,7 +875,7 @@ class InsightsManager:
 
             # Identify high ROAS campaigns
             if metrics.conversions > 0:
-                roas = metrics.conversions_value / (metrics.cost_micros / 1_000_000)
+                roas = metrics.conversions_value / cost
                 if roas > 4.0 and avg_daily_spend < daily_budget * 0.8:
                     recommendations.append({
                         'campaign_id': str(campaign.id),
@@ -444,6 +891,7 @@ class InsightsManager:
 
         return sorted(recommendations, key=lambda x: 1 if x['priority'] == 'HIGH' else 2)
 
+    @cached_insight
     def analyze_wasted_spend(
         self,
         customer_id: str,
@@ -460,48 +908,64 @@ class InsightsManager:
         Returns:
             Wasted spend analysis
         """
-        ga_service = self.client.get_service("GoogleAdsService")
-
         # Analyze keywords with high cost but no conversions
-        keyword_query = f"""
-            SELECT
-                ad_group.id,
-                ad_group.name,
-                campaign.name,
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                metrics.cost_micros,
-                metrics.clicks,
-                metrics.conversions
-            FROM keyword_view
-            WHERE segments.date DURING {date_range}
-              AND metrics.cost_micros > {int(min_cost * 1_000_000)}
-            ORDER BY metrics.cost_micros DESC
-            LIMIT 50
-        """
-
-        keyword_response = ga_service.search(customer_id=customer_id, query=keyword_query)
-
-        wasted_keywords = []
-        for row in keyword_response:
-            cost = row.metrics.cost_micros / 1_000_000
-            if row.metrics.conversions == 0 and cost > min_cost:
-                wasted_keywords.append({
-                    'keyword': row.ad_group_criterion.keyword.text,
-                    'match_type': row.ad_group_criterion.keyword.match_type.name,
-                    'campaign': row.campaign.name,
-                    'ad_group': row.ad_group.name,
-                    'cost': cost,
-                    'clicks': row.metrics.clicks,
-                    'conversions': row.metrics.conversions
-                })
-
-        total_wasted = sum(k['cost'] for k in wasted_keywords)
+        keyword_query = WASTED_SPEND_QUERY.format(
+            date_range=date_range,
+            min_cost_micros=int(min_cost * 1_000_000),
+            limit=WASTED_SPEND_ROW_LIMIT
+        )
+
+        # Numeric columns go into preallocated arrays so the waste filter and
+        # total run vectorized; text columns stay in lists
+        costs = np.empty(WASTED_SPEND_ROW_LIMIT, dtype=np.float64)
+        clicks = np.empty(WASTED_SPEND_ROW_LIMIT, dtype=np.int64)
+        conversions = np.empty(WASTED_SPEND_ROW_LIMIT, dtype=np.float64)
+        keywords, match_types, campaigns, ad_groups = [], [], [], []
+
+        get_keyword = attrgetter('ad_group_criterion.keyword')
+
+        count = 0
+        for row in self._search_rows(customer_id, keyword_query):
+            if count == WASTED_SPEND_ROW_LIMIT:
+                break
+            keyword = get_keyword(row)
+            costs[count] = row.metrics.cost_micros * MICROS_TO_UNITS
+            clicks[count] = row.metrics.clicks
+            conversions[count] = row.metrics.conversions
+            keywords.append(keyword.text)
+            match_types.append(_enum_name(keyword, 'match_type'))
+            campaigns.append(row.campaign.name)
+            ad_groups.append(row.ad_group.name)
+            count += 1
+
+        costs, clicks, conversions = costs[:count], clicks[:count], conversions[:count]
+
+        wasted = np.flatnonzero((conversions == 0) & (costs > min_cost))
+        total_wasted = float(costs[wasted].sum())
+
+        # Partial sort: select the highest-cost wasters, then order only those
+        wasted_costs = costs[wasted]
+        candidates = np.arange(len(wasted))
+        if len(wasted) > TOP_WASTERS_COUNT:
+            candidates = np.argpartition(-wasted_costs, TOP_WASTERS_COUNT - 1)[:TOP_WASTERS_COUNT]
+        top = wasted[candidates[np.argsort(-wasted_costs[candidates], kind='stable')]]
+        top_wasters = [
+            {
+                'keyword': keywords[i],
+                'match_type': match_types[i],
+                'campaign': campaigns[i],
+                'ad_group': ad_groups[i],
+                'cost': float(costs[i]),
+                'clicks': int(clicks[i]),
+                'conversions': float(conversions[i])
+            }
+            for i in top
+        ]
 
         # Categorize waste types
         waste_categories = {
             'non_converting_keywords': {
-                'count': len(wasted_keywords),
+                'count': len(wasted),
                 'cost': total_wasted,
                 'description': 'Keywords with spend but no conversions'
             }
@@ -511,7 +975,7 @@ class InsightsManager:
             'date_range': date_range,
             'total_wasted_spend': total_wasted,
             'waste_categories': waste_categories,
-            'top_wasters': wasted_keywords[:10],
+            'top_wasters': top_wasters,
             'recommendations': [
                 'Add non-converting keywords as negatives',
                 'Review keyword match types (consider using phrase/exact instead of broad)',
@@ -519,6 +983,7 @@ class InsightsManager:
             ]
         }
 
+    @cached_insight
     def get_auction_insights(
         self,
         customer_id: str,
@@ -535,30 +1000,57 @@ class InsightsManager:
         Returns:
             Auction insights data
         """
-        ga_service = self.client.get_service("GoogleAdsService")
-
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                metrics.search_impression_share,
-                metrics.search_rank_lost_impression_share,
-                metrics.search_budget_lost_impression_share,
-                metrics.search_top_impression_share,
-                metrics.search_absolute_top_impression_share,
-                metrics.search_exact_match_impression_share
-            FROM campaign
-            WHERE campaign.id = {campaign_id}
-              AND segments.date DURING {date_range}
-        """
+        query = AUCTION_INSIGHTS_QUERY.format(
+            campaign_filter=f"campaign.id = {campaign_id}",
+            date_range=date_range
+        )
 
-        response = ga_service.search(customer_id=customer_id, query=query)
-        results = list(response)
+        row = next(self._search_rows(customer_id, query), None)
 
-        if not results:
+        if row is None:
             return {'error': 'No auction insights data available'}
 
-        row = results[0]
+        return self._auction_insights_from_row(campaign_id, row)
+
+    def get_auction_insights_bulk(
+        self,
+        customer_id: str,
+        campaign_ids: List[str],
+        date_range: str = "LAST_30_DAYS"
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get auction insights for several campaigns with a single query.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            campaign_ids: Campaign IDs
+            date_range: Date range
+
+        Returns:
+            Auction insights data keyed by campaign ID
+
+        Raises:
+            ValueError: If any campaign ID is not numeric
+        """
+        if not campaign_ids:
+            return {}
+
+        query = AUCTION_INSIGHTS_QUERY.format(
+            campaign_filter=_campaign_id_filter(campaign_ids),
+            date_range=date_range
+        )
+
+        results = {
+            str(row.campaign.id): self._auction_insights_from_row(str(row.campaign.id), row)
+            for row in self._search_rows(customer_id, query)
+        }
+
+        for campaign_id in campaign_ids:
+            results.setdefault(campaign_id, {'error': 'No auction insights data available'})
+
+        return results
+
+    def _auction_insights_from_row(self, campaign_id: str, row: Any) -> Dict[str, Any]:
+        """Build the auction insights analysis for one campaign row."""
         metrics = row.metrics
 
         # Calculate competitive position
@@ -605,18 +1097,11 @@ class InsightsManager:
         top_is: float
     ) -> List[str]:
         """Generate auction-specific recommendations."""
-        recommendations = []
-
-        if budget_lost > 0.15:
-            recommendations.append("Increase daily budget to capture more impressions")
-
-        if rank_lost > 0.15:
-            recommendations.append("Improve Quality Score or increase bids to improve ad rank")
-
-        if top_is < 0.3:
-            recommendations.append("Increase bids to show in top positions more often")
-
-        if impression_share < 0.5:
-            recommendations.append("Review targeting settings - may be too restrictive")
-
-        return recommendations if recommendations else ["Continue current strategy"]
+        mask = (
+            (budget_lost > 0.15)
+            | (rank_lost > 0.15) << 1
+            | (top_is < 0.3) << 2
+            | (impression_share < 0.5) << 3
+        )
+
+        return list(_AUCTION_RECS[mask]) or ["Continue current strategy"]
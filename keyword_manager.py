@@ -13,13 +13,35 @@ Provides complete keyword lifecycle management including:
 """
 
 from google.ads.googleads.client import GoogleAdsClient
-from typing import Optional, List, Dict, Any
+from google.protobuf import field_mask_pb2
+from typing import Optional, List, Dict, Any, Iterator, NamedTuple, Tuple
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from logger import get_logger
+from cache_manager import get_cache_manager, ResourceType
+import sys
+import threading
+import weakref
+import numpy as np
+import proto
 
 logger = get_logger(__name__)
 
+# Bulk mutations are split into requests of at most this many operations,
+# well below the API's per-request limit, with a bounded number in flight
+MUTATE_CHUNK_SIZE = 1000
+MUTATE_MAX_CONCURRENCY = 8
+
+# Service clients shared by every KeywordManager built on the same
+# GoogleAdsClient, keyed by service name. Each get_service call opens a new
+# gRPC channel, so reusing the services keeps one warm HTTP/2 connection per
+# service for the whole session instead of a new TLS handshake per tool call.
+# Entries go away with their GoogleAdsClient.
+_services: "weakref.WeakKeyDictionary[GoogleAdsClient, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_services_lock = threading.Lock()
+
 
 # ============================================================================
 # Enums and Data Classes
@@ -41,13 +63,152 @@ class KeywordStatus(str, Enum):
 
 @dataclass
 class KeywordConfig:
-    """Configuration for adding a keyword."""
+    """Configuration for adding a keyword.
+
+    final_urls takes any number of landing pages; final_url is kept for
+    existing callers and is used only when final_urls is not set.
+    """
     text: str
     match_type: KeywordMatchType
     ad_group_id: str
     cpc_bid_micros: Optional[int] = None
     final_url: Optional[str] = None
     status: KeywordStatus = KeywordStatus.ENABLED
+    final_urls: Optional[List[str]] = None
+
+
+class KeywordPerformanceRow(NamedTuple):
+    """One keyword performance report row, stored flat without per-row dicts."""
+    criterion_id: str
+    keyword_text: str
+    match_type: str
+    status: str
+    quality_score: Optional[int]
+    ad_group_id: str
+    ad_group_name: str
+    campaign_id: str
+    campaign_name: str
+    impressions: int
+    clicks: int
+    ctr: float
+    conversions: float
+    conversions_value: float
+    cpc_bid: Optional[float]
+    average_cpc: float
+    cost: float
+    cost_per_conversion: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the nested dict layout used in JSON responses."""
+        return {
+            "criterion_id": self.criterion_id,
+            "keyword_text": self.keyword_text,
+            "match_type": self.match_type,
+            "status": self.status,
+            "cpc_bid": self.cpc_bid,
+            "quality_score": self.quality_score,
+            "ad_group": {
+                "id": self.ad_group_id,
+                "name": self.ad_group_name
+            },
+            "campaign": {
+                "id": self.campaign_id,
+                "name": self.campaign_name
+            },
+            "metrics": {
+                "impressions": self.impressions,
+                "clicks": self.clicks,
+                "ctr": self.ctr,
+                "average_cpc": self.average_cpc,
+                "cost": self.cost,
+                "conversions": self.conversions,
+                "conversions_value": self.conversions_value,
+                "cost_per_conversion": self.cost_per_conversion
+            }
+        }
+
+
+class QualityScoreHistoryRow(NamedTuple):
+    """One dated quality score reading for a keyword."""
+    date: str
+    campaign_id: int
+    campaign_name: str
+    ad_group_id: int
+    ad_group_name: str
+    keyword_id: int
+    keyword_text: str
+    match_type: str
+    quality_score: int
+    creative_quality_score: str
+    landing_page_experience: str
+    expected_ctr: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict for JSON responses."""
+        return self._asdict()
+
+
+def _shared_service(client: GoogleAdsClient, name: str) -> Any:
+    """Return a service for a client, creating it on first use.
+
+    Args:
+        client: Authenticated GoogleAdsClient instance
+        name: Service name, e.g. "GoogleAdsService"
+
+    Returns:
+        Service client bound to one shared gRPC channel
+    """
+    with _services_lock:
+        services = _services.setdefault(client, {})
+        service = services.get(name)
+        if service is None:
+            service = services[name] = client.get_service(name)
+        return service
+
+
+def _enum_name(message: Any, field_name: str) -> str:
+    """
+    Resolve an enum field of a raw protobuf message to its value name.
+
+    Args:
+        message: Raw protobuf message
+        field_name: Enum field name
+
+    Returns:
+        Enum value name ("UNKNOWN" for values newer than this client),
+        interned so rows share one copy of each name
+    """
+    field = message.DESCRIPTOR.fields_by_name[field_name]
+    value = field.enum_type.values_by_number.get(getattr(message, field_name))
+    return sys.intern(value.name) if value is not None else "UNKNOWN"
+
+
+def _gaql_count(value: Any, name: str) -> int:
+    """
+    Validate a non-negative integer before it is interpolated into GAQL.
+
+    Args:
+        value: Value to validate
+        name: Parameter name for the error message
+
+    Returns:
+        The value as an int
+
+    Raises:
+        ValueError: If the value is not a non-negative integer
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"{name} must be a non-negative integer, got {value!r}")
+
+    try:
+        count = int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a non-negative integer, got {value!r}")
+
+    if count < 0:
+        raise ValueError(f"{name} must be a non-negative integer, got {value!r}")
+
+    return count
 
 
 # ============================================================================
@@ -57,88 +218,616 @@ class KeywordConfig:
 class KeywordManager:
     """Manages Google Ads keywords."""
 
+    # Fixed SELECT/FROM clauses of the read queries; methods append only the
+    # WHERE, ORDER BY and LIMIT clauses
+    _KW_PERF_SELECT = """
+            SELECT
+                ad_group_criterion.criterion_id,
+                ad_group_criterion.keyword.text,
+                ad_group_criterion.keyword.match_type,
+                ad_group_criterion.status,
+                ad_group_criterion.cpc_bid_micros,
+                ad_group_criterion.quality_info.quality_score,
+                ad_group.id,
+                ad_group.name,
+                campaign.id,
+                campaign.name,
+                metrics.impressions,
+                metrics.clicks,
+                metrics.ctr,
+                metrics.average_cpc,
+                metrics.cost_micros,
+                metrics.conversions,
+                metrics.conversions_value,
+                metrics.cost_per_conversion
+            FROM keyword_view
+    """
+
+    _KW_LIST_SELECT = """
+            SELECT
+                ad_group_criterion.criterion_id,
+                ad_group_criterion.keyword.text,
+                ad_group_criterion.keyword.match_type,
+                ad_group_criterion.status,
+                ad_group_criterion.cpc_bid_micros,
+                ad_group_criterion.negative
+            FROM ad_group_criterion
+    """
+
+    _KW_QUALITY_SELECT = """
+            SELECT
+                ad_group_criterion.criterion_id,
+                ad_group_criterion.keyword.text,
+                ad_group_criterion.keyword.match_type,
+                ad_group_criterion.quality_info.quality_score,
+                ad_group_criterion.quality_info.creative_quality_score,
+                ad_group_criterion.quality_info.post_click_quality_score,
+                ad_group_criterion.quality_info.search_predicted_ctr
+            FROM ad_group_criterion
+    """
+
+    _SEARCH_TERMS_SELECT = """
+            SELECT
+                search_term_view.search_term,
+                search_term_view.status,
+                ad_group.id,
+                ad_group_criterion.keyword.text,
+                metrics.impressions,
+                metrics.clicks,
+                metrics.ctr,
+                metrics.cost_micros,
+                metrics.conversions
+            FROM search_term_view
+    """
+
+    _QS_HISTORY_SELECT = (
+        "SELECT ad_group_criterion.criterion_id,"
+        " ad_group_criterion.keyword.text,"
+        " ad_group_criterion.keyword.match_type,"
+        " ad_group_criterion.quality_info.quality_score,"
+        " ad_group_criterion.quality_info.creative_quality_score,"
+        " ad_group_criterion.quality_info.post_click_quality_score,"
+        " ad_group_criterion.quality_info.search_predicted_ctr,"
+        " ad_group.id, ad_group.name,"
+        " campaign.id, campaign.name,"
+        " segments.date"
+        " FROM keyword_view"
+        " WHERE ad_group_criterion.type = 'KEYWORD'"
+    )
+
+    # Update masks for keyword updates. They do not depend on the client or API
+    # version, so they are built once at class load and copied into each
+    # operation
+    _BID_FIELD_MASK = field_mask_pb2.FieldMask(paths=["cpc_bid_micros"])
+    _STATUS_FIELD_MASK = field_mask_pb2.FieldMask(paths=["status"])
+    _BID_AND_STATUS_FIELD_MASK = field_mask_pb2.FieldMask(paths=["cpc_bid_micros", "status"])
+
     def __init__(self, client: GoogleAdsClient):
         """
         Initialize the keyword manager.
 
+        Read methods decode result rows as raw protobuf messages whether or
+        not the client uses proto-plus, so large reports skip proto-plus
+        field wrapping.
+
         Args:
             client: Authenticated Google Ads client
         """
         self.client = client
 
+        # Service, type and enum handles used by every read and mutate path
+        self._ga_service = _shared_service(client, "GoogleAdsService")
+        self._mutate_operation_type = type(client.get_type("MutateOperation"))
+        self._mutate_request_type = type(client.get_type("MutateGoogleAdsRequest"))
+        self._failure_type = type(client.get_type("GoogleAdsFailure"))
+        self._match_types = {
+            match_type.value: client.enums.KeywordMatchTypeEnum[match_type.value]
+            for match_type in KeywordMatchType
+        }
+        self._statuses = {
+            status.value: client.enums.AdGroupCriterionStatusEnum[status.value]
+            for status in KeywordStatus
+        }
+
+    @staticmethod
+    def _path_to_ids(resource_name: str) -> Tuple[str, ...]:
+        """
+        Split a resource name into its IDs.
+
+        For example "customers/1/adGroupCriteria/2~3" gives ("1", "2", "3"),
+        so created keywords can be updated without querying for their IDs.
+
+        Args:
+            resource_name: Resource name returned by a mutate
+
+        Returns:
+            Customer ID followed by the resource's own ID components
+        """
+        _, customer_id, _, resource_id = resource_name.split("/")
+        return (customer_id, *resource_id.split("~"))
+
+    def _search_rows(self, customer_id: str, query: str) -> Iterator[Any]:
+        """
+        Run a GAQL query and yield its rows as raw protobuf messages.
+
+        Args:
+            customer_id: Customer ID
+            query: GAQL query
+
+        Yields:
+            GoogleAdsRow protobuf messages
+        """
+        response = self._ga_service.search(customer_id=customer_id, query=query)
+
+        for page in response.pages:
+            if isinstance(page, proto.Message):
+                page = type(page).pb(page)
+            yield from page.results
+
+    def _stream_batches(self, customer_id: str, query: str) -> Iterator[Any]:
+        """
+        Run a GAQL query over search_stream and yield each batch of rows.
+
+        Large reports arrive in server-sized batches over one gRPC call instead
+        of page-by-page round trips. Only one stream is opened per call.
+
+        Args:
+            customer_id: Customer ID
+            query: GAQL query
+
+        Yields:
+            Sequences of GoogleAdsRow protobuf messages, one per batch
+        """
+        stream = self._ga_service.search_stream(customer_id=customer_id, query=query)
+
+        for batch in stream:
+            if isinstance(batch, proto.Message):
+                batch = type(batch).pb(batch)
+            yield batch.results
+
+    def _stream_rows(self, customer_id: str, query: str) -> Iterator[Any]:
+        """
+        Run a GAQL query over search_stream and yield its rows as raw protobuf.
+
+        Args:
+            customer_id: Customer ID
+            query: GAQL query
+
+        Yields:
+            GoogleAdsRow protobuf messages
+        """
+        for results in self._stream_batches(customer_id, query):
+            yield from results
+
     # ========================================================================
-    # Keyword Addition
+    # Operation Building
     # ========================================================================
 
-    def add_keywords(
+    def _new_criterion_operation(self) -> Tuple[Any, Any]:
+        """
+        Create a MutateOperation wrapping an AdGroupCriterionOperation.
+
+        Returns:
+            Tuple of (MutateOperation, its AdGroupCriterionOperation)
+        """
+        mutate_operation = self._mutate_operation_type()
+        return mutate_operation, mutate_operation.ad_group_criterion_operation
+
+    def _keyword_create_operation(
+        self,
+        customer_id: str,
+        kw_config: KeywordConfig
+    ) -> Any:
+        """
+        Build the MutateOperation that adds a keyword.
+
+        Args:
+            customer_id: Customer ID
+            kw_config: Keyword configuration
+
+        Returns:
+            MutateOperation
+        """
+        mutate_operation = self._mutate_operation_type()
+        criterion = mutate_operation.ad_group_criterion_operation.create
+
+        # Set ad group; resource paths are plain string formatting, so they
+        # are built here rather than through the service path helpers
+        criterion.ad_group = f"customers/{customer_id}/adGroups/{kw_config.ad_group_id}"
+
+        # Set keyword
+        criterion.keyword.text = kw_config.text
+        criterion.keyword.match_type = self._match_types[kw_config.match_type.value]
+
+        # Set status
+        criterion.status = self._statuses[kw_config.status.value]
+
+        # Set CPC bid if provided
+        if kw_config.cpc_bid_micros:
+            criterion.cpc_bid_micros = kw_config.cpc_bid_micros
+
+        # Set final URLs if provided
+        if kw_config.final_urls:
+            criterion.final_urls.extend(kw_config.final_urls)
+        elif kw_config.final_url:
+            criterion.final_urls.append(kw_config.final_url)
+
+        return mutate_operation
+
+    def _negative_keyword_operation(
+        self,
+        customer_id: str,
+        ad_group_id: str,
+        keyword: Dict[str, str]
+    ) -> Any:
+        """
+        Build the MutateOperation that adds a negative keyword.
+
+        Args:
+            customer_id: Customer ID
+            ad_group_id: Ad group ID
+            keyword: Dict with 'text' and 'match_type'
+
+        Returns:
+            MutateOperation
+        """
+        mutate_operation, operation = self._new_criterion_operation()
+        criterion = operation.create
+
+        # Set ad group
+        criterion.ad_group = f"customers/{customer_id}/adGroups/{ad_group_id}"
+
+        # Set keyword
+        criterion.keyword.text = keyword['text']
+        criterion.keyword.match_type = self._match_types[keyword['match_type'].upper()]
+
+        # Mark as negative
+        criterion.negative = True
+
+        return mutate_operation
+
+    def _keyword_update_operation(
+        self,
+        customer_id: str,
+        ad_group_id: str,
+        criterion_id: str,
+        cpc_bid_micros: Optional[int] = None,
+        status: Optional[KeywordStatus] = None
+    ) -> Any:
+        """
+        Build the MutateOperation that updates a keyword's bid and/or status.
+
+        Args:
+            customer_id: Customer ID
+            ad_group_id: Ad group ID
+            criterion_id: Keyword criterion ID
+            cpc_bid_micros: New CPC bid in micros
+            status: New status
+
+        Returns:
+            MutateOperation
+        """
+        mutate_operation, operation = self._new_criterion_operation()
+        criterion = operation.update
+
+        criterion.resource_name = (
+            f"customers/{customer_id}/adGroupCriteria/{ad_group_id}~{criterion_id}"
+        )
+
+        if cpc_bid_micros is not None:
+            criterion.cpc_bid_micros = cpc_bid_micros
+        if status is not None:
+            criterion.status = self._statuses[status.value]
+
+        # Set field mask
+        if status is None:
+            field_mask = self._BID_FIELD_MASK
+        elif cpc_bid_micros is None:
+            field_mask = self._STATUS_FIELD_MASK
+        else:
+            field_mask = self._BID_AND_STATUS_FIELD_MASK
+        self.client.copy_from(operation.update_mask, field_mask)
+
+        return mutate_operation
+
+    def _submit_mutate_operations(
+        self,
+        customer_id: str,
+        mutate_operations: List[Any],
+        partial_failure: bool = True
+    ) -> Any:
+        """
+        Submit operations of any resource type in one GoogleAdsService.mutate call.
+
+        With partial_failure, valid operations are committed even if others
+        fail, so one bad row does not force the whole batch to be retried.
+        Failed operations come back with an empty response; use
+        _partial_failures() to find them.
+
+        Args:
+            customer_id: Customer ID
+            mutate_operations: MutateOperation messages
+            partial_failure: Commit valid operations even if others fail
+
+        Returns:
+            MutateGoogleAdsResponse, with mutate_operation_responses in input order
+        """
+        request = self._mutate_request_type()
+        request.customer_id = customer_id
+        request.mutate_operations.extend(mutate_operations)
+        request.partial_failure = partial_failure
+
+        return self._ga_service.mutate(request=request)
+
+    def _partial_failures(self, response: Any, offset: int = 0) -> Dict[str, List[Any]]:
+        """
+        Decode the partial failure error of a mutate response.
+
+        Args:
+            response: MutateGoogleAdsResponse from a partial_failure request
+            offset: Added to each operation index, for chunked submissions
+
+        Returns:
+            Dict with 'failed_indexes' (operation indexes in input order) and
+            'failure_messages' (matching error messages); both empty when
+            every operation succeeded
+        """
+        failed_indexes = []
+        failure_messages = []
+        status = response.partial_failure_error
+
+        if not status or not status.code:
+            return {"failed_indexes": failed_indexes, "failure_messages": failure_messages}
+
+        for detail in status.details:
+            failure = self._failure_type.deserialize(detail.value)
+            for error in failure.errors:
+                path = error.location.field_path_elements
+                failed_indexes.append(offset + path[0].index if path else None)
+                failure_messages.append(error.message)
+
+        return {"failed_indexes": failed_indexes, "failure_messages": failure_messages}
+
+    def _submit_in_chunks(
         self,
         customer_id: str,
-        keywords: List[KeywordConfig]
+        mutate_operations: List[Any],
+        chunk_size: int = MUTATE_CHUNK_SIZE,
+        max_concurrency: int = MUTATE_MAX_CONCURRENCY
+    ) -> Tuple[List[Tuple[int, Any]], List[Exception]]:
+        """
+        Submit operations in chunks of at most chunk_size, concurrently.
+
+        A single chunk is submitted on the calling thread. Chunks that fail as
+        a whole are logged and returned as errors so the others still apply.
+
+        Args:
+            customer_id: Customer ID
+            mutate_operations: MutateOperation messages
+            chunk_size: Maximum operations per mutate request
+            max_concurrency: Maximum mutate requests in flight at once
+
+        Returns:
+            Tuple of (start index, response) pairs for the chunks that were
+            submitted, in input order, and the errors of the chunks that failed
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}")
+
+        if not mutate_operations:
+            return [], []
+
+        if len(mutate_operations) <= chunk_size:
+            return [(0, self._submit_mutate_operations(customer_id, mutate_operations))], []
+
+        starts = range(0, len(mutate_operations), chunk_size)
+        responses = []
+        errors = []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(starts)))) as executor:
+            futures = [
+                (start, executor.submit(
+                    self._submit_mutate_operations,
+                    customer_id,
+                    mutate_operations[start:start + chunk_size]
+                ))
+                for start in starts
+            ]
+            for start, future in futures:
+                try:
+                    responses.append((start, future.result()))
+                except Exception as e:
+                    size = min(chunk_size, len(mutate_operations) - start)
+                    logger.error(f"Mutate chunk of {size} operations failed: {str(e)}")
+                    errors.append(e)
+
+        return responses, errors
+
+    def mutate_keywords(
+        self,
+        customer_id: str,
+        keywords: Optional[List[KeywordConfig]] = None,
+        negative_keywords: Optional[List[Dict[str, str]]] = None,
+        bid_updates: Optional[List[Dict[str, Any]]] = None,
+        status_updates: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
-        Add keywords to an ad group.
+        Apply keyword additions and updates across ad groups in one request.
 
         Args:
             customer_id: Customer ID
-            keywords: List of keyword configurations
+            keywords: Keyword configurations to add
+            negative_keywords: Dicts with 'ad_group_id', 'text' and 'match_type'
+            bid_updates: Dicts with 'ad_group_id', 'criterion_id', 'cpc_bid_micros'
+            status_updates: Dicts with 'ad_group_id', 'criterion_id', 'status'
 
         Returns:
-            Operation result with added keyword IDs
+            Operation result with per-kind counts and added keyword IDs
         """
-        ad_group_criterion_service = self.client.get_service("AdGroupCriterionService")
-        ad_group_service = self.client.get_service("AdGroupService")
+        keywords = keywords or []
+        negative_keywords = negative_keywords or []
+        bid_updates = bid_updates or []
+        status_updates = status_updates or []
 
-        operations = []
+        build_create = self._keyword_create_operation
+        build_negative = self._negative_keyword_operation
+        build_update = self._keyword_update_operation
 
+        mutate_operations = [None] * (
+            len(keywords) + len(negative_keywords) + len(bid_updates) + len(status_updates)
+        )
+        i = 0
         for kw_config in keywords:
-            operation = self.client.get_type("AdGroupCriterionOperation")
-            criterion = operation.create
+            mutate_operations[i] = build_create(customer_id, kw_config)
+            i += 1
+        for kw in negative_keywords:
+            mutate_operations[i] = build_negative(customer_id, kw['ad_group_id'], kw)
+            i += 1
+        for update in bid_updates:
+            mutate_operations[i] = build_update(
+                customer_id, update['ad_group_id'], update['criterion_id'],
+                cpc_bid_micros=update['cpc_bid_micros']
+            )
+            i += 1
+        for update in status_updates:
+            mutate_operations[i] = build_update(
+                customer_id, update['ad_group_id'], update['criterion_id'],
+                status=KeywordStatus(update['status'])
+            )
+            i += 1
+
+        if not mutate_operations:
+            return {"operations": 0, "message": "No keyword changes requested"}
 
-            # Set ad group
-            criterion.ad_group = ad_group_service.ad_group_path(
-                customer_id, kw_config.ad_group_id
+        response = self._submit_mutate_operations(customer_id, mutate_operations)
+        get_cache_manager().invalidate(customer_id, ResourceType.KEYWORD)
+        failures = self._partial_failures(response)
+
+        # Responses follow input order, so the additions come first; failed
+        # operations leave an empty resource name behind
+        keyword_ids = [
+            rn[rn.rfind("/") + 1:]
+            for rn in (
+                result.ad_group_criterion_result.resource_name
+                for result in response.mutate_operation_responses[:len(keywords)]
             )
+            if rn
+        ]
 
-            # Set keyword
-            criterion.keyword.text = kw_config.text
-            criterion.keyword.match_type = self.client.enums.KeywordMatchTypeEnum[
-                kw_config.match_type.value
-            ]
+        # Count failures per section of the operation list
+        bounds = [
+            len(keywords),
+            len(keywords) + len(negative_keywords),
+            len(keywords) + len(negative_keywords) + len(bid_updates),
+            len(mutate_operations)
+        ]
+        failed = [0, 0, 0, 0]
+        for index in set(failures["failed_indexes"]):
+            if index is not None:
+                failed[next(i for i, bound in enumerate(bounds) if index < bound)] += 1
 
-            # Set status
-            criterion.status = self.client.enums.AdGroupCriterionStatusEnum[
-                kw_config.status.value
-            ]
+        applied = len(mutate_operations) - len(set(failures["failed_indexes"]))
+        logger.info(f"Applied {applied} keyword operations in one request")
+
+        result = {
+            "operations": len(mutate_operations),
+            "keywords_added": len(keyword_ids),
+            "keyword_ids": keyword_ids,
+            "negative_keywords_added": len(negative_keywords) - failed[1],
+            "bids_updated": len(bid_updates) - failed[2],
+            "statuses_updated": len(status_updates) - failed[3],
+            "message": f"Successfully applied {applied} keyword operations"
+        }
+
+        if failures["failed_indexes"]:
+            result.update(failures)
+            result["message"] += f" ({len(mutate_operations) - applied} failed)"
+
+        return result
+
+    # ========================================================================
+    # Keyword Addition
+    # ========================================================================
+
+    def add_keywords(
+        self,
+        customer_id: str,
+        keywords: List[KeywordConfig],
+        chunk_size: int = MUTATE_CHUNK_SIZE,
+        max_concurrency: int = MUTATE_MAX_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """
+        Add keywords to an ad group.
 
-            # Set CPC bid if provided
-            if kw_config.cpc_bid_micros:
-                criterion.cpc_bid_micros = kw_config.cpc_bid_micros
+        Batches larger than chunk_size are split into concurrent mutate
+        requests instead of one request over the per-request operation limit.
+
+        Args:
+            customer_id: Customer ID
+            keywords: List of keyword configurations
+            chunk_size: Maximum operations per mutate request
+            max_concurrency: Maximum mutate requests in flight at once
 
-            # Set final URL if provided
-            if kw_config.final_url:
-                criterion.final_urls.append(kw_config.final_url)
+        Returns:
+            Operation result with added keyword IDs and resource names, in
+            input order
+        """
+        build_operation = self._keyword_create_operation
+        operations = [None] * len(keywords)
 
-            operations.append(operation)
+        for i, kw_config in enumerate(keywords):
+            operations[i] = build_operation(customer_id, kw_config)
 
         # Add keywords
-        response = ad_group_criterion_service.mutate_ad_group_criteria(
-            customer_id=customer_id,
-            operations=operations
+        responses, errors = self._submit_in_chunks(
+            customer_id, operations, chunk_size, max_concurrency
         )
+        get_cache_manager().invalidate(customer_id, ResourceType.KEYWORD)
+
+        resource_names = []
+        failed_indexes = []
+        failure_messages = []
+        for start, response in responses:
+            failures = self._partial_failures(response, offset=start)
+            failed_indexes.extend(failures["failed_indexes"])
+            failure_messages.extend(failures["failure_messages"])
+
+            # Failed operations leave an empty resource name behind
+            resource_names.extend(
+                rn
+                for rn in (
+                    result.ad_group_criterion_result.resource_name
+                    for result in response.mutate_operation_responses
+                )
+                if rn
+            )
 
-        keyword_ids = [
-            result.resource_name.split("/")[-1]
-            for result in response.results
-        ]
+        if errors and not resource_names:
+            raise errors[0]
+
+        keyword_ids = [rn[rn.rfind("/") + 1:] for rn in resource_names]
 
         logger.info(f"Added {len(keyword_ids)} keywords to ad group")
 
-        return {
+        result = {
             "keywords_added": len(keyword_ids),
             "keyword_ids": keyword_ids,
+            "resource_names": resource_names,
             "message": f"Successfully added {len(keyword_ids)} keywords"
         }
 
+        if errors or failed_indexes:
+            result["message"] += f" ({len(operations) - len(keyword_ids)} failed)"
+
+        if errors:
+            result["errors"] = [str(e) for e in errors]
+
+        if failed_indexes:
+            result["failed_indexes"] = failed_indexes
+            result["failure_messages"] = failure_messages
+
+        return result
+
     def add_negative_keywords(
         self,
         customer_id: str,
@@ -156,44 +845,31 @@ class KeywordManager:
         Returns:
             Operation result
         """
-        ad_group_criterion_service = self.client.get_service("AdGroupCriterionService")
-        ad_group_service = self.client.get_service("AdGroupService")
-
-        operations = []
-
-        for kw in keywords:
-            operation = self.client.get_type("AdGroupCriterionOperation")
-            criterion = operation.create
-
-            # Set ad group
-            criterion.ad_group = ad_group_service.ad_group_path(
-                customer_id, ad_group_id
-            )
+        build_operation = self._negative_keyword_operation
+        operations = [None] * len(keywords)
 
-            # Set keyword
-            criterion.keyword.text = kw['text']
-            criterion.keyword.match_type = self.client.enums.KeywordMatchTypeEnum[
-                kw['match_type'].upper()
-            ]
-
-            # Mark as negative
-            criterion.negative = True
-
-            operations.append(operation)
+        for i, kw in enumerate(keywords):
+            operations[i] = build_operation(customer_id, ad_group_id, kw)
 
         # Add negative keywords
-        response = ad_group_criterion_service.mutate_ad_group_criteria(
-            customer_id=customer_id,
-            operations=operations
-        )
+        response = self._submit_mutate_operations(customer_id, operations)
+        get_cache_manager().invalidate(customer_id, ResourceType.KEYWORD)
+        failures = self._partial_failures(response)
+        added = len(operations) - len(set(failures["failed_indexes"]))
 
-        logger.info(f"Added {len(operations)} negative keywords")
+        logger.info(f"Added {added} negative keywords")
 
-        return {
-            "negative_keywords_added": len(operations),
-            "message": f"Successfully added {len(operations)} negative keywords"
+        result = {
+            "negative_keywords_added": added,
+            "message": f"Successfully added {added} negative keywords"
         }
 
+        if failures["failed_indexes"]:
+            result.update(failures)
+            result["message"] += f" ({len(operations) - added} failed)"
+
+        return result
+
     # ========================================================================
     # Keyword Updates
     # ========================================================================
@@ -217,32 +893,19 @@ class KeywordManager:
         Returns:
             Operation result
         """
-        ad_group_criterion_service = self.client.get_service("AdGroupCriterionService")
-
-        operation = self.client.get_type("AdGroupCriterionOperation")
-        criterion = operation.update
-
-        criterion.resource_name = ad_group_criterion_service.ad_group_criterion_path(
-            customer_id, ad_group_id, criterion_id
+        operation = self._keyword_update_operation(
+            customer_id, ad_group_id, criterion_id, cpc_bid_micros=cpc_bid_micros
         )
-        criterion.cpc_bid_micros = cpc_bid_micros
 
-        # Set field mask
-        self.client.copy_from(
-            operation.update_mask,
-            self.client.get_type("FieldMask", version="v17")(paths=["cpc_bid_micros"])
-        )
-
-        # Update keyword
-        response = ad_group_criterion_service.mutate_ad_group_criteria(
-            customer_id=customer_id,
-            operations=[operation]
-        )
+        # Update keyword; a single operation fails or succeeds as a whole
+        response = self._submit_mutate_operations(customer_id, [operation], partial_failure=False)
+        get_cache_manager().invalidate(customer_id, ResourceType.KEYWORD)
 
         logger.info(f"Updated keyword {criterion_id} bid to {cpc_bid_micros / 1_000_000}")
 
         return {
             "criterion_id": criterion_id,
+            "resource_name": response.mutate_operation_responses[0].ad_group_criterion_result.resource_name,
             "new_cpc_bid": cpc_bid_micros / 1_000_000,
             "message": "Keyword bid updated successfully"
         }
@@ -266,32 +929,19 @@ class KeywordManager:
         Returns:
             Operation result
         """
-        ad_group_criterion_service = self.client.get_service("AdGroupCriterionService")
-
-        operation = self.client.get_type("AdGroupCriterionOperation")
-        criterion = operation.update
-
-        criterion.resource_name = ad_group_criterion_service.ad_group_criterion_path(
-            customer_id, ad_group_id, criterion_id
+        operation = self._keyword_update_operation(
+            customer_id, ad_group_id, criterion_id, status=status
         )
-        criterion.status = self.client.enums.AdGroupCriterionStatusEnum[status.value]
 
-        # Set field mask
-        self.client.copy_from(
-            operation.update_mask,
-            self.client.get_type("FieldMask", version="v17")(paths=["status"])
-        )
-
-        # Update keyword
-        response = ad_group_criterion_service.mutate_ad_group_criteria(
-            customer_id=customer_id,
-            operations=[operation]
-        )
+        # Update keyword; a single operation fails or succeeds as a whole
+        response = self._submit_mutate_operations(customer_id, [operation], partial_failure=False)
+        get_cache_manager().invalidate(customer_id, ResourceType.KEYWORD)
 
         logger.info(f"Updated keyword {criterion_id} status to {status.value}")
 
         return {
             "criterion_id": criterion_id,
+            "resource_name": response.mutate_operation_responses[0].ad_group_criterion_result.resource_name,
             "new_status": status.value,
             "message": f"Keyword status updated to {status.value}"
         }
@@ -300,12 +950,105 @@ class KeywordManager:
     # Keyword Information
     # ========================================================================
 
+    def iter_keyword_performance(
+        self,
+        customer_id: str,
+        ad_group_id: Optional[str] = None,
+        date_range: str = "LAST_30_DAYS",
+        min_impressions: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[KeywordPerformanceRow]:
+        """
+        Stream keyword performance metrics.
+
+        Rows are yielded one search_stream batch at a time, so consumers that
+        write them out as they go never hold the whole report in memory.
+
+        Args:
+            customer_id: Customer ID
+            ad_group_id: Optional ad group ID to filter by
+            date_range: Date range for metrics
+            min_impressions: Optional minimum impressions per keyword
+            limit: Optional maximum number of keywords (highest cost first)
+
+        Yields:
+            Keyword rows with performance data; call to_dict() on a row for
+            the nested JSON layout
+        """
+        where = (
+            f"WHERE segments.date DURING {date_range}"
+            " AND ad_group_criterion.type = KEYWORD"
+        )
+
+        if ad_group_id:
+            where += f" AND ad_group.id = {ad_group_id}"
+
+        if min_impressions is not None:
+            where += f" AND metrics.impressions >= {_gaql_count(min_impressions, 'min_impressions')}"
+
+        where += " ORDER BY metrics.cost_micros DESC"
+
+        if limit is not None:
+            where += f" LIMIT {_gaql_count(limit, 'limit')}"
+
+        query = self._KW_PERF_SELECT + where
+
+        for results in self._stream_batches(customer_id, query):
+            # First pass keeps raw field values; the batch's micros columns are
+            # converted to currency units in one vectorized step afterwards
+            records = []
+            cpc_bid_micros = array('q')
+            average_cpc_micros = array('d')
+            cost_micros = array('q')
+            cost_per_conversion_micros = array('d')
+
+            for row in results:
+                criterion = row.ad_group_criterion
+                metrics = row.metrics
+                records.append((
+                    str(criterion.criterion_id),
+                    criterion.keyword.text,
+                    _enum_name(criterion.keyword, "match_type"),
+                    _enum_name(criterion, "status"),
+                    criterion.quality_info.quality_score or None,
+                    str(row.ad_group.id),
+                    row.ad_group.name,
+                    str(row.campaign.id),
+                    row.campaign.name,
+                    metrics.impressions,
+                    metrics.clicks,
+                    metrics.ctr,
+                    metrics.conversions,
+                    metrics.conversions_value
+                ))
+                cpc_bid_micros.append(criterion.cpc_bid_micros)
+                average_cpc_micros.append(metrics.average_cpc)
+                cost_micros.append(metrics.cost_micros)
+                cost_per_conversion_micros.append(metrics.cost_per_conversion)
+
+            cpc_bids = (np.frombuffer(cpc_bid_micros, dtype=np.int64) / 1_000_000).tolist()
+            average_cpcs = (np.frombuffer(average_cpc_micros, dtype=np.float64) / 1_000_000).tolist()
+            costs = (np.frombuffer(cost_micros, dtype=np.int64) / 1_000_000).tolist()
+            costs_per_conversion = (
+                np.frombuffer(cost_per_conversion_micros, dtype=np.float64) / 1_000_000
+            ).tolist()
+
+            # Second pass yields the row records
+            for record, cpc_bid, average_cpc, cost, cost_per_conversion in zip(
+                records, cpc_bids, average_cpcs, costs, costs_per_conversion
+            ):
+                yield KeywordPerformanceRow(
+                    *record, cpc_bid or None, average_cpc, cost, cost_per_conversion
+                )
+
     def get_keyword_performance(
         self,
         customer_id: str,
         ad_group_id: Optional[str] = None,
-        date_range: str = "LAST_30_DAYS"
-    ) -> List[Dict[str, Any]]:
+        date_range: str = "LAST_30_DAYS",
+        min_impressions: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[KeywordPerformanceRow]:
         """
         Get keyword performance metrics.
 
@@ -313,80 +1056,96 @@ class KeywordManager:
             customer_id: Customer ID
             ad_group_id: Optional ad group ID to filter by
             date_range: Date range for metrics
+            min_impressions: Optional minimum impressions per keyword
+            limit: Optional maximum number of keywords (highest cost first)
 
         Returns:
-            List of keywords with performance data
-        """
-        query = f"""
-            SELECT
-                ad_group_criterion.criterion_id,
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                ad_group_criterion.status,
-                ad_group_criterion.cpc_bid_micros,
-                ad_group_criterion.quality_info.quality_score,
-                ad_group.id,
-                ad_group.name,
-                campaign.id,
-                campaign.name,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.ctr,
-                metrics.average_cpc,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.conversions_value,
-                metrics.cost_per_conversion
-            FROM keyword_view
-            WHERE segments.date DURING {date_range}
-            AND ad_group_criterion.type = KEYWORD
+            List of keyword rows with performance data; call to_dict() on a
+            row for the nested JSON layout. Results are cached under
+            ResourceType.KEYWORD until a keyword write invalidates them.
         """
+        cache = get_cache_manager()
+        cache_params = {
+            "ad_group_id": str(ad_group_id or ""),
+            "date_range": date_range,
+            "min_impressions": min_impressions,
+            "limit": limit
+        }
 
-        if ad_group_id:
-            query += f" AND ad_group.id = {ad_group_id}"
-
-        query += " ORDER BY metrics.cost_micros DESC"
-
-        ga_service = self.client.get_service("GoogleAdsService")
-        response = ga_service.search(customer_id=customer_id, query=query)
-
-        keywords = []
-        for row in response:
-            keywords.append({
-                "criterion_id": str(row.ad_group_criterion.criterion_id),
-                "keyword_text": row.ad_group_criterion.keyword.text,
-                "match_type": row.ad_group_criterion.keyword.match_type.name,
-                "status": row.ad_group_criterion.status.name,
-                "cpc_bid": row.ad_group_criterion.cpc_bid_micros / 1_000_000 if row.ad_group_criterion.cpc_bid_micros else None,
-                "quality_score": row.ad_group_criterion.quality_info.quality_score if hasattr(row.ad_group_criterion, 'quality_info') else None,
-                "ad_group": {
-                    "id": str(row.ad_group.id),
-                    "name": row.ad_group.name
-                },
-                "campaign": {
-                    "id": str(row.campaign.id),
-                    "name": row.campaign.name
-                },
-                "metrics": {
-                    "impressions": row.metrics.impressions,
-                    "clicks": row.metrics.clicks,
-                    "ctr": row.metrics.ctr,
-                    "average_cpc": row.metrics.average_cpc / 1_000_000 if row.metrics.average_cpc else 0,
-                    "cost": row.metrics.cost_micros / 1_000_000,
-                    "conversions": row.metrics.conversions,
-                    "conversions_value": row.metrics.conversions_value,
-                    "cost_per_conversion": row.metrics.cost_per_conversion / 1_000_000 if row.metrics.cost_per_conversion else 0
-                }
-            })
+        # Rows are cached as plain lists so they survive the Redis JSON backend
+        cached = cache.get(customer_id, ResourceType.KEYWORD, "get_keyword_performance", **cache_params)
+        if cached is not None:
+            return [KeywordPerformanceRow(*values) for values in cached]
+
+        keywords = list(self.iter_keyword_performance(
+            customer_id,
+            ad_group_id=ad_group_id,
+            date_range=date_range,
+            min_impressions=min_impressions,
+            limit=limit
+        ))
 
         logger.info(f"Retrieved {len(keywords)} keywords")
 
+        cache.set(
+            customer_id, ResourceType.KEYWORD, "get_keyword_performance",
+            [list(keyword) for keyword in keywords], **cache_params
+        )
+
         return keywords
 
+    def iter_keywords(
+        self,
+        customer_id: str,
+        ad_group_id: str,
+        match_type: Optional[KeywordMatchType] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the keywords in an ad group, one result page at a time.
+
+        Args:
+            customer_id: Customer ID
+            ad_group_id: Ad group ID
+            match_type: Optional match type to filter by
+            limit: Optional maximum number of keywords
+
+        Yields:
+            Keyword dicts
+        """
+        where = (
+            f"WHERE ad_group.id = {ad_group_id}"
+            " AND ad_group_criterion.type = KEYWORD"
+            " AND ad_group_criterion.status != REMOVED"
+        )
+
+        if match_type is not None:
+            where += f" AND ad_group_criterion.keyword.match_type = {KeywordMatchType(match_type).value}"
+
+        where += " ORDER BY ad_group_criterion.keyword.text"
+
+        if limit is not None:
+            where += f" LIMIT {_gaql_count(limit, 'limit')}"
+
+        query = self._KW_LIST_SELECT + where
+
+        for row in self._search_rows(customer_id, query):
+            criterion = row.ad_group_criterion
+            yield {
+                "criterion_id": str(criterion.criterion_id),
+                "keyword_text": criterion.keyword.text,
+                "match_type": _enum_name(criterion.keyword, "match_type"),
+                "status": _enum_name(criterion, "status"),
+                "cpc_bid": criterion.cpc_bid_micros / 1_000_000 if criterion.cpc_bid_micros else None,
+                "negative": criterion.negative
+            }
+
     def list_keywords(
         self,
         customer_id: str,
-        ad_group_id: str
+        ad_group_id: str,
+        match_type: Optional[KeywordMatchType] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         List all keywords in an ad group.
@@ -394,40 +1153,15 @@ class KeywordManager:
         Args:
             customer_id: Customer ID
             ad_group_id: Ad group ID
+            match_type: Optional match type to filter by
+            limit: Optional maximum number of keywords
 
         Returns:
             List of keywords
         """
-        query = f"""
-            SELECT
-                ad_group_criterion.criterion_id,
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                ad_group_criterion.status,
-                ad_group_criterion.cpc_bid_micros,
-                ad_group_criterion.negative
-            FROM ad_group_criterion
-            WHERE ad_group.id = {ad_group_id}
-            AND ad_group_criterion.type = KEYWORD
-            AND ad_group_criterion.status != REMOVED
-            ORDER BY ad_group_criterion.keyword.text
-        """
-
-        ga_service = self.client.get_service("GoogleAdsService")
-        response = ga_service.search(customer_id=customer_id, query=query)
-
-        keywords = []
-        for row in response:
-            keywords.append({
-                "criterion_id": str(row.ad_group_criterion.criterion_id),
-                "keyword_text": row.ad_group_criterion.keyword.text,
-                "match_type": row.ad_group_criterion.keyword.match_type.name,
-                "status": row.ad_group_criterion.status.name,
-                "cpc_bid": row.ad_group_criterion.cpc_bid_micros / 1_000_000 if row.ad_group_criterion.cpc_bid_micros else None,
-                "negative": row.ad_group_criterion.negative
-            })
-
-        return keywords
+        return list(self.iter_keywords(
+            customer_id, ad_group_id, match_type=match_type, limit=limit
+        ))
 
     def get_keyword_quality_score(
         self,
@@ -446,37 +1180,30 @@ class KeywordManager:
         Returns:
             Quality score details
         """
-        query = f"""
-            SELECT
-                ad_group_criterion.criterion_id,
-                ad_group_criterion.keyword.text,
-                ad_group_criterion.keyword.match_type,
-                ad_group_criterion.quality_info.quality_score,
-                ad_group_criterion.quality_info.creative_quality_score,
-                ad_group_criterion.quality_info.post_click_quality_score,
-                ad_group_criterion.quality_info.search_predicted_ctr
-            FROM ad_group_criterion
-            WHERE ad_group.id = {ad_group_id}
-            AND ad_group_criterion.criterion_id = {criterion_id}
-        """
+        query = self._KW_QUALITY_SELECT + (
+            f"WHERE ad_group.id = {ad_group_id}"
+            f" AND ad_group_criterion.criterion_id = {criterion_id}"
+        )
 
-        ga_service = self.client.get_service("GoogleAdsService")
-        response = ga_service.search(customer_id=customer_id, query=query)
+        response = self._ga_service.search(customer_id=customer_id, query=query)
 
-        for row in response:
-            quality_info = row.ad_group_criterion.quality_info if hasattr(row.ad_group_criterion, 'quality_info') else None
+        # At most one row matches; take it without draining further pages
+        row = next(iter(response), None)
+        if row is None:
+            return None
 
-            return {
-                "criterion_id": str(row.ad_group_criterion.criterion_id),
-                "keyword_text": row.ad_group_criterion.keyword.text,
-                "match_type": row.ad_group_criterion.keyword.match_type.name,
-                "quality_score": quality_info.quality_score if quality_info else None,
-                "creative_quality": quality_info.creative_quality_score.name if quality_info and hasattr(quality_info, 'creative_quality_score') else "UNSPECIFIED",
-                "landing_page_experience": quality_info.post_click_quality_score.name if quality_info and hasattr(quality_info, 'post_click_quality_score') else "UNSPECIFIED",
-                "expected_ctr": quality_info.search_predicted_ctr.name if quality_info and hasattr(quality_info, 'search_predicted_ctr') else "UNSPECIFIED"
-            }
+        # Selected fields are always present; unset enums read as UNSPECIFIED
+        quality_info = row.ad_group_criterion.quality_info
 
-        return None
+        return {
+            "criterion_id": str(row.ad_group_criterion.criterion_id),
+            "keyword_text": row.ad_group_criterion.keyword.text,
+            "match_type": row.ad_group_criterion.keyword.match_type.name,
+            "quality_score": quality_info.quality_score or None,
+            "creative_quality": quality_info.creative_quality_score.name,
+            "landing_page_experience": quality_info.post_click_quality_score.name,
+            "expected_ctr": quality_info.search_predicted_ctr.name
+        }
 
     # ========================================================================
     # Search Terms
@@ -487,7 +1214,9 @@ class KeywordManager:
         customer_id: str,
         ad_group_id: str,
         criterion_id: Optional[str] = None,
-        date_range: str = "LAST_30_DAYS"
+        date_range: str = "LAST_30_DAYS",
+        min_impressions: Optional[int] = None,
+        limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Get search terms that triggered ads for a keyword.
@@ -497,45 +1226,43 @@ class KeywordManager:
             ad_group_id: Ad group ID
             criterion_id: Optional specific keyword criterion ID
             date_range: Date range for search terms
+            min_impressions: Optional minimum impressions per search term
+            limit: Optional maximum number of search terms (most impressions first)
 
         Returns:
             List of search terms with performance data
         """
-        query = f"""
-            SELECT
-                search_term_view.search_term,
-                search_term_view.status,
-                ad_group.id,
-                ad_group_criterion.keyword.text,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.ctr,
-                metrics.cost_micros,
-                metrics.conversions
-            FROM search_term_view
-            WHERE segments.date DURING {date_range}
-            AND ad_group.id = {ad_group_id}
-        """
+        where = (
+            f"WHERE segments.date DURING {date_range}"
+            f" AND ad_group.id = {ad_group_id}"
+        )
 
         if criterion_id:
-            query += f" AND ad_group_criterion.criterion_id = {criterion_id}"
+            where += f" AND ad_group_criterion.criterion_id = {criterion_id}"
 
-        query += " ORDER BY metrics.impressions DESC"
+        if min_impressions is not None:
+            where += f" AND metrics.impressions >= {_gaql_count(min_impressions, 'min_impressions')}"
 
-        ga_service = self.client.get_service("GoogleAdsService")
-        response = ga_service.search(customer_id=customer_id, query=query)
+        where += " ORDER BY metrics.impressions DESC"
+
+        if limit is not None:
+            where += f" LIMIT {_gaql_count(limit, 'limit')}"
+
+        query = self._SEARCH_TERMS_SELECT + where
 
         search_terms = []
-        for row in response:
+        for row in self._stream_rows(customer_id, query):
+            search_term_view = row.search_term_view
+            metrics = row.metrics
             search_terms.append({
-                "search_term": row.search_term_view.search_term,
-                "status": row.search_term_view.status.name,
+                "search_term": search_term_view.search_term,
+                "status": _enum_name(search_term_view, "status"),
                 "keyword_text": row.ad_group_criterion.keyword.text if hasattr(row, 'ad_group_criterion') else "Unknown",
-                "impressions": row.metrics.impressions,
-                "clicks": row.metrics.clicks,
-                "ctr": row.metrics.ctr,
-                "cost": row.metrics.cost_micros / 1_000_000,
-                "conversions": row.metrics.conversions
+                "impressions": metrics.impressions,
+                "clicks": metrics.clicks,
+                "ctr": metrics.ctr,
+                "cost": metrics.cost_micros / 1_000_000,
+                "conversions": metrics.conversions
             })
 
         return search_terms
@@ -547,53 +1274,80 @@ class KeywordManager:
     def bulk_update_keyword_bids(
         self,
         customer_id: str,
-        bid_updates: List[Dict[str, Any]]
+        bid_updates: List[Dict[str, Any]],
+        chunk_size: int = MUTATE_CHUNK_SIZE,
+        max_concurrency: int = MUTATE_MAX_CONCURRENCY
     ) -> Dict[str, Any]:
         """
         Update bids for multiple keywords at once.
 
+        Updates are split into chunks of at most chunk_size operations, which
+        are submitted concurrently so large batches stay under the per-request
+        operation limit.
+
         Args:
             customer_id: Customer ID
             bid_updates: List of dicts with 'ad_group_id', 'criterion_id', 'cpc_bid_micros'
+            chunk_size: Maximum operations per mutate request
+            max_concurrency: Maximum mutate requests in flight at once
 
         Returns:
             Bulk operation result
         """
-        ad_group_criterion_service = self.client.get_service("AdGroupCriterionService")
-
-        operations = []
+        build_operation = self._keyword_update_operation
+        operations = [None] * len(bid_updates)
 
-        for update in bid_updates:
-            operation = self.client.get_type("AdGroupCriterionOperation")
-            criterion = operation.update
-
-            criterion.resource_name = ad_group_criterion_service.ad_group_criterion_path(
+        for i, update in enumerate(bid_updates):
+            operations[i] = build_operation(
                 customer_id,
                 update['ad_group_id'],
-                update['criterion_id']
+                update['criterion_id'],
+                cpc_bid_micros=update['cpc_bid_micros']
             )
-            criterion.cpc_bid_micros = update['cpc_bid_micros']
 
-            self.client.copy_from(
-                operation.update_mask,
-                self.client.get_type("FieldMask", version="v17")(paths=["cpc_bid_micros"])
+        # Execute bulk update
+        responses, errors = self._submit_in_chunks(
+            customer_id, operations, chunk_size, max_concurrency
+        )
+        get_cache_manager().invalidate(customer_id, ResourceType.KEYWORD)
+        updated = 0
+        failed_indexes = []
+        failure_messages = []
+
+        for start, response in responses:
+            failures = self._partial_failures(response, offset=start)
+            failed_indexes.extend(failures["failed_indexes"])
+            failure_messages.extend(failures["failure_messages"])
+            updated += (
+                min(chunk_size, len(operations) - start)
+                - len(set(failures["failed_indexes"]))
             )
 
-            operations.append(operation)
+        if errors and not updated:
+            raise errors[0]
 
-        # Execute bulk update
-        response = ad_group_criterion_service.mutate_ad_group_criteria(
-            customer_id=customer_id,
-            operations=operations
+        logger.info(
+            f"Bulk updated {updated} keyword bids in {len(responses) + len(errors)} requests"
         )
 
-        logger.info(f"Bulk updated {len(operations)} keyword bids")
-
-        return {
-            "keywords_updated": len(operations),
-            "message": f"Successfully updated {len(operations)} keyword bids"
+        result = {
+            "keywords_updated": updated,
+            "message": f"Successfully updated {updated} keyword bids"
         }
 
+        if errors or failed_indexes:
+            result["keywords_failed"] = len(operations) - updated
+            result["message"] += f" ({len(operations) - updated} failed)"
+
+        if errors:
+            result["errors"] = [str(e) for e in errors]
+
+        if failed_indexes:
+            result["failed_indexes"] = failed_indexes
+            result["failure_messages"] = failure_messages
+
+        return result
+
     # ========================================================================
     # Keyword Planner / Research
     # ========================================================================
@@ -621,7 +1375,7 @@ class KeywordManager:
         Returns:
             Dictionary with keyword ideas and metrics
         """
-        keyword_plan_idea_service = self.client.get_service("KeywordPlanIdeaService")
+        keyword_plan_idea_service = _shared_service(self.client, "KeywordPlanIdeaService")
 
         # Build request
         request = self.client.get_type("GenerateKeywordIdeasRequest")
@@ -723,7 +1477,7 @@ class KeywordManager:
         Returns:
             Dictionary with forecast metrics
         """
-        keyword_plan_service = self.client.get_service("KeywordPlanService")
+        keyword_plan_service = _shared_service(self.client, "KeywordPlanService")
 
         # Create a temporary keyword plan for forecasting
         # Note: This creates and immediately uses a plan, then removes it
@@ -801,6 +1555,66 @@ class KeywordManager:
             logger.error(f"Error generating keyword forecast: {str(e)}")
             raise
 
+    def get_keyword_research(
+        self,
+        customer_id: str,
+        seed_keywords: List[str],
+        location_ids: Optional[List[str]] = None,
+        language_id: Optional[str] = None,
+        keyword_plan_network: str = "GOOGLE_SEARCH",
+        match_type: KeywordMatchType = KeywordMatchType.BROAD,
+        cpc_bid_micros: Optional[int] = None,
+        date_interval: str = "NEXT_MONTH"
+    ) -> Dict[str, Any]:
+        """
+        Get keyword ideas and a traffic forecast for the same seed keywords.
+
+        Both requests run concurrently, so the combined latency is that of
+        the slower one rather than the sum of both.
+
+        Args:
+            customer_id: Customer ID
+            seed_keywords: Seed keywords to expand and forecast
+            location_ids: Optional location criterion IDs
+            language_id: Optional language criterion ID
+            keyword_plan_network: Network for ideas - GOOGLE_SEARCH, GOOGLE_SEARCH_AND_PARTNERS, or YOUTUBE
+            match_type: Match type used to forecast the seed keywords
+            cpc_bid_micros: Optional CPC bid in micros for forecast
+            date_interval: Forecast interval - NEXT_WEEK, NEXT_MONTH, NEXT_QUARTER
+
+        Returns:
+            Dictionary with 'ideas' (get_keyword_ideas result) and 'forecast'
+            (forecast_keyword_metrics result)
+        """
+        forecast_keywords = [
+            {"text": keyword, "match_type": KeywordMatchType(match_type).value}
+            for keyword in seed_keywords
+        ]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ideas = executor.submit(
+                self.get_keyword_ideas,
+                customer_id,
+                seed_keywords=seed_keywords,
+                location_ids=location_ids,
+                language_id=language_id,
+                keyword_plan_network=keyword_plan_network
+            )
+            forecast = executor.submit(
+                self.forecast_keyword_metrics,
+                customer_id,
+                forecast_keywords,
+                location_ids=location_ids,
+                language_id=language_id,
+                cpc_bid_micros=cpc_bid_micros,
+                date_interval=date_interval
+            )
+
+            return {
+                "ideas": ideas.result(),
+                "forecast": forecast.result()
+            }
+
     # ========================================================================
     # Traffic Estimation (Legacy - kept for compatibility)
     # ========================================================================
@@ -835,61 +1649,48 @@ class KeywordManager:
         keyword_id: Optional[str] = None,
         ad_group_id: Optional[str] = None,
         start_date: Optional[str] = None,
-        end_date: Optional[str] = None
+        end_date: Optional[str] = None,
+        return_rows: bool = True
     ) -> Dict[str, Any]:
         """Get historical quality score data for keywords.
 
+        Rows are streamed and grouped as they arrive. With return_rows=False
+        the flat per-row list is not kept, so memory grows with the number
+        of keywords rather than the number of rows.
+
         Args:
             customer_id: Google Ads customer ID
             keyword_id: Optional specific keyword criterion ID
             ad_group_id: Optional ad group ID to filter by
             start_date: Optional start date (YYYY-MM-DD)
             end_date: Optional end date (YYYY-MM-DD)
+            return_rows: Include the flat 'keywords' list of
+                QualityScoreHistoryRow records in the result
 
         Returns:
             Dictionary with quality score history data
         """
         with performance_logger.track_operation(self, 'get_quality_score_history'):
-            # Build query
-            query_parts = [
-                "SELECT ad_group_criterion.criterion_id,",
-                "ad_group_criterion.keyword.text,",
-                "ad_group_criterion.keyword.match_type,",
-                "ad_group_criterion.quality_info.quality_score,",
-                "ad_group_criterion.quality_info.creative_quality_score,",
-                "ad_group_criterion.quality_info.post_click_quality_score,",
-                "ad_group_criterion.quality_info.search_predicted_ctr,",
-                "ad_group.id, ad_group.name,",
-                "campaign.id, campaign.name,",
-                "segments.date",
-                "FROM keyword_view",
-                "WHERE ad_group_criterion.type = 'KEYWORD'"
-            ]
+            # Build query; only the filters vary between calls
+            where = []
 
             if start_date and end_date:
-                query_parts.append(f"AND segments.date BETWEEN '{start_date}' AND '{end_date}'")
+                where.append(f"AND segments.date BETWEEN '{start_date}' AND '{end_date}'")
             elif start_date:
-                query_parts.append(f"AND segments.date >= '{start_date}'")
+                where.append(f"AND segments.date >= '{start_date}'")
             elif end_date:
-                query_parts.append(f"AND segments.date <= '{end_date}'")
+                where.append(f"AND segments.date <= '{end_date}'")
             else:
                 # Default to last 90 days
-                query_parts.append("AND segments.date DURING LAST_90_DAYS")
+                where.append("AND segments.date DURING LAST_90_DAYS")
 
             if keyword_id:
-                query_parts.append(f"AND ad_group_criterion.criterion_id = {keyword_id}")
+                where.append(f"AND ad_group_criterion.criterion_id = {keyword_id}")
 
             if ad_group_id:
-                query_parts.append(f"AND ad_group.id = {ad_group_id}")
-
-            query_parts.append("ORDER BY segments.date DESC")
-
-            query = " ".join(query_parts)
+                where.append(f"AND ad_group.id = {ad_group_id}")
 
-            ga_service = self.client.get_service("GoogleAdsService")
-            request = self.client.get_type("SearchGoogleAdsRequest")
-            request.customer_id = customer_id
-            request.query = query
+            query = f"{self._QS_HISTORY_SELECT} {' '.join(where)} ORDER BY segments.date DESC"
 
             audit_logger.log_api_call(
                 operation='quality_score_history',
@@ -897,74 +1698,80 @@ class KeywordManager:
                 details={'keyword_id': keyword_id, 'ad_group_id': ad_group_id}
             )
 
-            response = ga_service.search(request=request)
-
-            # Parse results
+            # Parse results and group them by keyword in the same pass. Rows
+            # arrive newest first, so a keyword's first row is its current
+            # score and its second row the previous one; no sort is needed.
             keywords = []
-            for row in response:
-                quality_info = row.ad_group_criterion.quality_info
-
-                keywords.append({
-                    'date': row.segments.date,
-                    'campaign_id': row.campaign.id,
-                    'campaign_name': row.campaign.name,
-                    'ad_group_id': row.ad_group.id,
-                    'ad_group_name': row.ad_group.name,
-                    'keyword_id': row.ad_group_criterion.criterion_id,
-                    'keyword_text': row.ad_group_criterion.keyword.text,
-                    'match_type': row.ad_group_criterion.keyword.match_type.name,
+            keyword_groups = {}
+
+            # Each row repeats its date, campaign, ad group and keyword strings;
+            # share one copy of each. Enum names are interned by _enum_name.
+            strings = {}
+            share = strings.setdefault
+
+            for row in self._stream_rows(customer_id, query):
+                criterion = row.ad_group_criterion
+                quality_info = criterion.quality_info
+                kw_id = criterion.criterion_id
+                match_type = _enum_name(criterion.keyword, "match_type")
+                date = row.segments.date
+                history_entry = {
+                    'date': share(date, date),
                     'quality_score': quality_info.quality_score,
-                    'creative_quality_score': quality_info.creative_quality_score.name,
-                    'landing_page_experience': quality_info.post_click_quality_score.name,
-                    'expected_ctr': quality_info.search_predicted_ctr.name
-                })
+                    'creative_quality_score': _enum_name(quality_info, "creative_quality_score"),
+                    'landing_page_experience': _enum_name(quality_info, "post_click_quality_score"),
+                    'expected_ctr': _enum_name(quality_info, "search_predicted_ctr")
+                }
 
-            # Calculate quality score trends
-            if keywords:
-                # Group by keyword
-                keyword_groups = {}
-                for kw in keywords:
-                    kw_id = kw['keyword_id']
-                    if kw_id not in keyword_groups:
-                        keyword_groups[kw_id] = {
-                            'keyword_text': kw['keyword_text'],
-                            'match_type': kw['match_type'],
-                            'history': [],
-                            'current_quality_score': None,
-                            'previous_quality_score': None,
-                            'trend': None
-                        }
-
-                    keyword_groups[kw_id]['history'].append({
-                        'date': kw['date'],
-                        'quality_score': kw['quality_score'],
-                        'creative_quality_score': kw['creative_quality_score'],
-                        'landing_page_experience': kw['landing_page_experience'],
-                        'expected_ctr': kw['expected_ctr']
-                    })
-
-                # Calculate trends
-                for kw_id, data in keyword_groups.items():
-                    if len(data['history']) >= 2:
-                        # Sort by date (most recent first)
-                        data['history'].sort(key=lambda x: x['date'], reverse=True)
-                        data['current_quality_score'] = data['history'][0]['quality_score']
-                        data['previous_quality_score'] = data['history'][1]['quality_score']
-
-                        if data['current_quality_score'] > data['previous_quality_score']:
-                            data['trend'] = 'improving'
-                        elif data['current_quality_score'] < data['previous_quality_score']:
-                            data['trend'] = 'declining'
-                        else:
-                            data['trend'] = 'stable'
-                    elif len(data['history']) == 1:
-                        data['current_quality_score'] = data['history'][0]['quality_score']
-                        data['trend'] = 'new'
+                if return_rows:
+                    campaign_name = row.campaign.name
+                    ad_group_name = row.ad_group.name
+                    keyword_text = criterion.keyword.text
+                    keywords.append(QualityScoreHistoryRow(
+                        history_entry['date'],
+                        row.campaign.id,
+                        share(campaign_name, campaign_name),
+                        row.ad_group.id,
+                        share(ad_group_name, ad_group_name),
+                        kw_id,
+                        share(keyword_text, keyword_text),
+                        match_type,
+                        history_entry['quality_score'],
+                        history_entry['creative_quality_score'],
+                        history_entry['landing_page_experience'],
+                        history_entry['expected_ctr']
+                    ))
+
+                group = keyword_groups.get(kw_id)
+                if group is None:
+                    keyword_groups[kw_id] = {
+                        'keyword_text': criterion.keyword.text,
+                        'match_type': match_type,
+                        'history': [history_entry],
+                        'current_quality_score': history_entry['quality_score'],
+                        'previous_quality_score': None,
+                        'trend': 'new'
+                    }
+                    continue
+
+                history = group['history']
+                history.append(history_entry)
+
+                if len(history) == 2:
+                    current = group['current_quality_score']
+                    previous = group['previous_quality_score'] = history_entry['quality_score']
+
+                    if current > previous:
+                        group['trend'] = 'improving'
+                    elif current < previous:
+                        group['trend'] = 'declining'
+                    else:
+                        group['trend'] = 'stable'
 
             return {
                 'keywords': keywords,
-                'keyword_groups': keyword_groups if keywords else {},
-                'total_keywords': len(keyword_groups) if keywords else 0,
+                'keyword_groups': keyword_groups,
+                'total_keywords': len(keyword_groups),
                 'date_range': {
                     'start_date': start_date or 'LAST_90_DAYS',
                     'end_date': end_date or 'TODAY'
@@ -5,15 +5,88 @@ Handles label creation, application, and management for organizing campaigns,
 ad groups, ads, and keywords.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, NamedTuple, Optional, Any, Tuple
 from google.ads.googleads.client import GoogleAdsClient
+import re
 from performance_logger import performance_logger
 from audit_logger import audit_logger
+from cache_manager import get_cache_manager, ResourceType
+
+# Label colors are "#RRGGBB" hex codes
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+
+def _escape_gaql(value: str) -> str:
+    """Escape a value for use inside a single-quoted GAQL string literal.
+
+    Args:
+        value: Raw string value
+
+    Returns:
+        Value with backslashes and single quotes escaped
+    """
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+# GAQL for iter_labels, built once at import so every call sends the same
+# query text. Per-resource queries are formatted with the parts of the
+# resource_id ("adGroupId_adId" for ads, "adGroupId_criterionId" for keywords).
+_LABEL_COLUMNS = "label.name, label.description, label.status, label.background_color, label.text_color"
+
+_LIST_LABELS_ALL = (
+    f"SELECT label.id, {_LABEL_COLUMNS} FROM label ORDER BY label.name"
+)
+
+_LIST_RESOURCE_LABELS = {
+    "campaign": (
+        f"SELECT campaign_label.label, {_LABEL_COLUMNS} FROM campaign_label"
+        " WHERE campaign.id = {0}"
+    ),
+    "ad_group": (
+        f"SELECT ad_group_label.label, {_LABEL_COLUMNS} FROM ad_group_label"
+        " WHERE ad_group.id = {0}"
+    ),
+    "ad": (
+        f"SELECT ad_group_ad_label.label, {_LABEL_COLUMNS} FROM ad_group_ad_label"
+        " WHERE ad_group.id = {0} AND ad_group_ad.ad.id = {1}"
+    ),
+    "keyword": (
+        f"SELECT ad_group_criterion_label.label, {_LABEL_COLUMNS} FROM ad_group_criterion_label"
+        " WHERE ad_group.id = {0} AND ad_group_criterion.criterion_id = {1}"
+    ),
+}
+
+
+class _LabelLink(NamedTuple):
+    """How labels attach to one resource type."""
+    operation: str         # MutateOperation field, e.g. campaign_label_operation
+    field: str             # Field on the link holding the resource name
+    resources: str         # Resource name collection, e.g. campaigns
+    links: str             # Label link collection, e.g. campaignLabels
+    id_parts: int          # Number of "_"-separated parts in resource_id
 
 
 class LabelsManager:
     """Manager for Google Ads account labels."""
 
+    # Label link handling per resource_type. Ads and keywords take resource_id
+    # as "adGroupId_adId" and "adGroupId_criterionId".
+    _LABEL_LINKS = {
+        "campaign": _LabelLink(
+            "campaign_label_operation", "campaign", "campaigns", "campaignLabels", 1
+        ),
+        "ad_group": _LabelLink(
+            "ad_group_label_operation", "ad_group", "adGroups", "adGroupLabels", 1
+        ),
+        "ad": _LabelLink(
+            "ad_group_ad_label_operation", "ad_group_ad", "adGroupAds", "adGroupAdLabels", 2
+        ),
+        "keyword": _LabelLink(
+            "ad_group_criterion_label_operation", "ad_group_criterion",
+            "adGroupCriteria", "adGroupCriterionLabels", 2
+        ),
+    }
+
     def __init__(self, client: GoogleAdsClient):
         """Initialize the labels manager.
 
@@ -22,6 +95,66 @@ class LabelsManager:
         """
         self.client = client
 
+        # Service clients and message classes, resolved on first use
+        self._services: Dict[str, Any] = {}
+        self._types: Dict[str, Any] = {}
+
+    def _service(self, name: str) -> Any:
+        """Return the named service client, creating it on first use.
+
+        Args:
+            name: Service name, e.g. "LabelService"
+
+        Returns:
+            Service client
+        """
+        service = self._services.get(name)
+        if service is None:
+            service = self._services[name] = self.client.get_service(name)
+        return service
+
+    def _new_type(self, name: str) -> Any:
+        """Return a new instance of the named message type.
+
+        The message class is resolved through the client once and then
+        instantiated directly.
+
+        Args:
+            name: Message type name, e.g. "LabelOperation"
+
+        Returns:
+            Empty message instance
+        """
+        message_type = self._types.get(name)
+        if message_type is None:
+            message_type = self._types[name] = type(self.client.get_type(name))
+        return message_type()
+
+    def _label_link(self, resource_type: str, resource_id: str) -> Tuple[_LabelLink, Tuple[str, ...]]:
+        """Look up the label link handling for a resource.
+
+        Args:
+            resource_type: Resource type (campaign, ad_group, ad, keyword)
+            resource_id: Resource ID
+
+        Returns:
+            Tuple of (link spec, resource ID parts)
+        """
+        link = self._LABEL_LINKS.get(resource_type)
+        if link is None:
+            raise ValueError(f"Invalid resource_type: {resource_type}. Must be campaign, ad_group, ad, or keyword")
+
+        if link.id_parts == 1:
+            if not resource_id.isdecimal():
+                raise ValueError(f"resource_id for {resource_type} must be a numeric ID")
+            return link, (resource_id,)
+
+        ad_group_id, sep, child_id = resource_id.partition('_')
+        if not sep or not ad_group_id.isdecimal() or not child_id.isdecimal():
+            raise ValueError(f"resource_id for {resource_type} must be in the format 'adGroupId_id'")
+
+        return link, (ad_group_id, child_id)
+
     def manage_account_labels(
         self,
         customer_id: str,
@@ -103,8 +236,13 @@ class LabelsManager:
         if not label_name:
             raise ValueError("label_name is required for create action")
 
-        label_service = self.client.get_service("LabelService")
-        label_operation = self.client.get_type("LabelOperation")
+        # Reject bad colors before making the API call
+        for color_name, color in (('background_color', background_color), ('text_color', text_color)):
+            if color and not _HEX_COLOR_RE.match(color):
+                raise ValueError(f"{color_name} must be a hex color like #FFFFFF, got {color!r}")
+
+        label_service = self._service("LabelService")
+        label_operation = self._new_type("LabelOperation")
 
         label = label_operation.create
         label.name = label_name
@@ -128,6 +266,9 @@ class LabelsManager:
 
         label_resource_name = response.results[0].resource_name
         label_id = label_resource_name.split('/')[-1]
+        get_cache_manager().set(
+            customer_id, ResourceType.LABEL, "label_id", label_id, label_name=label_name
+        )
 
         audit_logger.log_api_call(
             operation='create_label',
@@ -145,98 +286,137 @@ class LabelsManager:
             'resource_name': label_resource_name
         }
 
-    def _apply_label(
+    def apply_labels_batch(
         self,
         customer_id: str,
-        label_name: str,
-        resource_type: str,
-        resource_id: str
+        items: List[Tuple[str, str, str]]
     ) -> Dict[str, Any]:
-        """Apply label to a resource.
+        """Apply labels to many resources in one request.
 
         Args:
             customer_id: Customer ID
-            label_name: Label name
-            resource_type: Resource type (campaign, ad_group, ad, keyword)
-            resource_id: Resource ID
+            items: (label_name, resource_type, resource_id) tuples
 
         Returns:
-            Application confirmation
+            Application confirmation with the resolved label IDs
         """
-        if not all([label_name, resource_type, resource_id]):
-            raise ValueError("label_name, resource_type, and resource_id are required for apply action")
+        return self._mutate_label_links(customer_id, items, remove=False)
 
-        # Get label ID by name
-        label_id = self._get_label_id_by_name(customer_id, label_name)
+    def remove_labels_batch(
+        self,
+        customer_id: str,
+        items: List[Tuple[str, str, str]]
+    ) -> Dict[str, Any]:
+        """Remove labels from many resources in one request.
 
-        if not label_id:
-            raise ValueError(f"Label '{label_name}' not found. Create it first.")
-
-        # Apply label based on resource type
-        if resource_type == "campaign":
-            service_name = "CampaignLabelService"
-            operation_type = "CampaignLabelOperation"
-            label_operation = self.client.get_type(operation_type)
-            label_link = label_operation.create
-            label_link.campaign = self.client.get_service("CampaignService").campaign_path(customer_id, resource_id)
-            label_link.label = self.client.get_service("LabelService").label_path(customer_id, label_id)
-
-        elif resource_type == "ad_group":
-            service_name = "AdGroupLabelService"
-            operation_type = "AdGroupLabelOperation"
-            label_operation = self.client.get_type(operation_type)
-            label_link = label_operation.create
-            label_link.ad_group = self.client.get_service("AdGroupService").ad_group_path(customer_id, resource_id)
-            label_link.label = self.client.get_service("LabelService").label_path(customer_id, label_id)
-
-        elif resource_type == "ad":
-            service_name = "AdGroupAdLabelService"
-            operation_type = "AdGroupAdLabelOperation"
-            # For ads, resource_id should be in format "adGroupId_adId"
-            ad_group_id, ad_id = resource_id.split('_')
-            label_operation = self.client.get_type(operation_type)
-            label_link = label_operation.create
-            label_link.ad_group_ad = self.client.get_service("AdGroupAdService").ad_group_ad_path(
-                customer_id, ad_group_id, ad_id
-            )
-            label_link.label = self.client.get_service("LabelService").label_path(customer_id, label_id)
-
-        elif resource_type == "keyword":
-            service_name = "AdGroupCriterionLabelService"
-            operation_type = "AdGroupCriterionLabelOperation"
-            # For keywords, resource_id should be in format "adGroupId_criterionId"
-            ad_group_id, criterion_id = resource_id.split('_')
-            label_operation = self.client.get_type(operation_type)
-            label_link = label_operation.create
-            label_link.ad_group_criterion = self.client.get_service("AdGroupCriterionService").ad_group_criterion_path(
-                customer_id, ad_group_id, criterion_id
-            )
-            label_link.label = self.client.get_service("LabelService").label_path(customer_id, label_id)
+        Args:
+            customer_id: Customer ID
+            items: (label_name, resource_type, resource_id) tuples
 
-        else:
-            raise ValueError(f"Invalid resource_type: {resource_type}. Must be campaign, ad_group, ad, or keyword")
+        Returns:
+            Removal confirmation with the resolved label IDs
+        """
+        return self._mutate_label_links(customer_id, items, remove=True)
 
-        # Apply the label
-        service = self.client.get_service(service_name)
-        response = service.mutate(
-            customer_id=customer_id,
-            operations=[label_operation]
-        )
+    def _mutate_label_links(
+        self,
+        customer_id: str,
+        items: List[Tuple[str, str, str]],
+        remove: bool
+    ) -> Dict[str, Any]:
+        """Create or remove label links for any mix of resource types.
+
+        All links go to GoogleAdsService.mutate in a single request, and each
+        label name is resolved to an ID once. The request is atomic: if any
+        link fails, none are applied.
+
+        Args:
+            customer_id: Customer ID
+            items: (label_name, resource_type, resource_id) tuples
+            remove: Remove the links instead of creating them
+
+        Returns:
+            Mutation result
+        """
+        action = "remove" if remove else "apply"
+
+        # Validate everything before any request is made
+        links = [None] * len(items)
+        for i, (label_name, resource_type, resource_id) in enumerate(items):
+            if not all([label_name, resource_type, resource_id]):
+                raise ValueError(f"label_name, resource_type, and resource_id are required for {action} action")
+            links[i] = self._label_link(resource_type, resource_id)
+
+        label_ids = {
+            label_name: self._get_label_id_by_name(customer_id, label_name)
+            for label_name in dict.fromkeys(item[0] for item in items)
+        }
+        missing = [label_name for label_name, label_id in label_ids.items() if not label_id]
+        if missing:
+            names = ", ".join(f"'{label_name}'" for label_name in missing)
+            raise ValueError(f"Label {names} not found" + ("" if remove else ". Create it first."))
+
+        mutate_operations = [None] * len(items)
+        for i, ((label_name, _, _), (link, resource_ids)) in enumerate(zip(items, links)):
+            mutate_operation = self._new_type("MutateOperation")
+            operation = getattr(mutate_operation, link.operation)
+            resource_key = "~".join(resource_ids)
+            label_id = label_ids[label_name]
+
+            if remove:
+                operation.remove = f"customers/{customer_id}/{link.links}/{resource_key}~{label_id}"
+            else:
+                label_link = operation.create
+                setattr(label_link, link.field, f"customers/{customer_id}/{link.resources}/{resource_key}")
+                label_link.label = f"customers/{customer_id}/labels/{label_id}"
+
+            mutate_operations[i] = mutate_operation
+
+        if mutate_operations:
+            self._service("GoogleAdsService").mutate(
+                customer_id=customer_id,
+                mutate_operations=mutate_operations
+            )
 
         audit_logger.log_api_call(
-            operation='apply_label',
+            operation=f'{action}_labels',
             customer_id=customer_id,
             details={
-                'label_name': label_name,
-                'resource_type': resource_type,
-                'resource_id': resource_id
+                'label_names': list(label_ids),
+                'resources': len(items)
             }
         )
 
+        return {
+            'action': 'removed' if remove else 'applied',
+            'total': len(items),
+            'label_ids': label_ids
+        }
+
+    def _apply_label(
+        self,
+        customer_id: str,
+        label_name: str,
+        resource_type: str,
+        resource_id: str
+    ) -> Dict[str, Any]:
+        """Apply label to a resource.
+
+        Args:
+            customer_id: Customer ID
+            label_name: Label name
+            resource_type: Resource type (campaign, ad_group, ad, keyword)
+            resource_id: Resource ID
+
+        Returns:
+            Application confirmation
+        """
+        result = self.apply_labels_batch(customer_id, [(label_name, resource_type, resource_id)])
+
         return {
             'action': 'applied',
             'label_name': label_name,
-            'label_id': label_id,
+            'label_id': result['label_ids'][label_name],
             'resource_type': resource_type,
             'resource_id': resource_id
         }
@@ -259,68 +439,7 @@ class LabelsManager:
         Returns:
             Removal confirmation
         """
-        if not all([label_name, resource_type, resource_id]):
-            raise ValueError("label_name, resource_type, and resource_id are required for remove action")
-
-        # Get label ID by name
-        label_id = self._get_label_id_by_name(customer_id, label_name)
-
-        if not label_id:
-            raise ValueError(f"Label '{label_name}' not found")
-
-        # Build resource name to remove
-        if resource_type == "campaign":
-            service_name = "CampaignLabelService"
-            operation_type = "CampaignLabelOperation"
-            resource_name = self.client.get_service(service_name).campaign_label_path(
-                customer_id, resource_id, label_id
-            )
-
-        elif resource_type == "ad_group":
-            service_name = "AdGroupLabelService"
-            operation_type = "AdGroupLabelOperation"
-            resource_name = self.client.get_service(service_name).ad_group_label_path(
-                customer_id, resource_id, label_id
-            )
-
-        elif resource_type == "ad":
-            service_name = "AdGroupAdLabelService"
-            operation_type = "AdGroupAdLabelOperation"
-            ad_group_id, ad_id = resource_id.split('_')
-            resource_name = self.client.get_service(service_name).ad_group_ad_label_path(
-                customer_id, ad_group_id, ad_id, label_id
-            )
-
-        elif resource_type == "keyword":
-            service_name = "AdGroupCriterionLabelService"
-            operation_type = "AdGroupCriterionLabelOperation"
-            ad_group_id, criterion_id = resource_id.split('_')
-            resource_name = self.client.get_service(service_name).ad_group_criterion_label_path(
-                customer_id, ad_group_id, criterion_id, label_id
-            )
-
-        else:
-            raise ValueError(f"Invalid resource_type: {resource_type}")
-
-        # Remove the label
-        label_operation = self.client.get_type(operation_type)
-        label_operation.remove = resource_name
-
-        service = self.client.get_service(service_name)
-        service.mutate(
-            customer_id=customer_id,
-            operations=[label_operation]
-        )
-
-        audit_logger.log_api_call(
-            operation='remove_label',
-            customer_id=customer_id,
-            details={
-                'label_name': label_name,
-                'resource_type': resource_type,
-                'resource_id': resource_id
-            }
-        )
+        self.remove_labels_batch(customer_id, [(label_name, resource_type, resource_id)])
 
         return {
             'action': 'removed',
@@ -329,80 +448,44 @@ class LabelsManager:
             'resource_id': resource_id
         }
 
-    def _list_labels(
+    def iter_labels(
         self,
         customer_id: str,
         resource_type: Optional[str] = None,
         resource_id: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """List all labels or labels for a specific resource.
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield labels one at a time, for all labels or a specific resource.
+
+        Rows are converted as they are read, so callers that only need the
+        first few labels can stop early without building the full list. The
+        list_labels audit entry is written once every row has been read.
 
         Args:
             customer_id: Customer ID
             resource_type: Optional resource type filter
             resource_id: Optional resource ID filter
 
-        Returns:
-            List of labels
+        Yields:
+            Label data dicts
         """
         if resource_type and resource_id:
             # Get labels for specific resource
-            query_parts = []
-
-            if resource_type == "campaign":
-                query_parts = [
-                    "SELECT campaign_label.label, label.name, label.description,",
-                    "label.status, label.background_color, label.text_color",
-                    "FROM campaign_label",
-                    f"WHERE campaign.id = {resource_id}"
-                ]
-            elif resource_type == "ad_group":
-                query_parts = [
-                    "SELECT ad_group_label.label, label.name, label.description,",
-                    "label.status, label.background_color, label.text_color",
-                    "FROM ad_group_label",
-                    f"WHERE ad_group.id = {resource_id}"
-                ]
-            elif resource_type == "ad":
-                ad_group_id, ad_id = resource_id.split('_')
-                query_parts = [
-                    "SELECT ad_group_ad_label.label, label.name, label.description,",
-                    "label.status, label.background_color, label.text_color",
-                    "FROM ad_group_ad_label",
-                    f"WHERE ad_group.id = {ad_group_id} AND ad_group_ad.ad.id = {ad_id}"
-                ]
-            elif resource_type == "keyword":
-                ad_group_id, criterion_id = resource_id.split('_')
-                query_parts = [
-                    "SELECT ad_group_criterion_label.label, label.name, label.description,",
-                    "label.status, label.background_color, label.text_color",
-                    "FROM ad_group_criterion_label",
-                    f"WHERE ad_group.id = {ad_group_id} AND ad_group_criterion.criterion_id = {criterion_id}"
-                ]
-            else:
-                raise ValueError(f"Invalid resource_type: {resource_type}")
-
-            query = " ".join(query_parts)
+            _, resource_ids = self._label_link(resource_type, resource_id)
+            query = _LIST_RESOURCE_LABELS[resource_type].format(*resource_ids)
 
         else:
             # Get all labels
-            query = """
-                SELECT label.id, label.name, label.description, label.status,
-                       label.background_color, label.text_color
-                FROM label
-                ORDER BY label.name
-            """
-
-        ga_service = self.client.get_service("GoogleAdsService")
-        request = self.client.get_type("SearchGoogleAdsRequest")
+            query = _LIST_LABELS_ALL
+
+        ga_service = self._service("GoogleAdsService")
+        request = self._new_type("SearchGoogleAdsRequest")
         request.customer_id = customer_id
-        request.query = query.strip()
+        request.query = query
 
         response = ga_service.search(request=request)
 
-        labels = []
         for row in response:
-            label_data = {
+            yield {
                 'label_id': row.label.id if hasattr(row, 'label') else None,
                 'label_name': row.label.name,
                 'description': row.label.description if row.label.description else '',
@@ -410,14 +493,33 @@ class LabelsManager:
                 'background_color': row.label.background_color,
                 'text_color': row.label.text_color
             }
-            labels.append(label_data)
 
+        # Logged once the listing has been read in full, so a search that
+        # fails partway through is not recorded as a completed call
         audit_logger.log_api_call(
             operation='list_labels',
             customer_id=customer_id,
             details={'resource_type': resource_type, 'resource_id': resource_id}
         )
 
+    def _list_labels(
+        self,
+        customer_id: str,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """List all labels or labels for a specific resource.
+
+        Args:
+            customer_id: Customer ID
+            resource_type: Optional resource type filter
+            resource_id: Optional resource ID filter
+
+        Returns:
+            List of labels
+        """
+        labels = list(self.iter_labels(customer_id, resource_type, resource_id))
+
         return {
             'action': 'listed',
             'total_labels': len(labels),
@@ -435,7 +537,7 @@ class LabelsManager:
 
         Args:
             customer_id: Customer ID
-            label_identifier: Label ID or label name
+            label_identifier: Label ID, label resource name, or label name
 
         Returns:
             Deletion confirmation
@@ -443,8 +545,13 @@ class LabelsManager:
         if not label_identifier:
             raise ValueError("label_id or label_name is required for delete action")
 
-        # Check if identifier is a name or ID
-        if label_identifier.isdigit():
+        # Check if identifier is a resource name, ID, or name
+        if label_identifier.startswith('customers/'):
+            # customers/{customer_id}/labels/{label_id}, as returned on create
+            label_id = label_identifier.rsplit('/', 1)[-1]
+            if not label_id.isdecimal():
+                raise ValueError(f"Invalid label resource name: {label_identifier}")
+        elif label_identifier.isdecimal():
             label_id = label_identifier
         else:
             label_id = self._get_label_id_by_name(customer_id, label_identifier)
@@ -452,8 +559,8 @@ class LabelsManager:
         if not label_id:
             raise ValueError(f"Label '{label_identifier}' not found")
 
-        label_service = self.client.get_service("LabelService")
-        label_operation = self.client.get_type("LabelOperation")
+        label_service = self._service("LabelService")
+        label_operation = self._new_type("LabelOperation")
 
         label_operation.remove = label_service.label_path(customer_id, label_id)
 
@@ -462,6 +569,9 @@ class LabelsManager:
             operations=[label_operation]
         )
 
+        # Cached names are keyed by name, so drop every lookup for the customer
+        get_cache_manager().invalidate(customer_id, ResourceType.LABEL, "label_id")
+
         audit_logger.log_api_call(
             operation='delete_label',
             customer_id=customer_id,
@@ -485,24 +595,32 @@ class LabelsManager:
             label_name: Label name
 
         Returns:
-            Label ID if found, None otherwise
+            Label ID if found, None otherwise. Found IDs are cached under
+            ResourceType.LABEL.
         """
+        cache = get_cache_manager()
+        label_id = cache.get(customer_id, ResourceType.LABEL, "label_id", label_name=label_name)
+        if label_id is not None:
+            return label_id
+
         query = f"""
             SELECT label.id
             FROM label
-            WHERE label.name = '{label_name}'
+            WHERE label.name = '{_escape_gaql(label_name)}'
             LIMIT 1
         """
 
-        ga_service = self.client.get_service("GoogleAdsService")
-        request = self.client.get_type("SearchGoogleAdsRequest")
+        ga_service = self._service("GoogleAdsService")
+        request = self._new_type("SearchGoogleAdsRequest")
         request.customer_id = customer_id
         request.query = query
 
         try:
             response = ga_service.search(request=request)
             for row in response:
-                return str(row.label.id)
+                label_id = str(row.label.id)
+                cache.set(customer_id, ResourceType.LABEL, "label_id", label_id, label_name=label_name)
+                return label_id
         except Exception:
             return None
 
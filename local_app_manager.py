@@ -16,10 +16,111 @@ App Campaigns:
 - App store optimization
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 from google.ads.googleads.client import GoogleAdsClient
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache, partial, wraps
+import asyncio
+import inspect
+import threading
+import numpy as np
+import proto
+
+from error_handler import ErrorCategory, ErrorHandler, with_retry
+from cache_manager import get_cache_manager, ResourceType
+
+# Temporary ID linking a new budget to its campaign within one mutate request
+BUDGET_TEMPORARY_ID = -1
+
+# Maximum number of customer accounts the *_many methods query at once
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Worker threads shared by every create_campaigns_bulk call, created on
+# first use
+CREATE_MAX_WORKERS = 10
+_create_executor: Optional[ThreadPoolExecutor] = None
+_create_executor_lock = threading.Lock()
+
+# Local/App report results are cached in CacheManager under
+# ResourceType.PERFORMANCE, keyed by customer, getter and arguments, so
+# campaign writes through any tool drop them. Per-key locks make concurrent
+# misses for one report share a single API call.
+_report_key_locks: Dict[Tuple[Any, ...], threading.Lock] = {}
+_report_key_locks_lock = threading.Lock()
+
+# Batches with more rows than this convert their cost column from micros in
+# one NumPy division; below it the per-row division is cheaper
+VECTORIZE_MIN_ROWS = 1000
+
+# Predefined GAQL date ranges accepted by the report getters
+DATE_RANGES = frozenset({
+    "TODAY", "YESTERDAY", "LAST_7_DAYS", "LAST_14_DAYS", "LAST_30_DAYS",
+    "LAST_BUSINESS_WEEK", "THIS_MONTH", "LAST_MONTH", "THIS_WEEK_SUN_TODAY",
+    "THIS_WEEK_MON_TODAY", "LAST_WEEK_SUN_SAT", "LAST_WEEK_MON_SUN",
+})
+
+# GAQL for the report getters, filled in by _build_query
+_LOCAL_PERFORMANCE_QUERY = """
+SELECT
+    campaign.id,
+    campaign.name,
+    metrics.impressions,
+    metrics.clicks,
+    metrics.ctr,
+    metrics.cost_micros,
+    metrics.conversions,
+    metrics.conversions_value,
+    metrics.view_through_conversions
+FROM campaign
+WHERE campaign.advertising_channel_type = 'LOCAL'
+  AND segments.date DURING {date_range}{campaign_filter}
+ORDER BY metrics.impressions DESC"""
+
+_STORE_VISITS_QUERY = """
+SELECT
+    campaign.id,
+    campaign.name,
+    metrics.conversions,
+    metrics.conversions_value,
+    segments.conversion_action_name
+FROM campaign
+WHERE campaign.advertising_channel_type = 'LOCAL'
+  AND segments.date DURING {date_range}
+  AND segments.conversion_action_name LIKE '%store visit%'{campaign_filter}"""
+
+_APP_PERFORMANCE_QUERY = """
+SELECT
+    campaign.id,
+    campaign.name,
+    campaign.app_campaign_setting.app_id,
+    campaign.app_campaign_setting.app_store,
+    metrics.impressions,
+    metrics.clicks,
+    metrics.ctr,
+    metrics.cost_micros,
+    metrics.conversions,
+    metrics.conversions_value,
+    metrics.cost_per_conversion
+FROM campaign
+WHERE campaign.advertising_channel_sub_type = 'APP_CAMPAIGN'
+  AND segments.date DURING {date_range}{campaign_filter}
+ORDER BY metrics.impressions DESC"""
+
+_APP_CONVERSIONS_QUERY = """
+SELECT
+    campaign.id,
+    campaign.name,
+    segments.conversion_action_name,
+    segments.conversion_action_category,
+    metrics.conversions,
+    metrics.conversions_value
+FROM campaign
+WHERE campaign.advertising_channel_sub_type = 'APP_CAMPAIGN'
+  AND segments.date DURING {date_range}{campaign_filter}
+ORDER BY metrics.conversions DESC"""
 
 
 class AppCampaignAppStore(str, Enum):
@@ -57,6 +158,257 @@ class AppCampaignConfig:
     target_cpa: Optional[float] = None
 
 
+def _report_to_cache(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert report rows to plain lists so any cache backend can store them."""
+    campaigns = result.get('campaigns')
+    if isinstance(campaigns, list):
+        return {**result, 'campaigns': [list(row) for row in campaigns]}
+    return result
+
+
+def _report_from_cache(cached: Dict[str, Any], row_type: Optional[type]) -> Dict[str, Any]:
+    """Rebuild report rows stored by _report_to_cache."""
+    if row_type is not None and isinstance(cached.get('campaigns'), list):
+        cached['campaigns'] = [row_type(*values) for values in cached['campaigns']]
+    return cached
+
+
+def cached_report(row_type: Optional[type] = None):
+    """Cache a LocalAppManager report getter's result per customer and arguments.
+
+    The wrapped getter takes an extra use_cache keyword (default True);
+    pass use_cache=False to bypass the cache and fetch fresh data. Each call
+    returns its own copy of the report.
+
+    Args:
+        row_type: NamedTuple type of the report's 'campaigns' rows, if any
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, use_cache: bool = True, **kwargs):
+            if not use_cache:
+                return method(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            del arguments['self']
+            customer_id = arguments.pop('customer_id')
+            operation = method.__name__
+            cache = get_cache_manager()
+
+            cached = cache.get(customer_id, ResourceType.PERFORMANCE, operation, **arguments)
+            if cached is not None:
+                return _report_from_cache(cached, row_type)
+
+            key = (customer_id, operation, tuple(arguments.items()))
+            with _report_key_locks_lock:
+                key_lock = _report_key_locks.setdefault(key, threading.Lock())
+
+            with key_lock:
+                try:
+                    cached = cache.get(customer_id, ResourceType.PERFORMANCE, operation, **arguments)
+                    if cached is not None:
+                        return _report_from_cache(cached, row_type)
+
+                    result = method(self, *args, **kwargs)
+                    cache.set(
+                        customer_id, ResourceType.PERFORMANCE, operation,
+                        _report_to_cache(result), **arguments
+                    )
+                finally:
+                    with _report_key_locks_lock:
+                        _report_key_locks.pop(key, None)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@lru_cache(maxsize=256)
+def _build_query(template: str, date_range: str, campaign_id: Optional[str]) -> str:
+    """Fill in a report query template, validating values bound into the GAQL.
+
+    Args:
+        template: Query template with {date_range} and {campaign_filter} fields
+        date_range: Predefined GAQL date range
+        campaign_id: Optional campaign ID filter
+
+    Returns:
+        GAQL query
+
+    Raises:
+        ValueError: If date_range or campaign_id is not valid
+    """
+    if date_range not in DATE_RANGES:
+        raise ValueError(f"Invalid date_range: {date_range}. Must be one of {', '.join(sorted(DATE_RANGES))}")
+
+    campaign_filter = ""
+    if campaign_id:
+        if not str(campaign_id).isdecimal():
+            raise ValueError(f"campaign_id must be numeric, got {campaign_id!r}")
+        campaign_filter = f" AND campaign.id = {campaign_id}"
+
+    return template.format(date_range=date_range, campaign_filter=campaign_filter)
+
+
+def _enum_name(message: Any, field_name: str) -> str:
+    """Name of an enum field's value on a raw protobuf message.
+
+    Args:
+        message: Raw protobuf message
+        field_name: Name of the enum field
+
+    Returns:
+        Enum value name, or UNKNOWN for values this client version lacks
+    """
+    field = message.DESCRIPTOR.fields_by_name[field_name]
+    value = field.enum_type.values_by_number.get(getattr(message, field_name))
+    return value.name if value is not None else 'UNKNOWN'
+
+
+class LocalPerformanceRow(NamedTuple):
+    """One Local campaign performance row."""
+    campaign_id: str
+    campaign_name: str
+    impressions: int
+    clicks: int
+    ctr: float
+    cost: float
+    conversions: float
+    conversion_value: float
+    view_through_conversions: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict for JSON responses."""
+        return self._asdict()
+
+
+class StoreVisitRow(NamedTuple):
+    """One store visit conversion row."""
+    campaign_id: str
+    campaign_name: str
+    conversion_action: str
+    store_visits: float
+    value: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict for JSON responses."""
+        return self._asdict()
+
+
+class AppPerformanceRow(NamedTuple):
+    """One App campaign performance row."""
+    campaign_id: str
+    campaign_name: str
+    app_id: str
+    app_store: str
+    impressions: int
+    clicks: int
+    ctr: float
+    cost: float
+    conversions: float
+    conversion_value: float
+    cost_per_conversion: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dict for JSON responses."""
+        return self._asdict()
+
+
+def _costs(results: Any) -> List[float]:
+    """Cost of each row in a batch, converted from micros to currency units.
+
+    Args:
+        results: Batch of GoogleAdsRow protobuf messages
+
+    Returns:
+        Costs in row order
+    """
+    if len(results) > VECTORIZE_MIN_ROWS:
+        cost_micros = array('q', [row.metrics.cost_micros for row in results])
+        return (np.frombuffer(cost_micros, dtype=np.int64) / 1_000_000).tolist()
+    return [row.metrics.cost_micros / 1_000_000 for row in results]
+
+
+def _local_performance_row(row: Any, cost: float) -> LocalPerformanceRow:
+    """Map a Local campaign performance row to a result record."""
+    campaign = row.campaign
+    metrics = row.metrics
+    return LocalPerformanceRow(
+        str(campaign.id),
+        campaign.name,
+        metrics.impressions,
+        metrics.clicks,
+        metrics.ctr,
+        cost,
+        metrics.conversions,
+        metrics.conversions_value,
+        metrics.view_through_conversions
+    )
+
+
+def _store_visit_row(row: Any) -> StoreVisitRow:
+    """Map a store visit conversion row to a result record."""
+    return StoreVisitRow(
+        str(row.campaign.id),
+        row.campaign.name,
+        row.segments.conversion_action_name,
+        row.metrics.conversions,
+        row.metrics.conversions_value
+    )
+
+
+def _app_performance_row(row: Any, cost: float) -> AppPerformanceRow:
+    """Map an App campaign performance row to a result record."""
+    campaign = row.campaign
+    metrics = row.metrics
+    return AppPerformanceRow(
+        str(campaign.id),
+        campaign.name,
+        campaign.app_campaign_setting.app_id,
+        _enum_name(campaign.app_campaign_setting, 'app_store'),
+        metrics.impressions,
+        metrics.clicks,
+        metrics.ctr,
+        cost,
+        metrics.conversions,
+        metrics.conversions_value,
+        metrics.cost_per_conversion
+    )
+
+
+def _campaign_create_executor() -> ThreadPoolExecutor:
+    """Return the shared campaign creation thread pool, creating it on first use."""
+    global _create_executor
+
+    with _create_executor_lock:
+        if _create_executor is None:
+            _create_executor = ThreadPoolExecutor(
+                max_workers=CREATE_MAX_WORKERS,
+                thread_name_prefix="campaign-create"
+            )
+        return _create_executor
+
+
+# Creates are not idempotent, so only quota errors (where nothing was
+# applied) are retried
+@with_retry(max_attempts=3, max_backoff=30.0, retryable_errors=[ErrorCategory.RATE_LIMIT])
+def _create_with_retry(create: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Run a campaign create call, retrying when the API quota is exhausted."""
+    return create()
+
+
+@with_retry(max_attempts=3, max_backoff=30.0)
+async def _call_with_retry(call: Callable[[], Any]) -> Any:
+    """Run a blocking API call in a worker thread, retrying transient and quota errors."""
+    return await asyncio.to_thread(call)
+
+
 class LocalAppManager:
     """Manager for Local and App campaigns."""
 
@@ -67,6 +419,234 @@ class LocalAppManager:
             client: Authenticated GoogleAdsClient instance
         """
         self.client = client
+        self._services: Dict[str, Any] = {}
+        self._types: Dict[str, Any] = {}
+
+    def _service(self, name: str) -> Any:
+        """Return the named service client, creating it on first use.
+
+        Args:
+            name: Service name, e.g. "GoogleAdsService"
+
+        Returns:
+            Service client
+        """
+        service = self._services.get(name)
+        if service is None:
+            service = self._services[name] = self.client.get_service(name)
+        return service
+
+    def _new_type(self, name: str) -> Any:
+        """Return a new instance of the named message type.
+
+        The message class is resolved through the client once and then
+        instantiated directly.
+
+        Args:
+            name: Message type name, e.g. "MutateOperation"
+
+        Returns:
+            Empty message instance
+        """
+        message_type = self._types.get(name)
+        if message_type is None:
+            message_type = self._types[name] = type(self.client.get_type(name))
+        return message_type()
+
+    def _stream_batches(self, customer_id: str, query: str) -> Iterator[Any]:
+        """Run a GAQL query over search_stream and yield each batch of rows.
+
+        Batches are unwrapped to raw protobuf, so row field reads skip the
+        proto-plus wrappers; the client itself keeps proto-plus for writes.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            query: GAQL query
+
+        Yields:
+            Sequences of GoogleAdsRow protobuf messages, one per batch
+        """
+        ga_service = self._service("GoogleAdsService")
+        for batch in ga_service.search_stream(customer_id=customer_id, query=query):
+            if isinstance(batch, proto.Message):
+                batch = type(batch).pb(batch)
+            yield batch.results
+
+    def _stream_rows(self, customer_id: str, query: str) -> Iterator[Any]:
+        """Run a GAQL query over search_stream and yield rows as they arrive.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            query: GAQL query
+
+        Yields:
+            GoogleAdsRow protobuf messages
+        """
+        for results in self._stream_batches(customer_id, query):
+            yield from results
+
+    async def _gather_customers(
+        self,
+        method: Callable[..., Dict[str, Any]],
+        customer_ids: Iterable[str],
+        max_concurrency: int,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Run a per-customer getter for many customers concurrently.
+
+        Args:
+            method: Getter taking customer_id as its first argument
+            customer_ids: Customer IDs (without hyphens)
+            max_concurrency: Maximum number of customers queried at once
+            **kwargs: Extra arguments passed to the getter
+
+        Returns:
+            Results and error messages keyed by customer ID
+        """
+        customer_ids = list(dict.fromkeys(customer_ids))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(customer_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await _call_with_retry(partial(method, customer_id, **kwargs))
+
+        results = await asyncio.gather(
+            *(run(customer_id) for customer_id in customer_ids),
+            return_exceptions=True
+        )
+
+        # One failing account should not discard the others' results
+        by_customer = {}
+        errors = {}
+        for customer_id, result in zip(customer_ids, results):
+            if isinstance(result, Exception):
+                errors[customer_id] = ErrorHandler.categorize_error(result).message
+            else:
+                by_customer[customer_id] = result
+
+        return {
+            'results': by_customer,
+            'errors': errors,
+            'total_customers': len(customer_ids)
+        }
+
+    def _search_page(
+        self,
+        customer_id: str,
+        query: str,
+        page_token: Optional[str] = None
+    ) -> Tuple[Any, Optional[str]]:
+        """Fetch a single page of a GAQL query with search.
+
+        The API fixes the page size at 10,000 rows, so this bounds the size of
+        one response; later pages are only fetched when asked for.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            query: GAQL query
+            page_token: Token from a previous page, or None for the first page
+
+        Returns:
+            Tuple of (GoogleAdsRow protobuf messages, next page token or None
+            on the last page)
+        """
+        request = self._new_type("SearchGoogleAdsRequest")
+        request.customer_id = customer_id
+        request.query = query
+        if page_token:
+            request.page_token = page_token
+
+        # The pager's first page is the initial response; no further requests
+        page = next(iter(self._service("GoogleAdsService").search(request=request).pages))
+        if isinstance(page, proto.Message):
+            page = type(page).pb(page)
+
+        return page.results, page.next_page_token or None
+
+    def _summary_totals(self, customer_id: str, query: str) -> Tuple[float, float]:
+        """Get a query's conversion totals from its server-computed summary row.
+
+        The request asks for SUMMARY_ROW_ONLY, so the per-row results are
+        never sent.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            query: GAQL query selecting metrics.conversions and
+                metrics.conversions_value
+
+        Returns:
+            Tuple of (total conversions, total conversion value)
+        """
+        request = self._new_type("SearchGoogleAdsStreamRequest")
+        request.customer_id = customer_id
+        request.query = query
+        request.summary_row_setting = self.client.enums.SummaryRowSettingEnum.SUMMARY_ROW_ONLY
+
+        conversions = value = 0.0
+        for batch in self._service("GoogleAdsService").search_stream(request=request):
+            if isinstance(batch, proto.Message):
+                batch = type(batch).pb(batch)
+            if batch.HasField('summary_row'):
+                conversions = batch.summary_row.metrics.conversions
+                value = batch.summary_row.metrics.conversions_value
+
+        return conversions, value
+
+    def _budget_and_campaign_operations(
+        self,
+        customer_id: str,
+        name: str,
+        budget_amount: float
+    ) -> Tuple[List[Any], Any]:
+        """Build budget and campaign create operations for one mutate request.
+
+        The campaign points at the budget through a temporary resource name,
+        which the API resolves when both are created in the same request.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            name: Campaign name
+            budget_amount: Daily budget amount
+
+        Returns:
+            Tuple of (mutate operations, campaign to fill in)
+        """
+        budget_resource_name = f"customers/{customer_id}/campaignBudgets/{BUDGET_TEMPORARY_ID}"
+
+        budget_operation = self._new_type("MutateOperation")
+        budget = budget_operation.campaign_budget_operation.create
+        budget.resource_name = budget_resource_name
+        budget.name = f"{name} Budget"
+        budget.amount_micros = int(budget_amount * 1_000_000)
+        budget.delivery_method = self.client.enums.BudgetDeliveryMethodEnum.STANDARD
+
+        campaign_operation = self._new_type("MutateOperation")
+        campaign = campaign_operation.campaign_operation.create
+        campaign.name = name
+        campaign.campaign_budget = budget_resource_name
+
+        return [budget_operation, campaign_operation], campaign
+
+    def _mutate_budget_and_campaign(
+        self,
+        customer_id: str,
+        mutate_operations: List[Any]
+    ) -> str:
+        """Create a budget and campaign in a single GoogleAdsService.mutate call.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            mutate_operations: Operations from _budget_and_campaign_operations
+
+        Returns:
+            Campaign resource name
+        """
+        ga_service = self._service("GoogleAdsService")
+        response = ga_service.mutate(
+            customer_id=customer_id,
+            mutate_operations=mutate_operations
+        )
+        return response.mutate_operation_responses[1].campaign_result.resource_name
 
     def create_local_campaign(
         self,
@@ -82,30 +662,14 @@ class LocalAppManager:
         Returns:
             Created campaign details
         """
-        campaign_service = self.client.get_service("CampaignService")
-        campaign_budget_service = self.client.get_service("CampaignBudgetService")
-
-        # Create campaign budget
-        budget_operation = self.client.get_type("CampaignBudgetOperation")
-        budget = budget_operation.create
-        budget.name = f"{config.name} Budget"
-        budget.amount_micros = int(config.budget_amount * 1_000_000)
-        budget.delivery_method = self.client.enums.BudgetDeliveryMethodEnum.STANDARD
-
-        budget_response = campaign_budget_service.mutate_campaign_budgets(
-            customer_id=customer_id,
-            operations=[budget_operation]
+        # Budget and campaign are created together in one request
+        mutate_operations, campaign = self._budget_and_campaign_operations(
+            customer_id, config.name, config.budget_amount
         )
-        budget_resource_name = budget_response.results[0].resource_name
-
-        # Create local campaign
-        campaign_operation = self.client.get_type("CampaignOperation")
-        campaign = campaign_operation.create
 
-        campaign.name = config.name
+        # Local campaign
         campaign.advertising_channel_type = self.client.enums.AdvertisingChannelTypeEnum.LOCAL
         campaign.status = self.client.enums.CampaignStatusEnum.PAUSED
-        campaign.campaign_budget = budget_resource_name
 
         # Local campaign settings
         campaign.local_campaign_setting.location_source_type = (
@@ -113,141 +677,227 @@ class LocalAppManager:
         )
 
         # Bidding strategy - maximize conversions for local actions
-        campaign.maximize_conversions.CopyFrom(self.client.get_type("MaximizeConversions"))
+        campaign.maximize_conversions.CopyFrom(self._new_type("MaximizeConversions"))
 
-        # Create campaign
-        response = campaign_service.mutate_campaigns(
-            customer_id=customer_id,
-            operations=[campaign_operation]
-        )
-
-        campaign_id = response.results[0].resource_name.split('/')[-1]
+        # Create budget and campaign
+        resource_name = self._mutate_budget_and_campaign(customer_id, mutate_operations)
+        campaign_id = resource_name.split('/')[-1]
+        get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
 
         return {
             'campaign_id': campaign_id,
             'campaign_name': config.name,
-            'resource_name': response.results[0].resource_name,
+            'resource_name': resource_name,
             'budget': config.budget_amount,
             'location_count': len(config.location_ids),
             'optimization_goal': config.optimization_goal
         }
 
-    def get_local_performance(
+    def create_campaigns_bulk(
+        self,
+        customer_id: str,
+        configs: List[Union[LocalCampaignConfig, AppCampaignConfig]]
+    ) -> Dict[str, Any]:
+        """Create many Local and App campaigns concurrently.
+
+        Each config goes to create_local_campaign or create_app_campaign on a
+        shared thread pool, so the API round trips overlap.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            configs: Local and/or App campaign configurations
+
+        Returns:
+            Created campaign details in config order, and failures with the
+            index and name of their config
+        """
+        creators = {
+            LocalCampaignConfig: self.create_local_campaign,
+            AppCampaignConfig: self.create_app_campaign,
+        }
+
+        for config in configs:
+            if type(config) not in creators:
+                raise ValueError(f"Unsupported campaign config type: {type(config).__name__}")
+
+        executor = _campaign_create_executor()
+        futures = {
+            executor.submit(_create_with_retry, partial(creators[type(config)], customer_id, config)): index
+            for index, config in enumerate(configs)
+        }
+
+        created = [None] * len(configs)
+        failures = []
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                created[index] = future.result()
+            except Exception as e:
+                failures.append({
+                    'index': index,
+                    'campaign_name': configs[index].name,
+                    'error': ErrorHandler.categorize_error(e).message
+                })
+
+        failures.sort(key=lambda failure: failure['index'])
+
+        return {
+            'created': [result for result in created if result is not None],
+            'failures': failures,
+            'total': len(configs)
+        }
+
+    def iter_local_performance(
         self,
         customer_id: str,
         campaign_id: Optional[str] = None,
         date_range: str = "LAST_30_DAYS"
-    ) -> Dict[str, Any]:
-        """Get Local campaign performance metrics.
+    ) -> Iterator[LocalPerformanceRow]:
+        """Yield Local campaign performance metrics one campaign at a time.
 
         Args:
             customer_id: Customer ID (without hyphens)
             campaign_id: Optional campaign ID filter
             date_range: Date range for metrics
 
-        Returns:
-            Local campaign performance data
-        """
-        ga_service = self.client.get_service("GoogleAdsService")
-
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.ctr,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.conversions_value,
-                metrics.view_through_conversions
-            FROM campaign
-            WHERE campaign.advertising_channel_type = 'LOCAL'
-              AND segments.date DURING {date_range}
+        Yields:
+            Campaign performance rows
         """
+        query = _build_query(_LOCAL_PERFORMANCE_QUERY, date_range, campaign_id)
 
-        if campaign_id:
-            query += f" AND campaign.id = {campaign_id}"
+        for results in self._stream_batches(customer_id, query):
+            for row, cost in zip(results, _costs(results)):
+                yield _local_performance_row(row, cost)
 
-        query += " ORDER BY metrics.impressions DESC"
+    @cached_report(LocalPerformanceRow)
+    def get_local_performance(
+        self,
+        customer_id: str,
+        campaign_id: Optional[str] = None,
+        date_range: str = "LAST_30_DAYS",
+        paginate: bool = False,
+        page_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get Local campaign performance metrics.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            campaign_id: Optional campaign ID filter
+            date_range: Date range for metrics
+            paginate: Return one page of up to 10,000 campaigns with a
+                next_page_token instead of the full report
+            page_token: next_page_token from a previous page (implies paginate)
 
-        response = ga_service.search(customer_id=customer_id, query=query)
+        Returns:
+            Local campaign performance data, with campaigns as
+            LocalPerformanceRow records; cached under
+            ResourceType.PERFORMANCE unless called with use_cache=False
+        """
+        if paginate or page_token:
+            results, next_page_token = self._search_page(
+                customer_id, _build_query(_LOCAL_PERFORMANCE_QUERY, date_range, campaign_id), page_token
+            )
+            campaigns = [_local_performance_row(row, cost) for row, cost in zip(results, _costs(results))]
+            return {
+                'campaigns': campaigns,
+                'total_campaigns': len(campaigns),
+                'next_page_token': next_page_token
+            }
 
-        campaigns = []
-        for row in response:
-            campaigns.append({
-                'campaign_id': str(row.campaign.id),
-                'campaign_name': row.campaign.name,
-                'impressions': row.metrics.impressions,
-                'clicks': row.metrics.clicks,
-                'ctr': row.metrics.ctr,
-                'cost': row.metrics.cost_micros / 1_000_000,
-                'conversions': row.metrics.conversions,
-                'conversion_value': row.metrics.conversions_value,
-                'view_through_conversions': row.metrics.view_through_conversions
-            })
+        campaigns = list(self.iter_local_performance(customer_id, campaign_id, date_range))
 
         return {
             'campaigns': campaigns,
             'total_campaigns': len(campaigns)
         }
 
-    def get_store_visits(
+    async def get_local_performance_many(
         self,
-        customer_id: str,
+        customer_ids: Iterable[str],
         campaign_id: Optional[str] = None,
-        date_range: str = "LAST_30_DAYS"
+        date_range: str = "LAST_30_DAYS",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
     ) -> Dict[str, Any]:
-        """Get store visit conversion data.
+        """Get Local campaign performance for many customers concurrently.
 
         Args:
-            customer_id: Customer ID (without hyphens)
+            customer_ids: Customer IDs (without hyphens)
             campaign_id: Optional campaign ID filter
             date_range: Date range for metrics
+            max_concurrency: Maximum number of customers queried at once
 
         Returns:
-            Store visit conversion data
+            get_local_performance results and error messages keyed by customer ID
         """
-        ga_service = self.client.get_service("GoogleAdsService")
+        return await self._gather_customers(
+            self.get_local_performance, customer_ids, max_concurrency,
+            campaign_id=campaign_id, date_range=date_range
+        )
+
+    def iter_store_visits(
+        self,
+        customer_id: str,
+        campaign_id: Optional[str] = None,
+        date_range: str = "LAST_30_DAYS"
+    ) -> Iterator[StoreVisitRow]:
+        """Yield store visit conversion data one row at a time.
+
+        Args:
+            customer_id: Customer ID (without hyphens)
+            campaign_id: Optional campaign ID filter
+            date_range: Date range for metrics
 
+        Yields:
+            Store visit rows
+        """
         # Note: Store visits require Google My Business integration
         # and may take 4-6 weeks to accumulate data
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                metrics.conversions,
-                metrics.conversions_value,
-                segments.conversion_action_name
-            FROM campaign
-            WHERE campaign.advertising_channel_type = 'LOCAL'
-              AND segments.date DURING {date_range}
-              AND segments.conversion_action_name LIKE '%store visit%'
-        """
+        query = _build_query(_STORE_VISITS_QUERY, date_range, campaign_id)
+
+        for row in self._stream_rows(customer_id, query):
+            yield _store_visit_row(row)
+
+    @cached_report(StoreVisitRow)
+    def get_store_visits(
+        self,
+        customer_id: str,
+        campaign_id: Optional[str] = None,
+        date_range: str = "LAST_30_DAYS",
+        aggregate_only: bool = False
+    ) -> Dict[str, Any]:
+        """Get store visit conversion data.
 
-        if campaign_id:
-            query += f" AND campaign.id = {campaign_id}"
+        Args:
+            customer_id: Customer ID (without hyphens)
+            campaign_id: Optional campaign ID filter
+            date_range: Date range for metrics
+            aggregate_only: Only fetch the totals, computed server-side; the
+                campaigns list is left empty
 
-        response = ga_service.search(customer_id=customer_id, query=query)
+        Returns:
+            Store visit conversion data, with campaigns as StoreVisitRow
+            records; cached under ResourceType.PERFORMANCE unless called
+            with use_cache=False
+        """
+        if aggregate_only:
+            total_visits, total_value = self._summary_totals(
+                customer_id, _build_query(_STORE_VISITS_QUERY, date_range, campaign_id)
+            )
+            return {
+                'campaigns': [],
+                'total_store_visits': total_visits,
+                'total_value': total_value,
+                'has_data': total_visits > 0
+            }
 
         store_visits = []
         total_visits = 0
         total_value = 0
 
-        for row in response:
-            visits = row.metrics.conversions
-            value = row.metrics.conversions_value
-
-            store_visits.append({
-                'campaign_id': str(row.campaign.id),
-                'campaign_name': row.campaign.name,
-                'conversion_action': row.segments.conversion_action_name,
-                'store_visits': visits,
-                'value': value
-            })
-
-            total_visits += visits
-            total_value += value
+        for visit in self.iter_store_visits(customer_id, campaign_id, date_range):
+            store_visits.append(visit)
+            total_visits += visit.store_visits
+            total_value += visit.value
 
         return {
             'campaigns': store_visits,
@@ -256,6 +906,29 @@ class LocalAppManager:
             'has_data': len(store_visits) > 0
         }
 
+    def _set_maximize_conversions(self, campaign: Any, config: AppCampaignConfig) -> None:
+        """Bid with Maximize Conversions."""
+        campaign.maximize_conversions.CopyFrom(self._new_type("MaximizeConversions"))
+
+    def _set_target_cpa(self, campaign: Any, config: AppCampaignConfig) -> None:
+        """Bid with Target CPA when one is configured, else Maximize Conversions."""
+        if config.target_cpa:
+            campaign.target_cpa.target_cpa_micros = int(config.target_cpa * 1_000_000)
+        else:
+            self._set_maximize_conversions(campaign, config)
+
+    def _set_maximize_conversion_value(self, campaign: Any, config: AppCampaignConfig) -> None:
+        """Bid with Maximize Conversion Value."""
+        campaign.maximize_conversion_value.CopyFrom(self._new_type("MaximizeConversionValue"))
+
+    # Bidding strategy setter per App campaign goal; goals not listed use
+    # Maximize Conversions
+    _APP_BIDDING_STRATEGIES = {
+        AppCampaignBiddingStrategyGoalType.OPTIMIZE_INSTALLS_TARGET_INSTALL_COST: _set_target_cpa,
+        AppCampaignBiddingStrategyGoalType.OPTIMIZE_IN_APP_CONVERSIONS_TARGET_CONVERSION_COST: _set_target_cpa,
+        AppCampaignBiddingStrategyGoalType.OPTIMIZE_RETURN_ON_ADVERTISING_SPEND: _set_maximize_conversion_value,
+    }
+
     def create_app_campaign(
         self,
         customer_id: str,
@@ -270,31 +943,15 @@ class LocalAppManager:
         Returns:
             Created campaign details
         """
-        campaign_service = self.client.get_service("CampaignService")
-        campaign_budget_service = self.client.get_service("CampaignBudgetService")
-
-        # Create campaign budget
-        budget_operation = self.client.get_type("CampaignBudgetOperation")
-        budget = budget_operation.create
-        budget.name = f"{config.name} Budget"
-        budget.amount_micros = int(config.budget_amount * 1_000_000)
-        budget.delivery_method = self.client.enums.BudgetDeliveryMethodEnum.STANDARD
-
-        budget_response = campaign_budget_service.mutate_campaign_budgets(
-            customer_id=customer_id,
-            operations=[budget_operation]
+        # Budget and campaign are created together in one request
+        mutate_operations, campaign = self._budget_and_campaign_operations(
+            customer_id, config.name, config.budget_amount
         )
-        budget_resource_name = budget_response.results[0].resource_name
-
-        # Create app campaign
-        campaign_operation = self.client.get_type("CampaignOperation")
-        campaign = campaign_operation.create
 
-        campaign.name = config.name
+        # App campaign
         campaign.advertising_channel_type = self.client.enums.AdvertisingChannelTypeEnum.MULTI_CHANNEL
         campaign.advertising_channel_sub_type = self.client.enums.AdvertisingChannelSubTypeEnum.APP_CAMPAIGN
         campaign.status = self.client.enums.CampaignStatusEnum.PAUSED
-        campaign.campaign_budget = budget_resource_name
 
         # App campaign settings
         campaign.app_campaign_setting.app_id = config.app_id
@@ -308,108 +965,120 @@ class LocalAppManager:
         )
 
         # Set bidding strategy based on goal type
-        if config.bidding_strategy_goal_type.value.startswith("OPTIMIZE_INSTALLS"):
-            if config.target_cpa:
-                campaign.target_cpa.target_cpa_micros = int(config.target_cpa * 1_000_000)
-            else:
-                campaign.maximize_conversions.CopyFrom(self.client.get_type("MaximizeConversions"))
-        elif "TARGET_CONVERSION_COST" in config.bidding_strategy_goal_type.value:
-            if config.target_cpa:
-                campaign.target_cpa.target_cpa_micros = int(config.target_cpa * 1_000_000)
-            else:
-                campaign.maximize_conversions.CopyFrom(self.client.get_type("MaximizeConversions"))
-        elif config.bidding_strategy_goal_type.value == "OPTIMIZE_RETURN_ON_ADVERTISING_SPEND":
-            campaign.maximize_conversion_value.CopyFrom(self.client.get_type("MaximizeConversionValue"))
-        else:
-            campaign.maximize_conversions.CopyFrom(self.client.get_type("MaximizeConversions"))
-
-        # Create campaign
-        response = campaign_service.mutate_campaigns(
-            customer_id=customer_id,
-            operations=[campaign_operation]
+        set_strategy = self._APP_BIDDING_STRATEGIES.get(
+            config.bidding_strategy_goal_type, LocalAppManager._set_maximize_conversions
         )
+        set_strategy(self, campaign, config)
 
-        campaign_id = response.results[0].resource_name.split('/')[-1]
+        # Create budget and campaign
+        resource_name = self._mutate_budget_and_campaign(customer_id, mutate_operations)
+        campaign_id = resource_name.split('/')[-1]
+        get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
 
         return {
             'campaign_id': campaign_id,
             'campaign_name': config.name,
-            'resource_name': response.results[0].resource_name,
+            'resource_name': resource_name,
             'app_id': config.app_id,
             'app_store': config.app_store.value,
             'budget': config.budget_amount,
             'bidding_goal': config.bidding_strategy_goal_type.value
         }
 
-    def get_app_performance(
+    def iter_app_performance(
         self,
         customer_id: str,
         campaign_id: Optional[str] = None,
         date_range: str = "LAST_30_DAYS"
-    ) -> Dict[str, Any]:
-        """Get App campaign performance metrics.
+    ) -> Iterator[AppPerformanceRow]:
+        """Yield App campaign performance metrics one campaign at a time.
 
         Args:
             customer_id: Customer ID (without hyphens)
             campaign_id: Optional campaign ID filter
             date_range: Date range for metrics
 
-        Returns:
-            App campaign performance data
-        """
-        ga_service = self.client.get_service("GoogleAdsService")
-
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                campaign.app_campaign_setting.app_id,
-                campaign.app_campaign_setting.app_store,
-                metrics.impressions,
-                metrics.clicks,
-                metrics.ctr,
-                metrics.cost_micros,
-                metrics.conversions,
-                metrics.conversions_value,
-                metrics.cost_per_conversion
-            FROM campaign
-            WHERE campaign.advertising_channel_sub_type = 'APP_CAMPAIGN'
-              AND segments.date DURING {date_range}
+        Yields:
+            Campaign performance rows
         """
+        query = _build_query(_APP_PERFORMANCE_QUERY, date_range, campaign_id)
+
+        for results in self._stream_batches(customer_id, query):
+            for row, cost in zip(results, _costs(results)):
+                yield _app_performance_row(row, cost)
 
-        if campaign_id:
-            query += f" AND campaign.id = {campaign_id}"
+    @cached_report(AppPerformanceRow)
+    def get_app_performance(
+        self,
+        customer_id: str,
+        campaign_id: Optional[str] = None,
+        date_range: str = "LAST_30_DAYS",
+        paginate: bool = False,
+        page_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get App campaign performance metrics.
 
-        query += " ORDER BY metrics.impressions DESC"
+        Args:
+            customer_id: Customer ID (without hyphens)
+            campaign_id: Optional campaign ID filter
+            date_range: Date range for metrics
+            paginate: Return one page of up to 10,000 campaigns with a
+                next_page_token instead of the full report
+            page_token: next_page_token from a previous page (implies paginate)
 
-        response = ga_service.search(customer_id=customer_id, query=query)
+        Returns:
+            App campaign performance data, with campaigns as
+            AppPerformanceRow records; cached under
+            ResourceType.PERFORMANCE unless called with use_cache=False
+        """
+        if paginate or page_token:
+            results, next_page_token = self._search_page(
+                customer_id, _build_query(_APP_PERFORMANCE_QUERY, date_range, campaign_id), page_token
+            )
+            campaigns = [_app_performance_row(row, cost) for row, cost in zip(results, _costs(results))]
+            return {
+                'campaigns': campaigns,
+                'total_campaigns': len(campaigns),
+                'next_page_token': next_page_token
+            }
 
-        campaigns = []
-        for row in response:
-            campaigns.append({
-                'campaign_id': str(row.campaign.id),
-                'campaign_name': row.campaign.name,
-                'app_id': row.campaign.app_campaign_setting.app_id,
-                'app_store': row.campaign.app_campaign_setting.app_store.name,
-                'impressions': row.metrics.impressions,
-                'clicks': row.metrics.clicks,
-                'ctr': row.metrics.ctr,
-                'cost': row.metrics.cost_micros / 1_000_000,
-                'conversions': row.metrics.conversions,
-                'conversion_value': row.metrics.conversions_value,
-                'cost_per_conversion': row.metrics.cost_per_conversion
-            })
+        campaigns = list(self.iter_app_performance(customer_id, campaign_id, date_range))
 
         return {
             'campaigns': campaigns,
             'total_campaigns': len(campaigns)
         }
 
+    async def get_app_performance_many(
+        self,
+        customer_ids: Iterable[str],
+        campaign_id: Optional[str] = None,
+        date_range: str = "LAST_30_DAYS",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """Get App campaign performance for many customers concurrently.
+
+        Args:
+            customer_ids: Customer IDs (without hyphens)
+            campaign_id: Optional campaign ID filter
+            date_range: Date range for metrics
+            max_concurrency: Maximum number of customers queried at once
+
+        Returns:
+            get_app_performance results and error messages keyed by customer ID
+        """
+        return await self._gather_customers(
+            self.get_app_performance, customer_ids, max_concurrency,
+            campaign_id=campaign_id, date_range=date_range
+        )
+
+    @cached_report()
     def get_app_conversions(
         self,
         customer_id: str,
         campaign_id: Optional[str] = None,
-        date_range: str = "LAST_30_DAYS"
+        date_range: str = "LAST_30_DAYS",
+        aggregate_only: bool = False
     ) -> Dict[str, Any]:
         """Get app install and engagement conversion data.
 
@@ -417,38 +1086,29 @@ class LocalAppManager:
             customer_id: Customer ID (without hyphens)
             campaign_id: Optional campaign ID filter
             date_range: Date range for metrics
+            aggregate_only: Only fetch total_conversions and total_value,
+                computed server-side, instead of the per-campaign breakdown
 
         Returns:
-            App conversion data by type
-        """
-        ga_service = self.client.get_service("GoogleAdsService")
-
-        query = f"""
-            SELECT
-                campaign.id,
-                campaign.name,
-                segments.conversion_action_name,
-                segments.conversion_action_category,
-                metrics.conversions,
-                metrics.conversions_value
-            FROM campaign
-            WHERE campaign.advertising_channel_sub_type = 'APP_CAMPAIGN'
-              AND segments.date DURING {date_range}
+            App conversion data by type; cached under
+            ResourceType.PERFORMANCE unless called with use_cache=False
         """
+        query = _build_query(_APP_CONVERSIONS_QUERY, date_range, campaign_id)
 
-        if campaign_id:
-            query += f" AND campaign.id = {campaign_id}"
-
-        query += " ORDER BY metrics.conversions DESC"
-
-        response = ga_service.search(customer_id=customer_id, query=query)
+        if aggregate_only:
+            total_conversions, total_value = self._summary_totals(customer_id, query)
+            return {
+                'total_conversions': total_conversions,
+                'total_value': total_value
+            }
 
         conversions_by_type = {}
         campaigns_data = {}
 
-        for row in response:
+        # Totals are accumulated as rows stream in; no row list is kept
+        for row in self._stream_rows(customer_id, query):
             campaign_id_str = str(row.campaign.id)
-            conversion_category = row.segments.conversion_action_category.name
+            conversion_category = _enum_name(row.segments, 'conversion_action_category')
             conversion_name = row.segments.conversion_action_name
 
             # Track by campaign
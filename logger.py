@@ -9,14 +9,24 @@ Structured logging with:
 - Audit logging
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import json
+import queue
+import threading
 import time
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, List
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
+
+# Try to import orjson for faster JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # ANSI color codes for console output
 class Colors:
@@ -43,15 +53,49 @@ class Colors:
     BG_BLUE = '\033[44m'
 
 
+# Per-thread cache of the last formatted second, so log lines within the
+# same second only format their microseconds
+_timestamp_cache = threading.local()
+_MISSING = object()
+
+
+def _utc_timestamp(created: float) -> str:
+    """
+    Format a time.time() value as an ISO 8601 UTC timestamp.
+
+    Args:
+        created: Seconds since the epoch
+
+    Returns:
+        Timestamp like 2024-01-31T12:34:56.789012
+    """
+    seconds = int(created)
+    cache = _timestamp_cache
+
+    if getattr(cache, 'seconds', None) != seconds:
+        cache.prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        cache.seconds = seconds
+
+    return f"{cache.prefix}.{int((created - seconds) * 1_000_000):06d}"
+
+
 class JSONFormatter(logging.Formatter):
     """
     JSON log formatter for structured logging.
     """
 
+    # (record attribute, JSON key) pairs copied into the output when present
+    EXTRA_FIELDS = (
+        ('customer_id', 'customer_id'),
+        ('operation', 'operation'),
+        ('duration', 'duration_ms'),
+        ('extra', 'extra'),
+    )
+
     def format(self, record: logging.LogRecord) -> str:
-        """Format log record as JSON."""
+        """Format log record as JSON, using orjson when installed."""
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _utc_timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -61,19 +105,16 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
 
-        # Add extra fields
-        if hasattr(record, 'customer_id'):
-            log_data['customer_id'] = record.customer_id
-
-        if hasattr(record, 'operation'):
-            log_data['operation'] = record.operation
-
-        if hasattr(record, 'duration'):
-            log_data['duration_ms'] = record.duration
-
-        if hasattr(record, 'extra'):
-            log_data['extra'] = record.extra
+        # Add extra fields (set on the record's __dict__ by logging's extra=)
+        attributes = record.__dict__
+        for attribute, key in self.EXTRA_FIELDS:
+            value = attributes.get(attribute, _MISSING)
+            if value is not _MISSING:
+                log_data[key] = value
 
+        if ORJSON_AVAILABLE:
+            # NON_STR_KEYS keeps json.dumps' handling of int keys in extra
+            return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(log_data)
 
 
@@ -90,34 +131,44 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Colors.BG_RED + Colors.WHITE + Colors.BOLD,
     }
 
+    # Colored, padded level names, built once
+    COLORED_LEVELS = {
+        level: f"{color}{level:8s}{Colors.RESET}"
+        for level, color in LEVEL_COLORS.items()
+    }
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors."""
-        # Color the level name
-        level_color = self.LEVEL_COLORS.get(record.levelname, Colors.RESET)
-        colored_level = f"{level_color}{record.levelname:8s}{Colors.RESET}"
+        levelname = record.levelname
+        colored_level = self.COLORED_LEVELS.get(levelname)
+        if colored_level is None:
+            colored_level = f"{Colors.RESET}{levelname:8s}{Colors.RESET}"
 
-        # Create colored format string
+        # Color a copy, so other handlers still see the plain level name
+        record = copy.copy(record)
         record.levelname = colored_level
 
-        # Format the message
-        formatted = super().format(record)
+        return super().format(record)
+
 
-        return formatted
+# Shared no-op context returned by track_operation when tracking is disabled
+_NULL_CONTEXT = nullcontext()
 
 
 class PerformanceLogger:
     """Helper for logging performance metrics."""
 
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, enabled: bool = True):
         """
         Initialize performance logger.
 
         Args:
             logger: Base logger to use
+            enabled: Whether operations are timed and logged
         """
         self.logger = logger
+        self.enabled = enabled
 
-    @contextmanager
     def track_operation(
         self,
         operation: str,
@@ -127,6 +178,9 @@ class PerformanceLogger:
         """
         Context manager to track operation performance.
 
+        When tracking is disabled this returns a shared no-op context, so the
+        call costs no timer reads or allocations.
+
         Args:
             operation: Operation name
             customer_id: Optional customer ID
@@ -137,13 +191,29 @@ class PerformanceLogger:
                 # Your code here
                 pass
         """
-        start_time = time.time()
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._track(operation, customer_id, extra)
+
+    @contextmanager
+    def _track(
+        self,
+        operation: str,
+        customer_id: Optional[str],
+        extra: Optional[Dict[str, Any]]
+    ):
+        """Time the wrapped block and log its outcome."""
+        start_time = time.perf_counter_ns()
 
         try:
             yield
 
+            # Skip building the record when INFO is filtered out
+            if not self.logger.isEnabledFor(logging.INFO):
+                return
+
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             # Log successful operation
             extra_dict = extra or {}
@@ -157,13 +227,18 @@ class PerformanceLogger:
                 extra_dict['customer_id'] = customer_id
 
             self.logger.info(
-                f"Operation '{operation}' completed in {duration_ms:.2f}ms",
+                "Operation '%s' completed in %.2fms",
+                operation,
+                duration_ms,
                 extra=extra_dict
             )
 
         except Exception as e:
+            if not self.logger.isEnabledFor(logging.ERROR):
+                raise
+
             # Calculate duration even for failed operations
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             # Log failed operation
             extra_dict = extra or {}
@@ -178,7 +253,10 @@ class PerformanceLogger:
                 extra_dict['customer_id'] = customer_id
 
             self.logger.error(
-                f"Operation '{operation}' failed after {duration_ms:.2f}ms: {e}",
+                "Operation '%s' failed after %.2fms: %s",
+                operation,
+                duration_ms,
+                e,
                 extra=extra_dict,
                 exc_info=True
             )
@@ -188,16 +266,124 @@ class PerformanceLogger:
 
 
 class AuditLogger:
-    """Logger for audit trail of API operations."""
+    """
+    Logger for audit trail of API operations.
+
+    Audit records are queued by the calling thread and written in batches by a
+    background flusher thread, so tool calls never block on audit log I/O.
+    Pending records are flushed on process exit.
+    """
 
-    def __init__(self, logger_name: str = "google_ads_mcp.audit"):
+    def __init__(
+        self,
+        logger_name: str = "google_ads_mcp.audit",
+        batch_size: int = 100,
+        flush_interval: float = 1.0
+    ):
         """
         Initialize audit logger.
 
         Args:
             logger_name: Name for the audit logger
+            batch_size: Maximum number of records written per batch
+            flush_interval: Maximum time in seconds a record waits before being written
         """
         self.logger = logging.getLogger(logger_name)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Records the flusher has taken off the queue but not yet written;
+        # only emptied under _write_lock
+        self._pending: List[Dict[str, Any]] = []
+        self._write_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+
+    def _ensure_flusher(self):
+        """Start the background flusher thread on first use."""
+        if self._flusher is not None:
+            return
+
+        with self._start_lock:
+            if self._flusher is None:
+                flusher = threading.Thread(
+                    target=self._run_flusher,
+                    name="audit-log-flusher",
+                    daemon=True
+                )
+                flusher.start()
+                atexit.register(self.flush)
+                self._flusher = flusher
+
+    def _run_flusher(self):
+        """Collect queued records into batches and write them.
+
+        Records are collected without holding _write_lock, so flush() is
+        never stuck behind the flusher waiting on the queue.
+        """
+        get = self._queue.get
+        pending = self._pending
+
+        while True:
+            pending.append(get())
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(pending) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            with self._write_lock:
+                self._write(self._take_pending())
+
+    def _take_pending(self) -> List[Dict[str, Any]]:
+        """Remove and return the collected records; call with _write_lock held."""
+        batch = self._pending[:]
+        del self._pending[:len(batch)]
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        """
+        Write a batch of audit records.
+
+        Args:
+            batch: Audit records in the order they were logged
+        """
+        for audit_data in batch:
+            # Log as INFO for successful operations, WARNING for failures
+            if audit_data['result'] == "success":
+                self.logger.info(
+                    "Audit: %s %s",
+                    audit_data['action'],
+                    audit_data['resource_type'],
+                    extra=audit_data
+                )
+            else:
+                self.logger.warning(
+                    "Audit: Failed %s %s",
+                    audit_data['action'],
+                    audit_data['resource_type'],
+                    extra=audit_data
+                )
+
+    def flush(self):
+        """Write all queued audit records immediately."""
+        with self._write_lock:
+            # Records the flusher already collected are older than any still queued
+            batch = self._take_pending()
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
 
     def log_api_call(
         self,
@@ -224,7 +410,7 @@ class AuditLogger:
             details: Additional details
         """
         audit_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _utc_timestamp(time.time()),
             'customer_id': customer_id,
             'operation': operation,
             'resource_type': resource_type,
@@ -241,11 +427,40 @@ class AuditLogger:
         if details:
             audit_data['details'] = details
 
-        # Log as INFO for successful operations, WARNING for failures
-        if result == "success":
-            self.logger.info(f"Audit: {action} {resource_type}", extra=audit_data)
-        else:
-            self.logger.warning(f"Audit: Failed {action} {resource_type}", extra=audit_data)
+        self._queue.put(audit_data)
+        self._ensure_flusher()
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for an in-process queue.
+
+    Records are queued as-is rather than pre-formatted, so the listener's
+    formatters still see exc_info and extra attributes (JSONFormatter needs
+    both).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Queue the record unchanged."""
+        return record
+
+
+# Background listeners writing each set-up logger's records, keyed by name
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+_listeners_lock = threading.Lock()
+
+
+def _stop_listeners():
+    """Stop all queue listeners, writing any records still queued."""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+
+    for listener in listeners:
+        listener.stop()
+
+
+atexit.register(_stop_listeners)
 
 
 def setup_logger(
@@ -258,6 +473,10 @@ def setup_logger(
     """
     Set up a logger with appropriate handlers.
 
+    The logger itself only gets a QueueHandler; the console and file
+    handlers run on a background QueueListener thread, so logging calls
+    never block on terminal or disk I/O. Queued records are written on exit.
+
     Args:
         name: Logger name
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -271,7 +490,11 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Remove existing handlers
+    # Remove existing handlers, draining the previous listener first
+    with _listeners_lock:
+        previous = _listeners.pop(name, None)
+    if previous is not None:
+        previous.stop()
     logger.handlers = []
 
     # Create formatter
@@ -291,7 +514,7 @@ def setup_logger(
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if specified)
     if log_file:
@@ -305,7 +528,16 @@ def setup_logger(
             backupCount=5
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    with _listeners_lock:
+        _listeners[name] = listener
+
+    logger.addHandler(_LocalQueueHandler(log_queue))
 
     return logger
 
@@ -8,7 +8,10 @@ from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
+import asyncio
 import json
+import threading
+import weakref
 
 from auth_manager import get_auth_manager
 from error_handler import ErrorHandler
@@ -20,6 +23,31 @@ from ad_group_manager import (
 
 logger = get_logger(__name__)
 
+# One AdGroupManager per authenticated client, so its service clients (and
+# their gRPC channels) are reused across tool calls
+_managers: "weakref.WeakKeyDictionary[Any, AdGroupManager]" = weakref.WeakKeyDictionary()
+_managers_lock = threading.Lock()
+
+# Tool arguments are resolved through plain dicts rather than Enum lookups
+_STATUS_LOOKUP: Dict[str, AdGroupStatus] = dict(AdGroupStatus.__members__)
+_TYPE_LOOKUP: Dict[str, AdGroupType] = dict(AdGroupType.__members__)
+
+_STATUS_MESSAGES = {
+    "ENABLED": "Ad group is now active and ads will start serving.",
+    "PAUSED": "Ad group is now paused. Ads have stopped serving.",
+    "REMOVED": "Ad group has been removed and cannot be re-enabled."
+}
+
+
+def _get_ad_group_manager() -> AdGroupManager:
+    """Return the ad group manager for the current client, creating it on first use."""
+    client = get_auth_manager().get_client()
+    with _managers_lock:
+        manager = _managers.get(client)
+        if manager is None:
+            manager = _managers[client] = AdGroupManager(client)
+        return manager
+
 
 def register_ad_group_tools(mcp: FastMCP):
     """Register ad group management tools with MCP server."""
@@ -29,7 +57,7 @@ def register_ad_group_tools(mcp: FastMCP):
     # ============================================================================
 
     @mcp.tool()
-    def google_ads_create_ad_group(
+    async def google_ads_create_ad_group(
         customer_id: str,
         campaign_id: str,
         ad_group_name: str,
@@ -55,8 +83,7 @@ def register_ad_group_tools(mcp: FastMCP):
         """
         with performance_logger.track_operation('create_ad_group', customer_id=customer_id):
             try:
-                client = get_auth_manager().get_client()
-                ad_group_manager = AdGroupManager(client)
+                ad_group_manager = _get_ad_group_manager()
 
                 # Convert bid to micros
                 cpc_bid_micros = int(cpc_bid * 1_000_000) if cpc_bid else None
@@ -65,13 +92,13 @@ def register_ad_group_tools(mcp: FastMCP):
                 config = AdGroupConfig(
                     name=ad_group_name,
                     campaign_id=campaign_id,
-                    status=AdGroupStatus[status.upper()],
+                    status=_STATUS_LOOKUP[status.upper()],
                     cpc_bid_micros=cpc_bid_micros,
-                    ad_group_type=AdGroupType[ad_group_type.upper()] if ad_group_type else None
+                    ad_group_type=_TYPE_LOOKUP[ad_group_type.upper()] if ad_group_type else None
                 )
 
                 # Create ad group
-                result = ad_group_manager.create_ad_group(customer_id, config)
+                result = await asyncio.to_thread(ad_group_manager.create_ad_group, customer_id, config)
 
                 # Audit log
                 audit_logger.log_api_call(
@@ -91,23 +118,27 @@ def register_ad_group_tools(mcp: FastMCP):
                 # Invalidate cache
                 get_cache_manager().invalidate(customer_id, ResourceType.AD_GROUP)
 
-                output = f"✅ Ad group created successfully!\n\n"
-                output += f"**Ad Group ID**: {result['ad_group_id']}\n"
-                output += f"**Name**: {ad_group_name}\n"
-                output += f"**Campaign ID**: {campaign_id}\n"
-                output += f"**Status**: {status}\n"
+                lines = [
+                    "✅ Ad group created successfully!",
+                    "",
+                    f"**Ad Group ID**: {result['ad_group_id']}",
+                    f"**Name**: {ad_group_name}",
+                    f"**Campaign ID**: {campaign_id}",
+                    f"**Status**: {status}",
+                ]
 
                 if cpc_bid:
-                    output += f"**CPC Bid**: ${cpc_bid:.2f}\n"
+                    lines.append(f"**CPC Bid**: ${cpc_bid:.2f}")
 
-                output += f"\n"
-                output += f"Ad group is now {status.lower()}. "
-                output += f"Next steps:\n"
-                output += f"1. Add keywords to the ad group\n"
-                output += f"2. Create ads\n"
-                output += f"3. Enable the ad group when ready"
+                lines.extend([
+                    "",
+                    f"Ad group is now {status.lower()}. Next steps:",
+                    "1. Add keywords to the ad group",
+                    "2. Create ads",
+                    "3. Enable the ad group when ready",
+                ])
 
-                return output
+                return "\n".join(lines)
 
             except Exception as e:
                 error_msg = ErrorHandler.handle_error(e, context="create_ad_group")
@@ -118,7 +149,7 @@ def register_ad_group_tools(mcp: FastMCP):
     # ============================================================================
 
     @mcp.tool()
-    def google_ads_update_ad_group(
+    async def google_ads_update_ad_group(
         customer_id: str,
         ad_group_id: str,
         ad_group_name: Optional[str] = None,
@@ -140,15 +171,16 @@ def register_ad_group_tools(mcp: FastMCP):
         """
         with performance_logger.track_operation('update_ad_group', customer_id=customer_id):
             try:
-                client = get_auth_manager().get_client()
-                ad_group_manager = AdGroupManager(client)
+                ad_group_manager = _get_ad_group_manager()
+
+                status_upper = status.upper() if status else None
 
                 # Build updates dict
                 updates = {}
                 if ad_group_name:
                     updates['name'] = ad_group_name
-                if status:
-                    updates['status'] = status.upper()
+                if status_upper:
+                    updates['status'] = status_upper
                 if cpc_bid is not None:
                     updates['cpc_bid_micros'] = int(cpc_bid * 1_000_000)
 
@@ -156,7 +188,9 @@ def register_ad_group_tools(mcp: FastMCP):
                     return "⚠️ No updates specified. Provide at least one field to update."
 
                 # Update ad group
-                result = ad_group_manager.update_ad_group(customer_id, ad_group_id, updates)
+                result = await asyncio.to_thread(
+                    ad_group_manager.update_ad_group, customer_id, ad_group_id, updates
+                )
 
                 # Audit log
                 audit_logger.log_api_call(
@@ -172,26 +206,33 @@ def register_ad_group_tools(mcp: FastMCP):
                 # Invalidate cache
                 get_cache_manager().invalidate(customer_id, ResourceType.AD_GROUP)
 
-                output = f"✅ Ad group {ad_group_id} updated successfully!\n\n"
-                output += f"**Updated Fields**: {', '.join(result['updated_fields'])}\n\n"
+                lines = [
+                    f"✅ Ad group {ad_group_id} updated successfully!",
+                    "",
+                    f"**Updated Fields**: {', '.join(result['updated_fields'])}",
+                    "",
+                ]
 
                 if 'name' in updates:
-                    output += f"**New Name**: {ad_group_name}\n"
+                    lines.append(f"**New Name**: {ad_group_name}")
                 if 'status' in updates:
-                    output += f"**New Status**: {status.upper()}\n"
+                    lines.append(f"**New Status**: {status_upper}")
                 if 'cpc_bid_micros' in updates:
-                    output += f"**New CPC Bid**: ${cpc_bid:.2f}\n"
+                    lines.append(f"**New CPC Bid**: ${cpc_bid:.2f}")
 
-                output += f"\nChanges have been applied to the ad group."
+                lines.extend([
+                    "",
+                    "Changes have been applied to the ad group.",
+                ])
 
-                return output
+                return "\n".join(lines)
 
             except Exception as e:
                 error_msg = ErrorHandler.handle_error(e, context="update_ad_group")
                 return f"❌ Failed to update ad group: {error_msg}"
 
     @mcp.tool()
-    def google_ads_update_ad_group_status(
+    async def google_ads_update_ad_group_status(
         customer_id: str,
         ad_group_id: str,
         status: str
@@ -209,14 +250,14 @@ def register_ad_group_tools(mcp: FastMCP):
         """
         with performance_logger.track_operation('update_ad_group_status', customer_id=customer_id):
             try:
-                client = get_auth_manager().get_client()
-                ad_group_manager = AdGroupManager(client)
+                ad_group_manager = _get_ad_group_manager()
 
                 status_upper = status.upper()
-                result = ad_group_manager.update_ad_group_status(
+                result = await asyncio.to_thread(
+                    ad_group_manager.update_ad_group_status,
                     customer_id,
                     ad_group_id,
-                    AdGroupStatus[status_upper]
+                    _STATUS_LOOKUP[status_upper]
                 )
 
                 # Audit log
@@ -233,23 +274,20 @@ def register_ad_group_tools(mcp: FastMCP):
                 # Invalidate cache
                 get_cache_manager().invalidate(customer_id, ResourceType.AD_GROUP)
 
-                status_messages = {
-                    "ENABLED": "Ad group is now active and ads will start serving.",
-                    "PAUSED": "Ad group is now paused. Ads have stopped serving.",
-                    "REMOVED": "Ad group has been removed and cannot be re-enabled."
-                }
+                lines = [
+                    f"✅ Ad group {ad_group_id} status updated to {status_upper}",
+                    "",
+                    _STATUS_MESSAGES.get(status_upper, 'Status updated successfully.'),
+                ]
 
-                return (
-                    f"✅ Ad group {ad_group_id} status updated to {status_upper}\n\n"
-                    f"{status_messages.get(status_upper, 'Status updated successfully.')}"
-                )
+                return "\n".join(lines)
 
             except Exception as e:
                 error_msg = ErrorHandler.handle_error(e, context="update_ad_group_status")
                 return f"❌ Failed to update ad group status: {error_msg}"
 
     @mcp.tool()
-    def google_ads_update_ad_group_bid(
+    async def google_ads_update_ad_group_bid(
         customer_id: str,
         ad_group_id: str,
         cpc_bid: float
@@ -267,12 +305,12 @@ def register_ad_group_tools(mcp: FastMCP):
         """
         with performance_logger.track_operation('update_ad_group_bid', customer_id=customer_id):
             try:
-                client = get_auth_manager().get_client()
-                ad_group_manager = AdGroupManager(client)
+                ad_group_manager = _get_ad_group_manager()
 
                 cpc_bid_micros = int(cpc_bid * 1_000_000)
 
-                result = ad_group_manager.update_ad_group_cpc_bid(
+                result = await asyncio.to_thread(
+                    ad_group_manager.update_ad_group_cpc_bid,
                     customer_id,
                     ad_group_id,
                     cpc_bid_micros
@@ -292,12 +330,16 @@ def register_ad_group_tools(mcp: FastMCP):
                 # Invalidate cache
                 get_cache_manager().invalidate(customer_id, ResourceType.AD_GROUP)
 
-                return (
-                    f"✅ Ad group {ad_group_id} bid updated successfully!\n\n"
-                    f"**New CPC Bid**: ${result['new_cpc_bid']:.2f}\n\n"
-                    f"The new bid will take effect immediately. "
-                    f"Monitor performance closely to see the impact on impressions and clicks."
-                )
+                lines = [
+                    f"✅ Ad group {ad_group_id} bid updated successfully!",
+                    "",
+                    f"**New CPC Bid**: ${result['new_cpc_bid']:.2f}",
+                    "",
+                    "The new bid will take effect immediately. "
+                    "Monitor performance closely to see the impact on impressions and clicks.",
+                ]
+
+                return "\n".join(lines)
 
             except Exception as e:
                 error_msg = ErrorHandler.handle_error(e, context="update_ad_group_bid")
@@ -308,7 +350,7 @@ def register_ad_group_tools(mcp: FastMCP):
     # ============================================================================
 
     @mcp.tool()
-    def google_ads_get_ad_group_details(
+    async def google_ads_get_ad_group_details(
         customer_id: str,
         ad_group_id: str
     ) -> str:
@@ -324,50 +366,61 @@ def register_ad_group_tools(mcp: FastMCP):
         """
         with performance_logger.track_operation('get_ad_group_details', customer_id=customer_id):
             try:
-                client = get_auth_manager().get_client()
-                ad_group_manager = AdGroupManager(client)
+                ad_group_manager = _get_ad_group_manager()
 
-                details = ad_group_manager.get_ad_group_details(customer_id, ad_group_id)
+                details = await asyncio.to_thread(
+                    ad_group_manager.get_ad_group_details, customer_id, ad_group_id
+                )
 
                 if not details:
                     return f"❌ Ad group {ad_group_id} not found"
 
-                output = f"# Ad Group Details: {details['name']}\n\n"
-                output += f"**ID**: {details['id']}\n"
-                output += f"**Status**: {details['status']}\n"
-                output += f"**Type**: {details['type']}\n\n"
-
-                output += "## Campaign\n"
-                output += f"- **Campaign ID**: {details['campaign']['id']}\n"
-                output += f"- **Campaign Name**: {details['campaign']['name']}\n\n"
-
-                output += "## Bidding\n"
-                if details['bids']['cpc_bid']:
-                    output += f"- **CPC Bid**: ${details['bids']['cpc_bid']:.2f}\n"
-                if details['bids']['cpm_bid']:
-                    output += f"- **CPM Bid**: ${details['bids']['cpm_bid']:.2f}\n"
-                if details['bids']['cpv_bid']:
-                    output += f"- **CPV Bid**: ${details['bids']['cpv_bid']:.2f}\n"
-                if details['bids']['target_cpa']:
-                    output += f"- **Target CPA**: ${details['bids']['target_cpa']:.2f}\n"
-                output += "\n"
-
-                output += "## Performance Metrics\n"
-                output += f"- **Cost**: ${details['metrics']['cost']:,.2f}\n"
-                output += f"- **Clicks**: {details['metrics']['clicks']:,}\n"
-                output += f"- **Impressions**: {details['metrics']['impressions']:,}\n"
-                output += f"- **CTR**: {details['metrics']['ctr']:.2f}%\n"
-                output += f"- **Avg CPC**: ${details['metrics']['average_cpc']:.2f}\n"
-                output += f"- **Conversions**: {details['metrics']['conversions']}\n"
-
-                return output
+                bids = details['bids']
+                metrics = details['metrics']
+
+                lines = [
+                    f"# Ad Group Details: {details['name']}",
+                    "",
+                    f"**ID**: {details['id']}",
+                    f"**Status**: {details['status']}",
+                    f"**Type**: {details['type']}",
+                    "",
+                    "## Campaign",
+                    f"- **Campaign ID**: {details['campaign']['id']}",
+                    f"- **Campaign Name**: {details['campaign']['name']}",
+                    "",
+                    "## Bidding",
+                ]
+
+                if bids['cpc_bid']:
+                    lines.append(f"- **CPC Bid**: ${bids['cpc_bid']:.2f}")
+                if bids['cpm_bid']:
+                    lines.append(f"- **CPM Bid**: ${bids['cpm_bid']:.2f}")
+                if bids['cpv_bid']:
+                    lines.append(f"- **CPV Bid**: ${bids['cpv_bid']:.2f}")
+                if bids['target_cpa']:
+                    lines.append(f"- **Target CPA**: ${bids['target_cpa']:.2f}")
+
+                lines.extend([
+                    "",
+                    "## Performance Metrics",
+                    f"- **Cost**: ${metrics['cost']:,.2f}",
+                    f"- **Clicks**: {metrics['clicks']:,}",
+                    f"- **Impressions**: {metrics['impressions']:,}",
+                    f"- **CTR**: {metrics['ctr']:.2f}%",
+                    f"- **Avg CPC**: ${metrics['average_cpc']:.2f}",
+                    f"- **Conversions**: {metrics['conversions']}",
+                    "",
+                ])
+
+                return "\n".join(lines)
 
             except Exception as e:
                 error_msg = ErrorHandler.handle_error(e, context="get_ad_group_details")
                 return f"❌ Failed to get ad group details: {error_msg}"
 
     @mcp.tool()
-    def google_ads_list_ad_groups(
+    async def google_ads_list_ad_groups(
         customer_id: str,
         campaign_id: Optional[str] = None,
         status: Optional[str] = None
@@ -385,12 +438,12 @@ def register_ad_group_tools(mcp: FastMCP):
         """
         with performance_logger.track_operation('list_ad_groups', customer_id=customer_id):
             try:
-                client = get_auth_manager().get_client()
-                ad_group_manager = AdGroupManager(client)
+                ad_group_manager = _get_ad_group_manager()
 
-                status_filter = AdGroupStatus[status.upper()] if status else None
+                status_filter = _STATUS_LOOKUP[status.upper()] if status else None
 
-                ad_groups = ad_group_manager.list_ad_groups(
+                ad_groups = await asyncio.to_thread(
+                    ad_group_manager.list_ad_groups,
                     customer_id,
                     campaign_id=campaign_id,
                     status=status_filter
@@ -399,30 +452,34 @@ def register_ad_group_tools(mcp: FastMCP):
                 if not ad_groups:
                     return "No ad groups found matching the criteria."
 
-                output = f"# Ad Groups ({len(ad_groups)} total)\n\n"
+                lines = [f"# Ad Groups ({len(ad_groups)} total)", ""]
 
                 for ag in ad_groups:
-                    output += f"## {ag['name']}\n"
-                    output += f"- **ID**: {ag['id']}\n"
-                    output += f"- **Status**: {ag['status']}\n"
-                    output += f"- **Campaign**: {ag['campaign_name']} (ID: {ag['campaign_id']})\n"
-
-                    if ag['cpc_bid']:
-                        output += f"- **CPC Bid**: ${ag['cpc_bid']:.2f}\n"
-
-                    output += f"- **Impressions**: {ag['metrics']['impressions']:,}\n"
-                    output += f"- **Clicks**: {ag['metrics']['clicks']:,}\n"
-                    output += f"- **Cost**: ${ag['metrics']['cost']:,.2f}\n"
-                    output += "\n"
-
-                return output
+                    m = ag['metrics']
+                    cpc_bid = ag['cpc_bid']
+                    lines.extend([
+                        f"## {ag['name']}",
+                        f"- **ID**: {ag['id']}",
+                        f"- **Status**: {ag['status']}",
+                        f"- **Campaign**: {ag['campaign_name']} (ID: {ag['campaign_id']})",
+                    ])
+                    if cpc_bid:
+                        lines.append(f"- **CPC Bid**: ${cpc_bid:.2f}")
+                    lines.extend([
+                        f"- **Impressions**: {m['impressions']:,}",
+                        f"- **Clicks**: {m['clicks']:,}",
+                        f"- **Cost**: ${m['cost']:,.2f}",
+                        "",
+                    ])
+
+                return "\n".join(lines)
 
             except Exception as e:
                 error_msg = ErrorHandler.handle_error(e, context="list_ad_groups")
                 return f"❌ Failed to list ad groups: {error_msg}"
 
     @mcp.tool()
-    def google_ads_get_ad_group_performance(
+    async def google_ads_get_ad_group_performance(
         customer_id: str,
         ad_group_id: str,
         date_range: str = "LAST_30_DAYS"
@@ -440,10 +497,10 @@ def register_ad_group_tools(mcp: FastMCP):
         """
         with performance_logger.track_operation('get_ad_group_performance', customer_id=customer_id):
             try:
-                client = get_auth_manager().get_client()
-                ad_group_manager = AdGroupManager(client)
+                ad_group_manager = _get_ad_group_manager()
 
-                result = ad_group_manager.get_ad_group_performance(
+                result = await asyncio.to_thread(
+                    ad_group_manager.get_ad_group_performance,
                     customer_id,
                     ad_group_id,
                     date_range
@@ -454,26 +511,30 @@ def register_ad_group_tools(mcp: FastMCP):
 
                 metrics = result['metrics']
 
-                output = f"# Ad Group Performance: {result['name']}\n\n"
-                output += f"**Campaign**: {result['campaign_name']}\n"
-                output += f"**Date Range**: {date_range}\n\n"
-
-                output += "## Key Metrics\n"
-                output += f"- **Total Cost**: ${metrics['cost']:,.2f}\n"
-                output += f"- **Clicks**: {metrics['clicks']:,}\n"
-                output += f"- **Impressions**: {metrics['impressions']:,}\n"
-                output += f"- **CTR**: {metrics['ctr']:.2f}%\n"
-                output += f"- **Avg CPC**: ${metrics['average_cpc']:.2f}\n\n"
-
-                output += "## Conversions\n"
-                output += f"- **Conversions**: {metrics['conversions']:.2f}\n"
-                output += f"- **Conversion Value**: ${metrics['conversions_value']:,.2f}\n"
-                output += f"- **Cost per Conversion**: ${metrics['cost_per_conversion']:.2f}\n"
-                output += f"- **Conversion Rate**: {metrics['conversion_rate']:.2f}%\n"
-                output += f"- **All Conversions**: {metrics['all_conversions']:.2f}\n"
-                output += f"- **View-Through Conversions**: {metrics['view_through_conversions']:.0f}\n"
-
-                return output
+                lines = [
+                    f"# Ad Group Performance: {result['name']}",
+                    "",
+                    f"**Campaign**: {result['campaign_name']}",
+                    f"**Date Range**: {date_range}",
+                    "",
+                    "## Key Metrics",
+                    f"- **Total Cost**: ${metrics['cost']:,.2f}",
+                    f"- **Clicks**: {metrics['clicks']:,}",
+                    f"- **Impressions**: {metrics['impressions']:,}",
+                    f"- **CTR**: {metrics['ctr']:.2f}%",
+                    f"- **Avg CPC**: ${metrics['average_cpc']:.2f}",
+                    "",
+                    "## Conversions",
+                    f"- **Conversions**: {metrics['conversions']:.2f}",
+                    f"- **Conversion Value**: ${metrics['conversions_value']:,.2f}",
+                    f"- **Cost per Conversion**: ${metrics['cost_per_conversion']:.2f}",
+                    f"- **Conversion Rate**: {metrics['conversion_rate']:.2f}%",
+                    f"- **All Conversions**: {metrics['all_conversions']:.2f}",
+                    f"- **View-Through Conversions**: {metrics['view_through_conversions']:.0f}",
+                    "",
+                ]
+
+                return "\n".join(lines)
 
             except Exception as e:
                 error_msg = ErrorHandler.handle_error(e, context="get_ad_group_performance")
@@ -484,7 +545,7 @@ def register_ad_group_tools(mcp: FastMCP):
     # ============================================================================
 
     @mcp.tool()
-    def google_ads_bulk_update_ad_group_status(
+    async def google_ads_bulk_update_ad_group_status(
         customer_id: str,
         ad_group_ids: List[str],
         status: str
@@ -505,17 +566,16 @@ def register_ad_group_tools(mcp: FastMCP):
         """
         with performance_logger.track_operation('bulk_update_ad_group_status', customer_id=customer_id):
             try:
-                client = get_auth_manager().get_client()
-                ad_group_manager = AdGroupManager(client)
+                ad_group_manager = _get_ad_group_manager()
 
                 if not ad_group_ids:
                     return "⚠️ No ad group IDs provided."
 
                 status_upper = status.upper()
-                result = ad_group_manager.bulk_update_ad_group_status(
+                result = await ad_group_manager.bulk_update_ad_group_status_async(
                     customer_id,
                     ad_group_ids,
-                    AdGroupStatus[status_upper]
+                    _STATUS_LOOKUP[status_upper]
                 )
 
                 # Audit log
@@ -527,6 +587,7 @@ def register_ad_group_tools(mcp: FastMCP):
                     result="success",
                     details={
                         'ad_group_count': len(ad_group_ids),
+                        'failed_count': len(result['failed_ad_group_ids']),
                         'new_status': status_upper
                     }
                 )
@@ -534,12 +595,25 @@ def register_ad_group_tools(mcp: FastMCP):
                 # Invalidate cache
                 get_cache_manager().invalidate(customer_id, ResourceType.AD_GROUP)
 
-                output = f"✅ Bulk status update completed!\n\n"
-                output += f"**Ad Groups Updated**: {result['ad_groups_updated']}\n"
-                output += f"**New Status**: {status_upper}\n\n"
-                output += f"{result['message']}"
-
-                return output
+                lines = [
+                    "✅ Bulk status update completed!",
+                    "",
+                    f"**Ad Groups Updated**: {result['ad_groups_updated']}",
+                    f"**New Status**: {status_upper}",
+                ]
+
+                if result['failed_ad_group_ids']:
+                    lines.append(
+                        f"**Failed**: {', '.join(result['failed_ad_group_ids'])} "
+                        f"(first error: {result['failure_messages'][0]})"
+                    )
+
+                lines.extend([
+                    "",
+                    result['message'],
+                ])
+
+                return "\n".join(lines)
 
             except Exception as e:
                 error_msg = ErrorHandler.handle_error(e, context="bulk_update_ad_group_status")
@@ -21,6 +21,7 @@ from typing import List, Dict, Any, Optional
 from batch_operations_manager import BatchOperationsManager, BatchResult
 from auth_manager import get_auth_manager
 from error_handler import ErrorHandler
+from cache_manager import get_cache_manager, ResourceType
 from logger import get_logger, get_performance_logger, get_audit_logger
 import json
 
@@ -28,6 +29,16 @@ logger = get_logger(__name__)
 performance_logger = get_performance_logger()
 audit_logger = get_audit_logger()
 
+# Cache resource type per batch entity_type; unknown types clear the whole customer.
+_ENTITY_RESOURCE_TYPES = {
+    'campaign': ResourceType.CAMPAIGN,
+    'campaigns': ResourceType.CAMPAIGN,
+    'ad_group': ResourceType.AD_GROUP,
+    'keyword': ResourceType.KEYWORD,
+    'keywords': ResourceType.KEYWORD,
+    'ad': ResourceType.AD,
+}
+
 
 def register_batch_tools(mcp):
     """Register all batch operation MCP tools."""
@@ -96,6 +107,9 @@ def register_batch_tools(mcp):
                     status='success' if result.status.value != 'FAILED' else 'failed'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
+
                 # Format response
                 output = f"# 🚀 Batch Campaign Creation\n\n"
                 output += f"**Status**: {result.status.value}\n"
@@ -177,6 +191,9 @@ def register_batch_tools(mcp):
                     status='success' if result.status.value != 'FAILED' else 'failed'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.AD_GROUP)
+
                 output = f"# 🚀 Batch Ad Group Creation\n\n"
                 output += f"**Status**: {result.status.value}\n"
                 output += f"**Total**: {result.total} ad groups\n"
@@ -256,6 +273,9 @@ def register_batch_tools(mcp):
                     status='success' if result.status.value != 'FAILED' else 'failed'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.KEYWORD)
+
                 output = f"# 🚀 Batch Keyword Addition\n\n"
                 output += f"**Status**: {result.status.value}\n"
                 output += f"**Total**: {result.total} keywords\n"
@@ -335,6 +355,9 @@ def register_batch_tools(mcp):
                     status='success' if result.status.value != 'FAILED' else 'failed'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.AD)
+
                 output = f"# 🚀 Batch Ad Creation\n\n"
                 output += f"**Status**: {result.status.value}\n"
                 output += f"**Total**: {result.total} ads\n"
@@ -410,6 +433,9 @@ def register_batch_tools(mcp):
                     status='success'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
+
                 output = f"# 💰 Batch Budget Update\n\n"
                 output += f"**Status**: {result.status.value}\n"
                 output += f"**Total**: {result.total} campaigns\n"
@@ -496,6 +522,9 @@ def register_batch_tools(mcp):
                     status='success' if result.status.value != 'FAILED' else 'failed'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, _ENTITY_RESOURCE_TYPES.get(entity_type.lower()))
+
                 output = f"# 💵 Batch Bid Update ({entity_type.title()})\n\n"
                 output += f"**Status**: {result.status.value}\n"
                 output += f"**Total**: {result.total} {entity_type}s\n"
@@ -565,6 +594,9 @@ def register_batch_tools(mcp):
                     status='success'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
+
                 output = f"# ⏸️ Batch Campaign Pause\n\n"
                 output += f"**Total**: {result.total} campaigns\n"
                 output += f"**Paused**: {result.succeeded} ✅\n\n"
@@ -620,6 +652,9 @@ def register_batch_tools(mcp):
                     status='success'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
+
                 output = f"# ▶️ Batch Campaign Enable\n\n"
                 output += f"**Total**: {result.total} campaigns\n"
                 output += f"**Enabled**: {result.succeeded} ✅\n\n"
@@ -703,6 +738,9 @@ def register_batch_tools(mcp):
                     status='success' if result.status.value != 'FAILED' else 'failed'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, _ENTITY_RESOURCE_TYPES.get(entity_type.lower()))
+
                 output = f"# 🔄 Batch Status Change ({entity_type.title()})\n\n"
                 output += f"**Status**: {result.status.value}\n"
                 output += f"**Total**: {result.total} {entity_type}s\n"
@@ -821,6 +859,9 @@ def register_batch_tools(mcp):
                     status='success' if result.status.value != 'FAILED' else 'failed'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, _ENTITY_RESOURCE_TYPES.get(entity_type.lower()))
+
                 output = f"# 📥 CSV Import ({entity_type.title()})\n\n"
                 output += f"**Status**: {result.status.value}\n"
                 output += f"**Total**: {result.total} {entity_type}\n"
@@ -30,6 +30,7 @@ from conversion_manager import (
 )
 from auth_manager import get_auth_manager
 from error_handler import ErrorHandler
+from cache_manager import get_cache_manager, ResourceType
 from logger import performance_logger, audit_logger
 import json
 
@@ -126,6 +127,9 @@ def register_conversion_tools(mcp):
                     details={'name': conversion_name, 'category': category}
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CONVERSION)
+
                 output = f"✅ Conversion action created successfully!\n\n"
                 output += f"**Conversion ID**: {result['conversion_action_id']}\n"
                 output += f"**Name**: {result['name']}\n"
@@ -362,6 +366,9 @@ def register_conversion_tools(mcp):
                     details={'count': result['uploaded']}
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CONVERSION)
+
                 output = f"✅ Offline conversions uploaded!\n\n"
                 output += f"**Conversions Uploaded**: {result['uploaded']}\n"
                 output += f"**Conversions Processed**: {result['results']}\n\n"
@@ -442,6 +449,9 @@ def register_conversion_tools(mcp):
                     details={'count': result['uploaded']}
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CONVERSION)
+
                 output = f"✅ Call conversions uploaded!\n\n"
                 output += f"**Call Conversions Uploaded**: {result['uploaded']}\n"
                 output += f"**Conversions Processed**: {result['results']}\n\n"
@@ -586,6 +596,9 @@ def register_conversion_tools(mcp):
                     details={'model': attribution_model}
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CONVERSION)
+
                 output = f"✅ Attribution model updated!\n\n"
                 output += f"**Conversion ID**: {result['conversion_action_id']}\n"
                 output += f"**New Model**: {result['attribution_model']}\n\n"
@@ -747,6 +760,9 @@ def register_conversion_tools(mcp):
                     details={'fields': field_paths}
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CONVERSION)
+
                 return f"✅ Conversion action updated successfully!\n\nUpdated fields: {', '.join(field_paths)}"
 
             except Exception as e:
@@ -187,7 +187,8 @@ def register_insights_tools(mcp):
                 result = insights_manager.analyze_trends(
                     customer_id=customer_id,
                     campaign_id=campaign_id,
-                    lookback_days=lookback_days
+                    lookback_days=lookback_days,
+                    include_daily=True
                 )
 
                 if 'error' in result:
@@ -232,7 +233,7 @@ def register_insights_tools(mcp):
 
                     for anomaly in result['anomalies'][:5]:  # Top 5
                         output += f"- **{anomaly['date']}**: {anomaly['metric'].title()} = ${anomaly['value']:,.2f} "
-                        output += f"({anomaly['deviation']:.1f}σ from mean)\n"
+                        output += f"({anomaly['deviation']:.1f}σ from typical)\n"
 
                     output += "\n💡 Review these dates for campaign changes, external events, or data issues.\n\n"
                 else:
@@ -650,7 +651,7 @@ def register_insights_tools(mcp):
                 return f"❌ Failed to get auction insights: {error_msg}"
 
     @mcp.tool()
-    def google_ads_opportunity_finder(
+    async def google_ads_opportunity_finder(
         customer_id: str,
         opportunity_type: str = "ALL"
     ) -> str:
@@ -684,14 +685,22 @@ def register_insights_tools(mcp):
 
                 opportunities = []
 
-                # Budget opportunities
+                # Run the independent analyses concurrently
+                analyses = []
                 if opportunity_type in ["ALL", "BUDGET"]:
-                    budget_recs = insights_manager.get_budget_recommendations(
-                        customer_id=customer_id,
-                        date_range="LAST_30_DAYS"
-                    )
+                    analyses.append('budget_recommendations')
+                if opportunity_type in ["ALL", "WASTE"]:
+                    analyses.append('wasted_spend')
 
-                    for rec in budget_recs:
+                results = await insights_manager.gather_insights(
+                    customer_id=customer_id,
+                    analyses=analyses,
+                    date_range="LAST_30_DAYS"
+                )
+
+                # Budget opportunities
+                if 'budget_recommendations' in results:
+                    for rec in results['budget_recommendations']:
                         opportunities.append({
                             'type': 'BUDGET',
                             'priority': rec['priority'],
@@ -702,12 +711,8 @@ def register_insights_tools(mcp):
                         })
 
                 # Wasted spend opportunities
-                if opportunity_type in ["ALL", "WASTE"]:
-                    waste_analysis = insights_manager.analyze_wasted_spend(
-                        customer_id=customer_id,
-                        date_range="LAST_30_DAYS",
-                        min_cost=10.0
-                    )
+                if 'wasted_spend' in results:
+                    waste_analysis = results['wasted_spend']
 
                     if waste_analysis['total_wasted_spend'] > 0:
                         opportunities.append({
@@ -802,7 +807,8 @@ def register_insights_tools(mcp):
                 trend_data = insights_manager.analyze_trends(
                     customer_id=customer_id,
                     campaign_id=campaign_id,
-                    lookback_days=30
+                    lookback_days=30,
+                    include_daily=True
                 )
 
                 if 'error' in trend_data:
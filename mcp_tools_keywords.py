@@ -95,6 +95,8 @@ def register_keyword_tools(mcp: FastMCP):
 
                 output = f"✅ Keywords added successfully!\n\n"
                 output += f"**Keywords Added**: {result['keywords_added']}\n"
+                if result.get('failed_indexes'):
+                    output += f"**Failed**: {len(result['failed_indexes'])} (first error: {result['failure_messages'][0]})\n"
                 output += f"**Ad Group ID**: {ad_group_id}\n"
 
                 if cpc_bid:
@@ -164,7 +166,10 @@ def register_keyword_tools(mcp: FastMCP):
                 get_cache_manager().invalidate(customer_id, ResourceType.KEYWORD)
 
                 output = f"✅ Negative keywords added successfully!\n\n"
-                output += f"**Negative Keywords Added**: {result['negative_keywords_added']}\n\n"
+                output += f"**Negative Keywords Added**: {result['negative_keywords_added']}\n"
+                if result.get('failed_indexes'):
+                    output += f"**Failed**: {len(result['failed_indexes'])} (first error: {result['failure_messages'][0]})\n"
+                output += "\n"
 
                 output += "**Added Negative Keywords**:\n"
                 for kw in keywords[:10]:
@@ -345,27 +350,26 @@ def register_keyword_tools(mcp: FastMCP):
 
                 # Show top 20 by cost
                 for kw in keywords[:20]:
-                    output += f"## {kw['keyword_text']} ({kw['match_type']})\n"
-                    output += f"- **Status**: {kw['status']}\n"
-                    output += f"- **Campaign**: {kw['campaign']['name']}\n"
-                    output += f"- **Ad Group**: {kw['ad_group']['name']}\n"
+                    output += f"## {kw.keyword_text} ({kw.match_type})\n"
+                    output += f"- **Status**: {kw.status}\n"
+                    output += f"- **Campaign**: {kw.campaign_name}\n"
+                    output += f"- **Ad Group**: {kw.ad_group_name}\n"
 
-                    if kw['cpc_bid']:
-                        output += f"- **CPC Bid**: ${kw['cpc_bid']:.2f}\n"
+                    if kw.cpc_bid:
+                        output += f"- **CPC Bid**: ${kw.cpc_bid:.2f}\n"
 
-                    if kw['quality_score']:
-                        output += f"- **Quality Score**: {kw['quality_score']}/10\n"
+                    if kw.quality_score:
+                        output += f"- **Quality Score**: {kw.quality_score}/10\n"
 
-                    metrics = kw['metrics']
-                    output += f"- **Cost**: ${metrics['cost']:,.2f}\n"
-                    output += f"- **Clicks**: {metrics['clicks']:,}\n"
-                    output += f"- **Impressions**: {metrics['impressions']:,}\n"
-                    output += f"- **CTR**: {metrics['ctr']:.2f}%\n"
-                    output += f"- **Avg CPC**: ${metrics['average_cpc']:.2f}\n"
-                    output += f"- **Conversions**: {metrics['conversions']:.2f}\n"
+                    output += f"- **Cost**: ${kw.cost:,.2f}\n"
+                    output += f"- **Clicks**: {kw.clicks:,}\n"
+                    output += f"- **Impressions**: {kw.impressions:,}\n"
+                    output += f"- **CTR**: {kw.ctr:.2f}%\n"
+                    output += f"- **Avg CPC**: ${kw.average_cpc:.2f}\n"
+                    output += f"- **Conversions**: {kw.conversions:.2f}\n"
 
-                    if metrics['cost_per_conversion'] > 0:
-                        output += f"- **Cost/Conv**: ${metrics['cost_per_conversion']:.2f}\n"
+                    if kw.cost_per_conversion > 0:
+                        output += f"- **Cost/Conv**: ${kw.cost_per_conversion:.2f}\n"
 
                     output += "\n"
 
@@ -630,6 +634,8 @@ def register_keyword_tools(mcp: FastMCP):
 
                 output = f"✅ Bulk keywords added successfully!\n\n"
                 output += f"**Keywords Added**: {result['keywords_added']}\n"
+                if result.get('failed_indexes'):
+                    output += f"**Failed**: {len(result['failed_indexes'])} (first error: {result['failure_messages'][0]})\n"
                 output += f"**Match Type**: {match_type}\n"
 
                 if cpc_bid:
@@ -696,7 +702,10 @@ def register_keyword_tools(mcp: FastMCP):
                 get_cache_manager().invalidate(customer_id, ResourceType.KEYWORD)
 
                 output = f"✅ Bulk bid update completed!\n\n"
-                output += f"**Keywords Updated**: {result['keywords_updated']}\n\n"
+                output += f"**Keywords Updated**: {result['keywords_updated']}\n"
+                if result.get('failed_indexes'):
+                    output += f"**Failed**: {len(result['failed_indexes'])} (first error: {result['failure_messages'][0]})\n"
+                output += "\n"
                 output += f"{result['message']}"
 
                 return output
@@ -25,6 +25,7 @@ from local_app_manager import (
 )
 from auth_manager import get_auth_manager
 from error_handler import ErrorHandler
+from cache_manager import get_cache_manager, ResourceType
 from logger import get_logger, get_performance_logger, get_audit_logger
 
 if TYPE_CHECKING:
@@ -35,6 +36,21 @@ performance_logger = get_performance_logger()
 audit_logger = get_audit_logger()
 
 
+def _report_metadata(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a report's NamedTuple rows to dicts for the JSON metadata.
+
+    Args:
+        result: Report returned by a LocalAppManager getter
+
+    Returns:
+        The report with 'campaigns' rows as field-name dicts
+    """
+    campaigns = result.get('campaigns')
+    if not isinstance(campaigns, list):
+        return result
+    return {**result, 'campaigns': [row.to_dict() for row in campaigns]}
+
+
 def register_local_app_tools(mcp: "Server") -> None:
     """Register all local and app campaign MCP tools.
 
@@ -141,6 +157,9 @@ def register_local_app_tools(mcp: "Server") -> None:
                     response=result
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
+
                 # Format response
                 response = f"""
 ## Local Campaign Created Successfully
@@ -265,16 +284,16 @@ No local campaigns found for customer ID `{customer_id}` in the {date_range} per
                     campaign_lines = []
                     for camp in result['campaigns']:
                         campaign_lines.append(f"""
-### {camp['campaign_name']} (ID: {camp['campaign_id']})
+### {camp.campaign_name} (ID: {camp.campaign_id})
 
 **Performance Metrics:**
-- Impressions: {camp['impressions']:,}
-- Clicks: {camp['clicks']:,}
-- CTR: {camp['ctr']:.2%}
-- Cost: ${camp['cost']:.2f}
-- Conversions: {camp['conversions']:.1f}
-- Conversion Value: ${camp['conversion_value']:.2f}
-- View-Through Conversions: {camp['view_through_conversions']:.1f}
+- Impressions: {camp.impressions:,}
+- Clicks: {camp.clicks:,}
+- CTR: {camp.ctr:.2%}
+- Cost: ${camp.cost:.2f}
+- Conversions: {camp.conversions:.1f}
+- Conversion Value: ${camp.conversion_value:.2f}
+- View-Through Conversions: {camp.view_through_conversions:.1f}
 """)
 
                     response = f"""
@@ -290,7 +309,7 @@ No local campaigns found for customer ID `{customer_id}` in the {date_range} per
 
                 return {
                     "content": [{"type": "text", "text": response.strip()}],
-                    "metadata": result
+                    "metadata": _report_metadata(result)
                 }
 
         except Exception as e:
@@ -396,11 +415,11 @@ No store visit conversions found for customer ID `{customer_id}` in the {date_ra
                     campaign_lines = []
                     for camp in result['campaigns']:
                         campaign_lines.append(f"""
-### {camp['campaign_name']} (ID: {camp['campaign_id']})
+### {camp.campaign_name} (ID: {camp.campaign_id})
 
-**Conversion Action:** {camp['conversion_action']}
-- Store Visits: {camp['store_visits']:.1f}
-- Value: ${camp['value']:.2f}
+**Conversion Action:** {camp.conversion_action}
+- Store Visits: {camp.store_visits:.1f}
+- Value: ${camp.value:.2f}
 """)
 
                     response = f"""
@@ -420,7 +439,7 @@ users who saw or clicked your ads.
 
                 return {
                     "content": [{"type": "text", "text": response.strip()}],
-                    "metadata": result
+                    "metadata": _report_metadata(result)
                 }
 
         except Exception as e:
@@ -554,6 +573,9 @@ users who saw or clicked your ads.
                     response=result
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
+
                 # Format response
                 response = f"""
 ## App Campaign Created Successfully
@@ -692,20 +714,20 @@ No app campaigns found for customer ID `{customer_id}` in the {date_range} perio
                     campaign_lines = []
                     for camp in result['campaigns']:
                         campaign_lines.append(f"""
-### {camp['campaign_name']} (ID: {camp['campaign_id']})
+### {camp.campaign_name} (ID: {camp.campaign_id})
 
 **App Details:**
-- App ID: {camp['app_id']}
-- App Store: {camp['app_store']}
+- App ID: {camp.app_id}
+- App Store: {camp.app_store}
 
 **Performance Metrics:**
-- Impressions: {camp['impressions']:,}
-- Clicks: {camp['clicks']:,}
-- CTR: {camp['ctr']:.2%}
-- Cost: ${camp['cost']:.2f}
-- Conversions: {camp['conversions']:.1f}
-- Conversion Value: ${camp['conversion_value']:.2f}
-- Cost per Conversion: ${camp['cost_per_conversion']:.2f}
+- Impressions: {camp.impressions:,}
+- Clicks: {camp.clicks:,}
+- CTR: {camp.ctr:.2%}
+- Cost: ${camp.cost:.2f}
+- Conversions: {camp.conversions:.1f}
+- Conversion Value: ${camp.conversion_value:.2f}
+- Cost per Conversion: ${camp.cost_per_conversion:.2f}
 """)
 
                     response = f"""
@@ -721,7 +743,7 @@ No app campaigns found for customer ID `{customer_id}` in the {date_range} perio
 
                 return {
                     "content": [{"type": "text", "text": response.strip()}],
-                    "metadata": result
+                    "metadata": _report_metadata(result)
                 }
 
         except Exception as e:
@@ -26,6 +26,7 @@ from shopping_pmax_manager import (
 )
 from auth_manager import get_auth_manager
 from error_handler import ErrorHandler
+from cache_manager import get_cache_manager, ResourceType
 from logger import get_logger, get_performance_logger, get_audit_logger
 import json
 
@@ -105,6 +106,9 @@ def register_shopping_pmax_tools(mcp):
                     status='success'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
+
                 output = f"# 🛍️ Shopping Campaign Created\n\n"
                 output += f"**Campaign Name**: {result['campaign_name']}\n"
                 output += f"**Campaign ID**: {result['campaign_id']}\n"
@@ -184,6 +188,9 @@ def register_shopping_pmax_tools(mcp):
                     status='success'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.AD_GROUP)
+
                 output = f"# 📦 Product Group Created\n\n"
                 output += f"**Ad Group ID**: {result['ad_group_id']}\n"
                 output += f"**Criterion ID**: {result['criterion_id']}\n"
@@ -423,6 +430,9 @@ def register_shopping_pmax_tools(mcp):
                     status='success'
                 )
 
+                # Invalidate cache
+                get_cache_manager().invalidate(customer_id, ResourceType.CAMPAIGN)
+
                 output = f"# 🚀 Performance Max Campaign Created\n\n"
                 output += f"**Campaign Name**: {result['campaign_name']}\n"
                 output += f"**Campaign ID**: {result['campaign_id']}\n"
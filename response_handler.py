@@ -10,11 +10,19 @@ Response processing with:
 """
 
 import asyncio
+import json
 import logging
 from typing import AsyncIterator, List, Dict, Any, Optional, Callable
 from dataclasses import dataclass
 from google.ads.googleads.client import GoogleAdsClient
 
+# Try to import orjson for faster JSON serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -199,6 +207,23 @@ class ResponseStream:
 class ResponseFormatter:
     """Formats API responses for different output types."""
 
+    @staticmethod
+    def to_json(data: Any) -> str:
+        """
+        Format data as indented JSON.
+
+        Uses orjson when installed, falling back to the standard library.
+
+        Args:
+            data: JSON-serializable data
+
+        Returns:
+            JSON formatted string
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(data, indent=2)
+
     @staticmethod
     def to_markdown(
         data: List[Dict[str, Any]],